@@ -1,18 +1,23 @@
 # app.py
 
+import time
+_inicio_importacoes = time.perf_counter()
+import os
+
+# Startup profiling (--profile-startup or REACTLAB_PROFILE), created first so the imports below are measured
+from startup_profiler import criar_perfil_inicializacao, PerfilInicializacao
+perfil_inicializacao = criar_perfil_inicializacao(caminho_padrao=os.path.join(
+    os.getenv('LOCALAPPDATA', os.path.expanduser('~\\AppData\\Local')), "ReactLab", "startup_profile.json"))
+_fase_importacoes = perfil_inicializacao.iniciar_fase("importacoes")
+
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
 from tkinter import filedialog
 import threading
-import time
 import logging
 import random  # For temperature simulation
-from PIL import Image
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-import os
 import getpass
 from logging.handlers import TimedRotatingFileHandler
 import sys  # For sys.exit()
@@ -20,14 +25,19 @@ import ctypes
 from ctypes import wintypes
 
 # Importing modules from the project
-from measurement import Medicao
+from measurement import Medicao, DetectorPlato, DURACOES_ANALISE, INTERVALOS_REGISTRO, calcular_tempos_registro
 from data_exporter import ExportadorDados
 from temperature_logger import TemperatureLogger, SimulatedTemperatureLogger
 from serial_handler import ManipuladorPortaSerial
 from utils import formatar_tempo
-from main import identificar_termopares_ativos
 from localization import Localizer
-import win32com.client as win32  # For interacting with Outlook
+from lazy_imports import importar_tardio, registrar_tempo_importacao, relatorio_importacoes
+
+# Heavy modules are imported on first use: matplotlib when the graph is created, pandas/xlsxwriter
+# on the first export (data_exporter), win32com on the first support request and main (rich) on
+# the first thermocouple check.
+registrar_tempo_importacao("app (startup imports)", time.perf_counter() - _inicio_importacoes)
+perfil_inicializacao.encerrar_fase(_fase_importacoes)
 
 # Definição das fontes padrão
 FONTE_PADRAO = ("Roboto", 14)
@@ -76,12 +86,19 @@ class ReactLabApp(ctk.CTk):
     Main class for the ReactLab application.
     Manages the GUI, user interactions, and integration with measurement logic.
     """
-    def __init__(self):
+    def __init__(self, perfil=None):
+        # Startup profile, inactive unless enabled on the command line or by environment variable
+        perfil = perfil if perfil is not None else PerfilInicializacao()
+        fase_janela = perfil.iniciar_fase("janela")
         super().__init__()
+        self.perfil = perfil
+        # Chosen once per platform by a cached startup benchmark, see ctk.set_drawing_method() to overwrite it
+        logger.debug(f"Drawing method: {ctk.DrawMethodSelector.get_report()}")
         self.title("ReactLab - Analisador de Reatividade")
         
         # Load Custom Light Blue Theme before configuring the window
-        self.carregar_tema_personalizado("blue-light")
+        with self.perfil.fase("tema"):
+            self.carregar_tema_personalizado("blue-light")
         
         # Maximize the window
         try:
@@ -98,6 +115,7 @@ class ReactLabApp(ctk.CTk):
         
         # Update to ensure winfo_screenwidth and winfo_screenheight return correct values
         self.update_idletasks()
+        self.perfil.encerrar_fase(fase_janela)
         
         # Initialize Localizer
         self.localizer = Localizer(default_language="pt")
@@ -108,6 +126,7 @@ class ReactLabApp(ctk.CTk):
         self.intervalo_selecionado = ctk.StringVar(value="30 segundos")
         self.analise_duracao_selected = ctk.StringVar(value="30 segundos")  # Analysis duration variable
         self.simulacao_ativa = False  # Simulation flag
+        self.parada_automatica = tk.BooleanVar(value=False)  # Stop early when the plateau is detected
 
         # Active Thermocouples
         self.termopares_ativos = []
@@ -127,18 +146,36 @@ class ReactLabApp(ctk.CTk):
         self.export_to_desktop = tk.BooleanVar(value=False)  # Default is False
 
         # Initialize Interface
-        self.create_menu()
-        self.create_sidebar_left()
-        self.create_sidebar_right()
-        self.create_main_frame()
-        self.create_bottom_frame()
+        with self.perfil.fase("menu"):
+            self.create_menu()
+        with self.perfil.fase("barra_lateral_esquerda"):
+            self.create_sidebar_left()
+        with self.perfil.fase("barra_lateral_direita"):
+            self.create_sidebar_right()
+        with self.perfil.fase("area_principal"):
+            self.create_main_frame()
+        with self.perfil.fase("barra_inferior"):
+            self.create_bottom_frame()
 
         # Load Logos
-        self.load_logos()
+        with self.perfil.fase("logos"):
+            self.load_logos()
 
         # Protocol to close the application
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Profiling marks: first paint once the event loop is idle, first measurement on the first GUI update
+        self.inicio_medicao = None
+        self.after_idle(self.registrar_primeira_pintura)
+
+    def registrar_primeira_pintura(self):
+        """
+        Records the first paint of the main window in the startup profile.
+        """
+        if self.perfil.ativo:
+            self.update_idletasks()
+            self.perfil.marcar("primeira_pintura")
+
     def carregar_tema_personalizado(self, tema_nome):
         """
         Loads a custom theme from a JSON file.
@@ -163,122 +200,84 @@ class ReactLabApp(ctk.CTk):
 
         # File Menu
         self.file_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label=self.localizer.translate("file_menu"), menu=self.file_menu)
-        self.file_menu.add_command(label=self.localizer.translate("reset_fields"), command=self.resetar_campos)
-        self.file_menu.add_command(label=self.localizer.translate("export_data"), command=self.exportar_dados)
-        self.file_menu.add_checkbutton(label=self.localizer.translate("export_to_desktop"), variable=self.export_to_desktop)
+        self.add_translated_menu_item(self.menu_bar, "cascade", "file_menu", menu=self.file_menu)
+        self.add_translated_menu_item(self.file_menu, "command", "reset_fields", command=self.resetar_campos)
+        self.add_translated_menu_item(self.file_menu, "command", "export_data", command=self.exportar_dados)
+        self.add_translated_menu_item(self.file_menu, "checkbutton", "export_to_desktop", variable=self.export_to_desktop)
         self.file_menu.add_separator()
-        self.file_menu.add_command(label=self.localizer.translate("exit"), command=self.on_closing)
+        self.add_translated_menu_item(self.file_menu, "command", "exit", command=self.on_closing)
 
         # Debug Menu
         self.debug_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label=self.localizer.translate("debug_menu"), menu=self.debug_menu)
-        self.debug_menu.add_checkbutton(label=self.localizer.translate("activate_simulation"), command=self.toggle_simulacao)
-        self.debug_menu.add_command(label=self.localizer.translate("recheck_thermocouples"), command=self.rechecar_termopares)
+        self.add_translated_menu_item(self.menu_bar, "cascade", "debug_menu", menu=self.debug_menu)
+        self.add_translated_menu_item(self.debug_menu, "checkbutton", "activate_simulation", command=self.toggle_simulacao)
+        self.add_translated_menu_item(self.debug_menu, "command", "recheck_thermocouples", command=self.rechecar_termopares)
 
         # Help Menu
         self.help_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label=self.localizer.translate("help_menu"), menu=self.help_menu)
-        self.help_menu.add_command(label=self.localizer.translate("about"), command=self.mostrar_sobre)
-        self.help_menu.add_command(label=self.localizer.translate("support"), command=self.abrir_suporte)
+        self.add_translated_menu_item(self.menu_bar, "cascade", "help_menu", menu=self.help_menu)
+        self.add_translated_menu_item(self.help_menu, "command", "about", command=self.mostrar_sobre)
+        self.add_translated_menu_item(self.help_menu, "command", "support", command=self.abrir_suporte)
 
         # Language Menu
         self.language_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label=self.localizer.translate("language_menu"), menu=self.language_menu)
+        self.add_translated_menu_item(self.menu_bar, "cascade", "language_menu", menu=self.language_menu)
         for lang_code, lang_name in [("en", "English"), ("pt", "Português"), ("fr", "Français")]:
             self.language_menu.add_radiobutton(label=lang_name, variable=self.language_selected, value=lang_code,
                                             command=self.change_language)
 
+    def add_translated_menu_item(self, menu, item_type, key, **options):
+        """
+        Adds a menu item whose label follows the language, menus can't bind to text variables.
+        """
+        menu.add(item_type, label=self.localizer.translate(key), **options)
+        index = menu.index("end")
+        self.localizer.bind(lambda: menu.entryconfigure(index, label=self.localizer.translate(key)), key)
+
     def change_language(self):
         """
         Changes the application's language.
+        Widgets, menus, table headings and the graph are bound to the Localizer,
+        so only the texts whose translation changed get updated.
         """
         selected_language = self.language_selected.get()
         try:
-            self.localizer.set_language(selected_language)
-            # Rebuild the menu bar
-            self.rebuild_menu()
-            self.update_texts()
-            logger.info(f"Language changed to: {selected_language}")
+            chaves_alteradas = self.localizer.set_language(selected_language)
+            logger.info(f"Language changed to: {selected_language} ({len(chaves_alteradas)} texts changed)")
+            logger.debug(f"Live tracker registrations: scaling={ctk.ScalingTracker.get_live_registrations()}, "
+                         f"appearance={ctk.AppearanceModeTracker.get_live_registrations()}, "
+                         f"fonts={ctk.ScaledFontCache.get_font_count()}")
         except ValueError as e:
             messagebox.showerror(self.localizer.translate("error"), str(e))
             logger.error(f"Error changing language: {e}")
-            
-    
-    def rebuild_menu(self):
+
+    def bind_radio_group_texts(self, radio_group, keys):
         """
-        Rebuilds the menu bar with the new language settings.
+        Keeps the texts of a radio group translated, in the order of its options.
         """
-        # Remove the existing menu bar
-        self.menu_bar.destroy()
-        # Recreate the menu bar
-        self.create_menu()
-
+        self.localizer.bind(lambda: self.update_radio_group_texts(radio_group, [self.localizer.translate(key) for key in keys]), *keys)
 
-    def update_texts(self):
+    def definir_status(self, chave, sufixo=""):
         """
-        Updates all texts in the application based on the selected language.
+        Shows the translated status, which stays translated after a language change.
         """
-        # Update other widgets
-        self.nome_programa_label.configure(text=self.localizer.translate("app_name"))
-        self.btn_check.configure(text=self.localizer.translate("check_thermocouples"))
-        self.btn_iniciar.configure(text=self.localizer.translate("start_analysis"))
-        self.btn_resetar.configure(text=self.localizer.translate("reset_fields"))
-        self.btn_exportar.configure(text=self.localizer.translate("export_data"))
-        self.delta_label_sidebar.configure(text=f"{self.localizer.translate('delta_t')}: N/A")
-        self.status_label.configure(text=f"{self.localizer.translate('status')}: {self.localizer.translate('waiting')}")
-        self.btn_interromper.configure(text=self.localizer.translate("interrupt_analysis"))
-
-        # Update labels in sidebars, main frame, etc.
-        # Left Sidebar labels
-        self.rotulo_analise.configure(text=self.localizer.translate("analysis_options"))
-
-        # Right Sidebar labels
-        self.rotulo_planta.configure(text=self.localizer.translate("plant_selection"))
-        self.rotulo_intervalo.configure(text=self.localizer.translate("record_interval"))
-        self.rotulo_duracao.configure(text=self.localizer.translate("analysis_duration"))
-        self.rotulo_id.configure(text=self.localizer.translate("sample_ids"))
-
-        for termopar, label in self.sample_id_labels.items():
-            label.configure(text=f"{self.localizer.translate('id')} {termopar}:")
-
-        # Update Radio Buttons
-        self.update_radio_buttons()
-
-        # Update real-time temperature labels
-        for termopar, label in self.temp_labels.items():
-            label.configure(text=f"{termopar}: 0.00°C")
-
-        # Update graph labels
-        self.update_graph_labels()
-
-        # Update table headings
-        self.update_table_headings()
-
-    def update_radio_buttons(self):
-        # Update plant radio buttons
-        plant_texts = [self.localizer.translate("plant_sjl"), self.localizer.translate("plant_mtz"), self.localizer.translate("plant_vitoria")]
-        for radio, text in zip(self.plant_radiobuttons, plant_texts):
-            radio.configure(text=text)
+        self.status_texto.set_template(f"{{status}}: {{{chave}}}{sufixo}")
 
-        # Update interval radio buttons
-        interval_texts = [self.localizer.translate("30_seconds"), self.localizer.translate("1_minute")]
-        for radio, text in zip(self.interval_radiobuttons, interval_texts):
-            radio.configure(text=text)
-
-        # Update duration radio buttons
-        duration_texts = [self.localizer.translate("30_seconds"), self.localizer.translate("2_minutes"), self.localizer.translate("3_minutes"),
-                        self.localizer.translate("5_minutes"), self.localizer.translate("10_minutes"), self.localizer.translate("20_minutes"),
-                        self.localizer.translate("30_minutes"), self.localizer.translate("35_minutes")]
-        for radio, text in zip(self.duration_radiobuttons, duration_texts):
-            radio.configure(text=text)
+    @staticmethod
+    def update_radio_group_texts(radio_group, texts):
+        """
+        Replaces the texts of a radio group, keeping the values of its options.
+        """
+        valores = [valor for _, valor in radio_group.cget("values")]
+        radio_group.configure(values=list(zip(texts, valores)))
 
     def update_graph_labels(self):
+        if self.ax is None:
+            return  # the graph gets created with the current language by garantir_grafico()
         self.ax.set_title(self.localizer.translate("graph_title"), fontsize=16)
         self.ax.set_xlabel(self.localizer.translate("time_seconds"), fontsize=12)
         self.ax.set_ylabel(self.localizer.translate("temperature_celsius"), fontsize=12)
-        self.ax.legend(fontsize=10)
-        self.canvas_grafico.draw()
+        self.canvas_grafico.draw_idle()  # one redraw, even if several graph texts changed
 
     def update_table_headings(self):
             self.table.heading("Tempo", text=self.localizer.translate("time"))
@@ -309,6 +308,7 @@ class ReactLabApp(ctk.CTk):
         Opens a new email in Outlook to send an email to support, attaching the log file.
         """
         try:
+            win32 = importar_tardio("win32com.client")  # For interacting with Outlook
             outlook = win32.Dispatch('outlook.application')
             mail = outlook.CreateItem(0)
             mail.To = 'vinicius.alves@lhoist.com' 
@@ -343,9 +343,8 @@ class ReactLabApp(ctk.CTk):
         company_logo_path = os.path.join(assets_path, "lhoist_logo.png") 
         if os.path.exists(company_logo_path):
             try:
-                company_logo_image = Image.open(company_logo_path)
-                company_logo_image = company_logo_image.resize((150, 75), Image.LANCZOS if hasattr(Image, 'LANCZOS') else Image.ANTIALIAS)
-                self.company_logo = ctk.CTkImage(light_image=company_logo_image, dark_image=company_logo_image, size=(150, 75))
+                # Decoded and resized (LANCZOS) only once per DPI scale, then loaded from the image disk cache
+                self.company_logo = ctk.CTkImage(light_image_path=company_logo_path, size=(150, 75))
                 self.company_logo_label = ctk.CTkLabel(self.sidebar_right, image=self.company_logo, text="")
                 self.company_logo_label.pack(pady=10)
             except Exception as e:
@@ -374,9 +373,7 @@ class ReactLabApp(ctk.CTk):
         logo_path = os.path.join(assets_path, "logo.png")
         if os.path.exists(logo_path):
             try:
-                logo_image = Image.open(logo_path)
-                logo_image = logo_image.resize((100, 100), Image.LANCZOS if hasattr(Image, 'LANCZOS') else Image.ANTIALIAS)
-                self.logo = ctk.CTkImage(light_image=logo_image, dark_image=logo_image, size=(100, 100))
+                self.logo = ctk.CTkImage(light_image_path=logo_path, size=(100, 100))
                 self.logo_label = ctk.CTkLabel(logo_nome_frame, image=self.logo, text="")
                 self.logo_label.pack(pady=(0, 5))
             except Exception as e:
@@ -389,7 +386,7 @@ class ReactLabApp(ctk.CTk):
             self.logo_label.pack(pady=(0, 5))
 
         # Program Name
-        self.nome_programa_label = ctk.CTkLabel(logo_nome_frame, text=self.localizer.translate("app_name"), font=("Roboto", 16, "bold"))
+        self.nome_programa_label = ctk.CTkLabel(logo_nome_frame, textvariable=self.localizer.text_variable("{app_name}"), font=("Roboto", 16, "bold"))
         self.nome_programa_label.pack()
 
        # Analysis Section
@@ -397,20 +394,25 @@ class ReactLabApp(ctk.CTk):
         self.analise_frame.pack(pady=10, padx=10, fill="x")
 
         # Label for Analysis
-        self.rotulo_analise = ctk.CTkLabel(self.analise_frame, text=self.localizer.translate("analysis_options"), font=FONTE_SUBTITULO)
+        self.rotulo_analise = ctk.CTkLabel(self.analise_frame, textvariable=self.localizer.text_variable("{analysis_options}"), font=FONTE_SUBTITULO)
         self.rotulo_analise.pack(pady=(0, 5), padx=10, anchor="w")
 
 
         # Button Check for Thermocouples
-        self.btn_check = ctk.CTkButton(self.analise_frame, text=self.localizer.translate("check_thermocouples"), command=self.verificar_termopares, font=FONTE_PADRAO)
+        self.btn_check = ctk.CTkButton(self.analise_frame, textvariable=self.localizer.text_variable("{check_thermocouples}"), command=self.verificar_termopares, font=FONTE_PADRAO)
         self.btn_check.pack(pady=5, padx=10, fill="x")
 
+        # Checkbox for early stop on plateau detection
+        self.chk_parada_automatica = ctk.CTkCheckBox(self.analise_frame, textvariable=self.localizer.text_variable("{auto_stop_plateau}"), variable=self.parada_automatica, font=FONTE_PADRAO)
+        self.chk_parada_automatica.pack(pady=5, padx=10, anchor="w")
+
         # Space for Delta T after analysis
-        self.delta_label_sidebar = ctk.CTkLabel(self.sidebar_left, text=f"{self.localizer.translate('delta_t')}: N/A", font=FONTE_SUBTITULO)
+        self.delta_texto = self.localizer.text_variable("{delta_t}: N/A")
+        self.delta_label_sidebar = ctk.CTkLabel(self.sidebar_left, textvariable=self.delta_texto, font=FONTE_SUBTITULO)
         self.delta_label_sidebar.pack(pady=10, padx=20)
 
         # Visual separation line
-        separator = ctk.CTkFrame(self.sidebar_left, height=2, fg_color="#D1D9E0")
+        separator = ctk.CTkFrame(self.sidebar_left, height=2, corner_radius=0, fg_color="#D1D9E0")
         separator.pack(pady=10, padx=20, fill="x")
 
         # Control Buttons
@@ -418,15 +420,15 @@ class ReactLabApp(ctk.CTk):
         controle_frame.pack(pady=10, padx=10, fill="x")
 
         # Button to Start Analysis (always enabled)
-        self.btn_iniciar = ctk.CTkButton(controle_frame, text=self.localizer.translate("start_analysis"), command=self.iniciar_analise, font=FONTE_PADRAO)
+        self.btn_iniciar = ctk.CTkButton(controle_frame, textvariable=self.localizer.text_variable("{start_analysis}"), command=self.iniciar_analise, font=FONTE_PADRAO)
         self.btn_iniciar.pack(pady=5, padx=10, fill="x")
 
         # Button to Reset Fields
-        self.btn_resetar = ctk.CTkButton(controle_frame, text=self.localizer.translate("reset_fields"), command=self.resetar_campos, font=FONTE_PADRAO)
+        self.btn_resetar = ctk.CTkButton(controle_frame, textvariable=self.localizer.text_variable("{reset_fields}"), command=self.resetar_campos, font=FONTE_PADRAO)
         self.btn_resetar.pack(pady=5, padx=10, fill="x")
 
         # Button to Export to Excel (always enabled)
-        self.btn_exportar = ctk.CTkButton(controle_frame, text=self.localizer.translate("export_data"), command=self.exportar_dados, font=FONTE_PADRAO)
+        self.btn_exportar = ctk.CTkButton(controle_frame, textvariable=self.localizer.text_variable("{export_data}"), command=self.exportar_dados, font=FONTE_PADRAO)
         self.btn_exportar.pack(pady=5, padx=10, fill="x")
 
     def create_sidebar_right(self):
@@ -445,46 +447,41 @@ class ReactLabApp(ctk.CTk):
         grupo_planta.pack(pady=10, padx=10, fill="x")
 
         # Label for plant group
-        self.rotulo_planta = ctk.CTkLabel(grupo_planta, text=self.localizer.translate("plant_selection"), font=FONTE_SUBTITULO)
+        self.rotulo_planta = ctk.CTkLabel(grupo_planta, textvariable=self.localizer.text_variable("{plant_selection}"), font=FONTE_SUBTITULO)
         self.rotulo_planta.pack(pady=(0, 5), padx=10, anchor="w")
 
-        # Plant Selection Radio Buttons
-        self.plant_radiobuttons = []
+        # Plant Selection Radio Buttons (all options drawn on one canvas)
         plantas = [self.localizer.translate("plant_sjl"), self.localizer.translate("plant_mtz"), self.localizer.translate("plant_vitoria")]
-        for planta in plantas:
-            radio = ctk.CTkRadioButton(grupo_planta, text=planta, variable=self.planta_selecionada, value=planta, font=FONTE_PADRAO, command=self.verificar_selecao)
-            radio.pack(anchor="w", pady=2, padx=10)
-            self.plant_radiobuttons.append(radio)
+        self.plant_radiogroup = ctk.CTkRadioGroup(grupo_planta, values=plantas, variable=self.planta_selecionada, font=FONTE_PADRAO, command=self.verificar_selecao)
+        self.plant_radiogroup.pack(anchor="w", pady=2, padx=10)
+        self.bind_radio_group_texts(self.plant_radiogroup, ["plant_sjl", "plant_mtz", "plant_vitoria"])
 
         # Interval Selection Group Frame
         grupo_intervalo = ctk.CTkFrame(painel_direito, corner_radius=6)
         grupo_intervalo.pack(pady=10, padx=10, fill="x")
 
         # Label for interval group
-        self.rotulo_intervalo = ctk.CTkLabel(grupo_intervalo, text=self.localizer.translate("record_interval"), font=FONTE_SUBTITULO)
+        self.rotulo_intervalo = ctk.CTkLabel(grupo_intervalo, textvariable=self.localizer.text_variable("{record_interval}"), font=FONTE_SUBTITULO)
         self.rotulo_intervalo.pack(pady=(0, 5), padx=10, anchor="w")
 
         # Interval Radio Buttons
-        self.interval_radiobuttons = []
         intervalos = [
             (self.localizer.translate("30_seconds"), "30 segundos"),
             (self.localizer.translate("1_minute"), "1 minuto")
         ]
-        for texto, valor in intervalos:
-            radio = ctk.CTkRadioButton(grupo_intervalo, text=texto, variable=self.intervalo_selecionado, value=valor, font=FONTE_PADRAO, command=self.verificar_selecao)
-            radio.pack(anchor="w", pady=2, padx=10)
-            self.interval_radiobuttons.append(radio)
+        self.interval_radiogroup = ctk.CTkRadioGroup(grupo_intervalo, values=intervalos, variable=self.intervalo_selecionado, font=FONTE_PADRAO, command=self.verificar_selecao)
+        self.interval_radiogroup.pack(anchor="w", pady=2, padx=10)
+        self.bind_radio_group_texts(self.interval_radiogroup, ["30_seconds", "1_minute"])
 
         # Analysis Duration Selection Group Frame
         grupo_duracao = ctk.CTkFrame(painel_direito, corner_radius=6)
         grupo_duracao.pack(pady=10, padx=10, fill="x")
 
         # Label for duration group
-        self.rotulo_duracao = ctk.CTkLabel(grupo_duracao, text=self.localizer.translate("analysis_duration"), font=FONTE_SUBTITULO)
+        self.rotulo_duracao = ctk.CTkLabel(grupo_duracao, textvariable=self.localizer.text_variable("{analysis_duration}"), font=FONTE_SUBTITULO)
         self.rotulo_duracao.pack(pady=(0, 5), padx=10, anchor="w")
 
         # Duration Radio Buttons
-        self.duration_radiobuttons = []
         duracoes = [
             (self.localizer.translate("30_seconds"), "30 segundos"),
             (self.localizer.translate("2_minutes"), "2 minutos"),
@@ -495,17 +492,17 @@ class ReactLabApp(ctk.CTk):
             (self.localizer.translate("30_minutes"), "30 minutos"),
             (self.localizer.translate("35_minutes"), "35 minutos")
         ]
-        for texto, valor in duracoes:
-            radio = ctk.CTkRadioButton(grupo_duracao, text=texto, variable=self.analise_duracao_selected, value=valor, font=FONTE_PADRAO, command=self.verificar_selecao)
-            radio.pack(anchor="w", pady=2, padx=10)
-            self.duration_radiobuttons.append(radio)
+        self.duration_radiogroup = ctk.CTkRadioGroup(grupo_duracao, values=duracoes, variable=self.analise_duracao_selected, font=FONTE_PADRAO, command=self.verificar_selecao)
+        self.duration_radiogroup.pack(anchor="w", pady=2, padx=10)
+        self.bind_radio_group_texts(self.duration_radiogroup, ["30_seconds", "2_minutes", "3_minutes", "5_minutes",
+                                                               "10_minutes", "20_minutes", "30_minutes", "35_minutes"])
 
         # Sample ID Entry Fields
     
         campos_id_frame = ctk.CTkFrame(painel_direito, corner_radius=6)
         campos_id_frame.pack(pady=20, padx=10, fill="x")
 
-        self.rotulo_id = ctk.CTkLabel(campos_id_frame, text=self.localizer.translate("sample_ids"), font=FONTE_SUBTITULO)
+        self.rotulo_id = ctk.CTkLabel(campos_id_frame, textvariable=self.localizer.text_variable("{sample_ids}"), font=FONTE_SUBTITULO)
         self.rotulo_id.pack(pady=(0, 5), padx=10, anchor="w")
 
         self.sample_id_labels = {}
@@ -513,7 +510,7 @@ class ReactLabApp(ctk.CTk):
             frame = ctk.CTkFrame(campos_id_frame, corner_radius=6)
             frame.pack(pady=2, padx=10, fill="x")
             
-            label = ctk.CTkLabel(frame, text=f"{self.localizer.translate('id')} {termopar}:", font=FONTE_PADRAO)
+            label = ctk.CTkLabel(frame, textvariable=self.localizer.text_variable(f"{{id}} {termopar}:"), font=FONTE_PADRAO)
             label.pack(side="left", padx=5, pady=5)
             self.sample_id_labels[termopar] = label
 
@@ -526,11 +523,13 @@ class ReactLabApp(ctk.CTk):
         """
         Creates the main frame divided into visualization area.
         """
-        main_frame = ctk.CTkFrame(self, corner_radius=6)
+        # main_frame is completely covered by area_visualizacao, so it stays transparent (flat, without canvas)
+        main_frame = ctk.CTkFrame(self, fg_color="transparent")
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Visualization Area
-        area_visualizacao = ctk.CTkFrame(main_frame, corner_radius=6)
+        area_visualizacao = ctk.CTkFrame(main_frame, corner_radius=6,
+                                         fg_color=ctk.ThemeManager.theme["CTkFrame"]["top_fg_color"])
         area_visualizacao.pack(fill="both", expand=True)
 
         # Use grid layout to control the placement of panels
@@ -554,27 +553,15 @@ class ReactLabApp(ctk.CTk):
         Creates the graph panel with real-time temperatures.
         Includes a Matplotlib graph and display of each thermocouple's temperatures.
         """
-        # Time vs Temperature Graph
-        self.fig, self.ax = plt.subplots(figsize=(6, 4))
-        self.ax.set_title("Curva de Reatividade da Amostra", fontsize=16)
-        self.ax.set_xlabel("Tempo (s)", fontsize=12)
-        self.ax.set_ylabel("Temperatura (°C)", fontsize=12)
-        self.ax.set_xlim(0, 300)  # Dynamically adjust
-        self.ax.set_ylim(20, 100)  # Adjust as needed
-
-        # Define colors for the graph lines
-        cores = ["#e6194b", "#3cb44b", "#ffe119", "#4363d8"]  # Example colors
-
+        # Time vs Temperature Graph, created by garantir_grafico() after the window is shown
+        self.fig = None
+        self.ax = None
+        self.canvas_grafico = None
         self.lines = {}
-        for i, termopar in enumerate(["T1", "T2", "T3", "T4"]):
-            line, = self.ax.plot([], [], label=f"{termopar} (°C)", color=cores[i % len(cores)], linewidth=2)
-            self.lines[termopar] = line
-        self.ax.legend(fontsize=10)
-
-        # Graph Canvas
-        self.canvas_grafico = FigureCanvasTkAgg(self.fig, master=self.painel_grafico)
-        self.canvas_grafico.draw()
-        self.canvas_grafico.get_tk_widget().pack(pady=10, padx=10, fill="both", expand=True)
+        self.area_grafico = ctk.CTkFrame(self.painel_grafico, fg_color="transparent")
+        self.area_grafico.pack(pady=10, padx=10, fill="both", expand=True)
+        self.after_idle(self.garantir_grafico)
+        self.localizer.bind(self.update_graph_labels, "graph_title", "time_seconds", "temperature_celsius")
 
         # Space to show real-time temperatures (Changed to Grid)
         self.temp_labels = {}
@@ -593,6 +580,45 @@ class ReactLabApp(ctk.CTk):
         temp_frame.columnconfigure(0, weight=1)
         temp_frame.columnconfigure(1, weight=1)
 
+    def garantir_grafico(self):
+        """
+        Creates the Matplotlib graph on first use, importing matplotlib only at that moment.
+        """
+        if self.canvas_grafico is not None:
+            return
+        with self.perfil.fase("grafico"):
+            Figure = importar_tardio("matplotlib.figure").Figure
+            FigureCanvasTkAgg = importar_tardio("matplotlib.backends.backend_tkagg").FigureCanvasTkAgg
+
+            self.fig = Figure(figsize=(6, 4))
+            self.ax = self.fig.add_subplot()
+            self.configurar_eixos_grafico()
+
+            # Graph Canvas
+            self.canvas_grafico = FigureCanvasTkAgg(self.fig, master=self.area_grafico)
+            self.canvas_grafico.draw()
+            self.canvas_grafico.get_tk_widget().pack(fill="both", expand=True)
+        logger.info(f"Import times (ms): {relatorio_importacoes()}")
+
+    def configurar_eixos_grafico(self):
+        """
+        Sets titles, limits and one empty line per thermocouple on the graph axes.
+        """
+        self.ax.set_title(self.localizer.translate("graph_title"), fontsize=16)
+        self.ax.set_xlabel(self.localizer.translate("time_seconds"), fontsize=12)
+        self.ax.set_ylabel(self.localizer.translate("temperature_celsius"), fontsize=12)
+        self.ax.set_xlim(0, 300)  # Dynamically adjust
+        self.ax.set_ylim(20, 100)  # Adjust as needed
+
+        # Define colors for the graph lines
+        cores = ["#e6194b", "#3cb44b", "#ffe119", "#4363d8"]  # Example colors
+
+        self.lines = {}
+        for i, termopar in enumerate(["T1", "T2", "T3", "T4"]):
+            line, = self.ax.plot([], [], label=f"{termopar} (°C)", color=cores[i % len(cores)], linewidth=2)
+            self.lines[termopar] = line
+        self.ax.legend(fontsize=10)
+
     def create_painel_tabela(self):
         """
         Creates the table panel that will be filled as the analysis progresses.
@@ -605,6 +631,7 @@ class ReactLabApp(ctk.CTk):
         self.table.heading("T2", text="T2 (°C)")
         self.table.heading("T3", text="T3 (°C)")
         self.table.heading("T4", text="T4 (°C)")
+        self.localizer.bind(self.update_table_headings, "time", "temperature_celsius")
 
         # Set column widths
         self.table.column("Tempo", width=80, anchor="center")
@@ -633,13 +660,18 @@ class ReactLabApp(ctk.CTk):
         # Do not pack here
 
         # Status Label
-        self.status_label = ctk.CTkLabel(self.bottom_frame, text=f"{self.localizer.translate('status')}: {self.localizer.translate('waiting')}", font=FONTE_PADRAO)
+        self.status_texto = self.localizer.text_variable("{status}: {waiting}")
+        self.status_label = ctk.CTkLabel(self.bottom_frame, textvariable=self.status_texto, font=FONTE_PADRAO)
         self.status_label.pack(side="left", padx=20)
 
+        # Channel Health Label (frame rate / stale channels during the analysis)
+        self.health_label = ctk.CTkLabel(self.bottom_frame, text="", font=FONTE_PADRAO)
+        self.health_label.pack(side="left", padx=20)
+
         # Button to Interrupt Analysis (Initially Hidden)
         self.btn_interromper = ctk.CTkButton(
             self.bottom_frame,
-            text=self.localizer.translate("interrupt_analysis"),
+            textvariable=self.localizer.text_variable("{interrupt_analysis}"),
             command=self.interromper_analise,
             fg_color="#FF4D4D",
             hover_color="#FF6666",
@@ -674,7 +706,7 @@ class ReactLabApp(ctk.CTk):
                 return
 
             canal_para_termopar = {"41": "T1", "42": "T2", "43": "T3", "44": "T4"}
-            self.termopares_ativos = identificar_termopares_ativos(manipulador_serial, canal_para_termopar)
+            self.termopares_ativos = importar_tardio("main").identificar_termopares_ativos(manipulador_serial, canal_para_termopar)
             manipulador_serial.fechar()
 
             if not self.termopares_ativos:
@@ -748,7 +780,7 @@ class ReactLabApp(ctk.CTk):
                 manipulador_serial = ManipuladorPortaSerial("COM12")  # Replace "COM12" with the correct port
                 if not manipulador_serial.abrir():
                     messagebox.showerror(self.localizer.translate("error"), self.localizer.translate("cannot_open_serial_port"))
-                    self.status_label.configure(text=f"{self.localizer.translate('status')}: {self.localizer.translate('waiting')}")
+                    self.definir_status("waiting")
                     return
                 canal_para_termopar = {"41": "T1", "42": "T2", "43": "T3", "44": "T4"}
                 temperature_logger_instance = TemperatureLogger(manipulador_serial, self.termopares_ativos, canal_para_termopar)
@@ -763,7 +795,7 @@ class ReactLabApp(ctk.CTk):
             if resposta:
                 logger.info("Usuário confirmou o início da medição.")
                 self.analise_em_andamento = True
-                self.status_label.configure(text=f"{self.localizer.translate('status')}: {self.localizer.translate('analyzing')}...")
+                self.definir_status("analyzing", "...")
 
                 # Reset graphs and tables before starting
                 self.resetar_grafico()
@@ -789,163 +821,105 @@ class ReactLabApp(ctk.CTk):
         """
         # Reset previous data
         self.dados = []
+        self.inicio_medicao = time.perf_counter()
         # Reset graph and table before starting
         self.resetar_grafico()
         self.resetar_tabela()
 
         # Define measurement duration based on selection
-        duracao = self.analise_duracao_selected.get()
-        if duracao == "30 segundos":
-            tempo_total = 30
-        elif duracao == "2 minutos":
-            tempo_total = 120
-        elif duracao == "3 minutos":
-            tempo_total = 180
-        elif duracao == "5 minutos":
-            tempo_total = 300
-        elif duracao == "10 minutos":
-            tempo_total = 600
-        elif duracao == "20 minutos":
-            tempo_total = 1200
-        elif duracao == "30 minutos":
-            tempo_total = 1800
-        elif duracao == "35 minutos":
-            tempo_total = 2100
-        else:
-            # If no match, set default values
-            tempo_total = 30
-
+        tempo_total = DURACOES_ANALISE.get(self.analise_duracao_selected.get(), 30)
         self.tempo_total = tempo_total  # Store total time for progress bar use
 
-        # Get the recording interval
-        intervalo = self.intervalo_selecionado.get()
-        if intervalo == "30 segundos":
-            intervalo_segundos = 30
-        elif intervalo == "1 minuto":
-            intervalo_segundos = 60
-        else:
-            intervalo_segundos = 30  # Default value
-
-        # Calculate all recording times
-        log_times = []
-        current_time = 0
-        while current_time <= tempo_total:
-            log_times.append(current_time)
-            current_time += intervalo_segundos
-
-        # Ensure tempo_total is included
-        if log_times[-1] != tempo_total:
-            log_times.append(tempo_total)
-
-        # Sort and remove duplicates
-        tempos_registro = sorted(list(set(log_times)))
+        # Get the recording interval and calculate all recording times
+        intervalo_segundos = INTERVALOS_REGISTRO.get(self.intervalo_selecionado.get(), 30)
+        tempos_registro = calcular_tempos_registro(tempo_total, intervalo_segundos)
 
         # Set the mode name
         nome_modo = "Simulação" if self.simulacao_ativa else "Real"
 
+        # Optional early stop when the reactivity curve reaches its plateau
+        condicoes_parada = [DetectorPlato()] if self.parada_automatica.get() else []
+
         # Instantiate Medicao with all required arguments
         self.medicao = Medicao(
             temperature_logger_instance,
             codigos_amostras,
             tempos_registro,
             tempo_total,
-            nome_modo
+            nome_modo,
+            condicoes_parada=condicoes_parada
         )
+        # Share the measurement series with the graph, table and exporter
+        self.dados = self.medicao.dados
+        self.medicao.adicionar_callback_tick(self.on_tick_medicao)
 
         # Start the measurement thread
-        self.thread_medicao = threading.Thread(target=self.run_medicao, args=(tempo_total, tempos_registro))
+        self.thread_medicao = threading.Thread(target=self.run_medicao)
         self.thread_medicao.daemon = True  # Allows the thread to be terminated with the application
         self.thread_medicao.start()
 
-    def run_medicao(self, tempo_total, log_times):
-        try:
-            start_time = time.time()
-            last_update_time = -1
-
-            # Capture initial temperatures at time 0
-            temperaturas_iniciais = self.medicao.obter_temperaturas()
-            self.dados.append((0, temperaturas_iniciais.copy()))
-            self.after(0, self.atualizar_gui, 0, temperaturas_iniciais)
-
-            while True:
-                if not self.analise_em_andamento:
-                    break
-
-                elapsed_time = int(time.time() - start_time)
-
-                # Update temperatures every second
-                if elapsed_time != last_update_time:
-                    last_update_time = elapsed_time
-                    temperaturas = self.medicao.obter_temperaturas()
-                    # Schedule GUI update
-                    self.after(0, self.atualizar_gui, elapsed_time, temperaturas)
-                    # Append data for plotting
-                    self.dados.append((elapsed_time, temperaturas.copy()))
-
-                # Record temperatures at specified intervals
-                if elapsed_time in log_times:
-                    # Log the temperature
-                    temperaturas = self.medicao.obter_temperaturas()
-                    logger.info(f"Temperature record at {formatar_tempo(elapsed_time)}: {temperaturas}")
-
-                if elapsed_time >= tempo_total:
-                    break
+    def on_tick_medicao(self, tempo, temperaturas):
+        """
+        Called by the measurement engine once per second; schedules the GUI update.
+        """
+        if tempo in self.medicao.tempos_registro:
+            logger.info(f"Temperature record at {formatar_tempo(tempo)}: {temperaturas}")
+        self.after(0, self.atualizar_gui, tempo, temperaturas)
 
-                time.sleep(0.1)
+    def run_medicao(self):
+        try:
+            self.medicao.run()
+            if self.medicao.interrompido:
+                return
 
             # Finish the measurement
             self.delta_t = self.calcular_delta_t()
             self.after(0, self.atualizar_delta_t_sidebar, self.delta_t)
-            self.after(0, self.status_label.configure, {'text': f"{self.localizer.translate('status')}: {self.localizer.translate('completed')}"})
-            self.after(0, lambda: messagebox.showinfo(self.localizer.translate("measurement"), self.localizer.translate("measurement_completed_successfully")))
-            logger.info("Measurement completed successfully.")
+            if self.medicao.motivo_parada == DetectorPlato.motivo:
+                self.after(0, self.progress_bar.set, 1)
+                self.after(0, self.definir_status, "completed_plateau")
+                self.after(0, lambda: messagebox.showinfo(self.localizer.translate("measurement"), self.localizer.translate("measurement_completed_plateau")))
+                logger.info(f"Measurement completed early at plateau ({self.medicao.tempos[-1]:.0f}s).")
+            else:
+                self.after(0, self.definir_status, "completed")
+                self.after(0, lambda: messagebox.showinfo(self.localizer.translate("measurement"), self.localizer.translate("measurement_completed_successfully")))
+                logger.info("Measurement completed successfully.")
         except Exception as e:
             logger.error(f"Error during measurement: {e}")
             self.after(0, lambda: messagebox.showerror(self.localizer.translate("error"), f"{self.localizer.translate('error_during_measurement')}\n{e}"))
-            self.after(0, self.status_label.configure, {'text': f"{self.localizer.translate('status')}: {self.localizer.translate('measurement_error')}"})
+            self.after(0, self.definir_status, "measurement_error")
         finally:
             self.analise_em_andamento = False
             # Stop the TemperatureLogger
-            if self.simulacao_ativa and hasattr(self, 'temp_logger_simulado'):
-                self.temp_logger_simulado.parar()
-            elif hasattr(self.medicao, 'temp_logger'):
-                self.medicao.temp_logger.parar()
-                if hasattr(self.medicao.temp_logger, 'manipulador_serial'):
-                    self.medicao.temp_logger.manipulador_serial.fechar()
+            self.parar_medicao()
             # Hide the progress bar and interrupt button
             self.after(0, self.progress_bar.pack_forget)
             self.after(0, self.btn_interromper.pack_forget)
             # Enable the start and export buttons
-            self.after(0, self.status_label.configure, {'text': f"{self.localizer.translate('status')}: {self.localizer.translate('waiting')}"})
+            self.after(0, self.definir_status, "waiting")
+
+    def parar_medicao(self):
+        """
+        Stops the measurement engine, its temperature logger and closes the serial port.
+        """
+        if not hasattr(self, 'medicao'):
+            return
+        self.medicao.parar()
+        if hasattr(self.medicao.temp_logger, 'manipulador_serial'):
+            self.medicao.temp_logger.manipulador_serial.fechar()
 
     def atualizar_delta_t_sidebar(self, delta_t):
         """
         Updates the Delta T label in the left sidebar.
         """
-        self.delta_label_sidebar.configure(text=f"{self.localizer.translate('delta_t')}: {delta_t:.2f} °C")
+        self.delta_texto.set_template(f"{{delta_t}}: {delta_t:.2f} °C")
 
     def calcular_delta_t(self):
         """
         Calculates Delta T based on collected data.
         """
-        if self.dados:
-            delta_ts = []
-            for termopar in self.termopares_ativos:
-                temperaturas = []
-                for _, temps in self.dados:
-                    temp = temps.get(termopar)
-                    if temp is not None:
-                        try:
-                            temperaturas.append(float(temp))
-                        except ValueError:
-                            pass
-                if temperaturas:
-                    delta_t = temperaturas[-1] - temperaturas[0]
-                    delta_ts.append(delta_t)
-            if delta_ts:
-                # Calcula a média dos Delta Ts de todos os termopares ativos
-                delta_t_medio = sum(delta_ts) / len(delta_ts)
-                return round(delta_t_medio, 2)
+        if hasattr(self, 'medicao') and self.dados:
+            return self.medicao.calcular_delta_t(self.termopares_ativos)
         return 0.0
 
     def get_desktop_path(self):
@@ -970,19 +944,14 @@ class ReactLabApp(ctk.CTk):
                 return
 
             # Obter o intervalo de registro em segundos
-            intervalo = self.intervalo_selecionado.get()
-            if intervalo == "30 segundos":
-                intervalo_segundos = 30
-            elif intervalo == "1 minuto":
-                intervalo_segundos = 60
-            else:
-                intervalo_segundos = 30  # Valor padrão
+            intervalo_segundos = INTERVALOS_REGISTRO.get(self.intervalo_selecionado.get(), 30)
 
             # Prepare sample IDs as plain strings
             codigos_amostras = {tp: var.get().strip() for tp, var in self.codigos_amostras_vars.items()}
 
             # Initialize ExportadorDados
-            exportador = ExportadorDados(self.dados, codigos_amostras, intervalo_segundos, self.planta_selecionada.get(), tipo_analise="comum")
+            saude_canais = self.medicao.saude_canais if hasattr(self, 'medicao') else None
+            exportador = ExportadorDados(self.dados, codigos_amostras, intervalo_segundos, self.planta_selecionada.get(), tipo_analise="comum", saude_canais=saude_canais)
 
             if self.export_to_desktop.get():
                 # Obter o caminho da área de trabalho de forma confiável
@@ -1015,8 +984,9 @@ class ReactLabApp(ctk.CTk):
         self.intervalo_selecionado.set("30 segundos")
         self.analise_duracao_selected.set("30 segundos")
         self.progress_bar.set(0)
-        self.status_label.configure(text=f"{self.localizer.translate('status')}: {self.localizer.translate('waiting')}")
-        self.delta_label_sidebar.configure(text=f"{self.localizer.translate('delta_t')}: N/A")
+        self.definir_status("waiting")
+        self.delta_texto.set_template("{delta_t}: N/A")
+        self.health_label.configure(text="")
 
         # Hide the progress bar and interrupt button if visible
         self.progress_bar.pack_forget()
@@ -1054,17 +1024,12 @@ class ReactLabApp(ctk.CTk):
             resposta = messagebox.askyesno(self.localizer.translate("interrupt_analysis"), self.localizer.translate("confirm_interrupt_analysis"))
             if resposta:
                 self.analise_em_andamento = False
-                if self.simulacao_ativa and hasattr(self, 'temp_logger_simulado'):
-                    self.temp_logger_simulado.parar()
-                elif hasattr(self.medicao, 'temp_logger'):
-                    self.medicao.temp_logger.parar()
-                    if hasattr(self.medicao.temp_logger, 'manipulador_serial'):
-                        self.medicao.temp_logger.manipulador_serial.fechar()
+                self.parar_medicao()
                 logger.info("Análise interrompida pelo usuário.")
                 messagebox.showinfo(self.localizer.translate("interrupt_analysis"), self.localizer.translate("analysis_interrupted_by_user"))
                 # Reset progress bar and status
                 self.progress_bar.set(0)
-                self.status_label.configure(text=f"{self.localizer.translate('status')}: {self.localizer.translate('analysis_interrupted')}")
+                self.definir_status("analysis_interrupted")
                 # Hide the progress bar and interrupt button
                 self.progress_bar.pack_forget()
                 self.btn_interromper.pack_forget()
@@ -1080,11 +1045,15 @@ class ReactLabApp(ctk.CTk):
             temp = temperaturas.get(termopar, 0.0)
             try:
                 temp_float = float(temp)
+                self.temp_labels[termopar].configure(text=f"{termopar}: {temp_float:.2f}°C")
             except (ValueError, TypeError):
-                temp_float = 0.0
-            self.temp_labels[termopar].configure(text=f"{termopar}: {temp_float:.2f}°C")
+                self.temp_labels[termopar].configure(text=f"{termopar}: OFF")
+
+        # Update Channel Health
+        self.atualizar_saude_canais(self.medicao.obter_saude())
 
         # Update Graph
+        self.garantir_grafico()
         tempos = [d[0] for d in self.dados]
         for termopar in self.termopares_ativos:
             temps = []
@@ -1093,7 +1062,7 @@ class ReactLabApp(ctk.CTk):
                 try:
                     temp_float = float(temp)
                 except (ValueError, TypeError):
-                    temp_float = 0.0
+                    temp_float = float("nan")  # Leaves a gap while the channel is not reporting
                 temps.append(temp_float)
             self.lines[termopar].set_data(tempos, temps)
         self.ax.set_xlim(0, max(self.tempo_total, max(tempos) + 10))
@@ -1118,22 +1087,34 @@ class ReactLabApp(ctk.CTk):
             temp_values.append(temp_str)
         self.table.insert("", "end", values=(tempo_str, *temp_values))
 
+        self.perfil.marcar("primeira_medicao", self.inicio_medicao)
+        self.perfil.desinstalar()  # startup profile complete, stop measuring imports
+
+    def atualizar_saude_canais(self, saude):
+        """
+        Shows the frame rate of each active thermocouple and flags the ones that stopped reporting.
+        """
+        partes = []
+        for termopar in self.termopares_ativos:
+            estado = saude.get(termopar)
+            if not estado:
+                continue
+            if estado["obsoleto"]:
+                partes.append(f"{termopar}: {self.localizer.translate('no_signal')}")
+            else:
+                partes.append(f"{termopar}: {estado['taxa_quadros_hz']:.1f} Hz")
+        texto = f"{self.localizer.translate('channels')}: {' | '.join(partes)}" if partes else ""
+        self.health_label.configure(text=texto)
+
     def resetar_grafico(self):
         """
         Resets the graph to an empty state.
         """
+        if self.canvas_grafico is None:
+            self.garantir_grafico()  # A new graph is already empty
+            return
         self.ax.cla()
-        self.ax.set_title("Curva de Reatividade da Amostra", fontsize=16)
-        self.ax.set_xlabel("Tempo (s)", fontsize=12)
-        self.ax.set_ylabel("Temperatura (°C)", fontsize=12)
-        self.ax.set_xlim(0, 300)
-        self.ax.set_ylim(20, 100)
-        self.lines = {}
-        cores = ["#e6194b", "#3cb44b", "#ffe119", "#4363d8"]
-        for i, termopar in enumerate(["T1", "T2", "T3", "T4"]):
-            line, = self.ax.plot([], [], label=f"{termopar} (°C)", color=cores[i % len(cores)], linewidth=2)
-            self.lines[termopar] = line
-        self.ax.legend(fontsize=10)
+        self.configurar_eixos_grafico()
         self.canvas_grafico.draw()
 
     def resetar_tabela(self):
@@ -1152,12 +1133,7 @@ class ReactLabApp(ctk.CTk):
             resposta = messagebox.askyesno(self.localizer.translate("exit"), self.localizer.translate("exit_confirmation_analysis"))
             if resposta:
                 self.analise_em_andamento = False
-                if self.simulacao_ativa and hasattr(self, 'temp_logger_simulado'):
-                    self.temp_logger_simulado.parar()
-                elif hasattr(self.medicao, 'temp_logger'):
-                    self.medicao.temp_logger.parar()
-                    if hasattr(self.medicao.temp_logger, 'manipulador_serial'):
-                        self.medicao.temp_logger.manipulador_serial.fechar()
+                self.parar_medicao()
                 self.destroy()
             else:
                 return
@@ -1175,5 +1151,5 @@ if __name__ == "__main__":
     if not os.path.exists(tema_path):
         messagebox.showerror("Erro", "Arquivo de tema 'blue-light.json' não encontrado na pasta 'themes'.")
     else:
-        app = ReactLabApp()
+        app = ReactLabApp(perfil=perfil_inicializacao)
         app.mainloop()
@@ -0,0 +1,41 @@
+# benchmarks/bench_appearance_switch.py
+"""
+Mede o tempo de troca entre os modos claro e escuro com a janela completa do ReactLabApp.
+
+A troca é feita em lote pelo AppearanceModeTracker: todos os widgets recebem o novo modo,
+cada um é redesenhado uma única vez e `update_idletasks` é chamado uma vez no final. O tempo
+de cada troca é lido de `AppearanceModeTracker.last_switch_duration`.
+
+Uso: python benchmarks/bench_appearance_switch.py [repeticoes]
+(requer um display)
+"""
+
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import customtkinter as ctk
+from app import ReactLabApp
+
+
+def main(repeticoes=20):
+    ctk.set_appearance_mode("light")
+    app = ReactLabApp()
+    app.update()
+
+    tempos = []
+    for i in range(repeticoes):
+        ctk.set_appearance_mode("dark" if i % 2 == 0 else "light")
+        tempos.append(ctk.AppearanceModeTracker.last_switch_duration)
+
+    registros = ctk.AppearanceModeTracker.get_live_registrations()
+    print(f"Widgets registrados: {registros['callbacks']}")
+    print(f"Troca de modo ({repeticoes}x): mediana {statistics.median(tempos) * 1000:.1f} ms, "
+          f"máximo {max(tempos) * 1000:.1f} ms")
+    app.destroy()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
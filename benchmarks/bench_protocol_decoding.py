@@ -0,0 +1,59 @@
+# benchmarks/bench_protocol_decoding.py
+"""
+Micro-benchmark do custo por quadro da decodificação do termômetro.
+
+Compara o caminho antigo (decode para str, regex em str, temperatura formatada como
+"87.3 °C" e depois split + float() no TemperatureLogger) com o driver atual, que
+decodifica os bytes diretamente em floats.
+
+Uso: python benchmarks/bench_protocol_decoding.py
+"""
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from protocol_drivers import DriverTermometroASCII, CANAL_PARA_TERMOPAR_PADRAO
+
+# Um bloco típico lido da serial: uma leitura por canal
+QUADRO = b"41000000000873\r\n42000000000251\r\n43000000000655\r\n44000000000312\r\n"
+TERMOPARES = list(CANAL_PARA_TERMOPAR_PADRAO.values())
+
+
+def decodificar_antigo(dados_brutos, canal_para_termopar):
+    """Reprodução do caminho anterior: utils.extrair_temperaturas + conversão em TemperatureLogger.run."""
+    dados = dados_brutos.decode('utf-8', errors='ignore').strip()
+    termopares_novos = {}
+    for match in re.findall(r'(\d{10,14})', dados):
+        if len(match) == 14:
+            canal = match[:2]
+            temperatura_bruta = match[-3:]
+            temperatura = int(temperatura_bruta[:-1]) + (int(temperatura_bruta[-1]) / 10.0)
+            if canal in canal_para_termopar:
+                termopares_novos[canal_para_termopar[canal]] = f"{temperatura:.1f} °C"
+    resultado = {}
+    for termopar in TERMOPARES:
+        if termopar in termopares_novos:
+            resultado[termopar] = float(termopares_novos[termopar].split()[0])
+    return resultado
+
+
+def main(repeticoes=200000):
+    driver = DriverTermometroASCII(CANAL_PARA_TERMOPAR_PADRAO)
+    assert decodificar_antigo(QUADRO, CANAL_PARA_TERMOPAR_PADRAO) == driver.decodificar(QUADRO)
+
+    antes = min(timeit.repeat(lambda: decodificar_antigo(QUADRO, CANAL_PARA_TERMOPAR_PADRAO),
+                              number=repeticoes, repeat=5)) / repeticoes
+    depois = min(timeit.repeat(lambda: driver.decodificar(QUADRO), number=repeticoes, repeat=5)) / repeticoes
+
+    print(f"Quadro de {len(QUADRO)} bytes, {len(TERMOPARES)} canais")
+    print(f"Antes (str + formatação + float): {antes * 1e6:.2f} µs/quadro")
+    print(f"Depois (bytes -> float):          {depois * 1e6:.2f} µs/quadro")
+    print(f"Ganho: {antes / depois:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# channel_health.py
+
+import threading
+import time
+
+
+class SaudeCanal:
+    """Estatísticas de recepção de um termopar."""
+
+    def __init__(self):
+        self.ultimo_visto = None  # Timestamp (time.time()) da última leitura válida
+        self.leituras = 0
+        self.erros = 0
+        self.intervalo_medio = None  # Média exponencial do intervalo entre leituras (s)
+        self.obsoleto_desde = None  # Timestamp da última leitura antes de o canal ficar obsoleto
+
+    def taxa_quadros(self):
+        """Retorna a taxa de leituras em Hz, ou 0.0 se ainda não houver estimativa."""
+        if not self.intervalo_medio:
+            return 0.0
+        return 1.0 / self.intervalo_medio
+
+    def taxa_erros(self):
+        """Fração de quadros com erro de interpretação para este canal."""
+        total = self.leituras + self.erros
+        return self.erros / total if total else 0.0
+
+
+class MonitorSaudeCanais:
+    """
+    Acompanha a saúde de cada termopar durante a leitura: último instante visto, taxa de
+    leituras, taxa de erros de interpretação e se o valor está obsoleto (sem leituras
+    há mais de `tempo_limite_obsoleto` segundos). Atualizado pela thread de leitura e
+    consultado pela interface e pela medição.
+    """
+
+    SUAVIZACAO = 0.2  # Peso da amostra mais recente na média do intervalo
+
+    def __init__(self, termopares, tempo_limite_obsoleto=5.0, relogio=time.time):
+        self.tempo_limite_obsoleto = tempo_limite_obsoleto
+        self.relogio = relogio
+        self.inicio = relogio()
+        self.canais = {tp: SaudeCanal() for tp in termopares}
+        self.quadros = 0
+        self.quadros_invalidos = 0
+        self._lock = threading.Lock()
+
+    def registrar_quadro(self, valido=True):
+        """Conta um bloco de dados recebido do dispositivo."""
+        with self._lock:
+            self.quadros += 1
+            if not valido:
+                self.quadros_invalidos += 1
+
+    def registrar_leitura(self, termopar, agora=None):
+        """Registra uma leitura válida do termopar."""
+        agora = self.relogio() if agora is None else agora
+        with self._lock:
+            canal = self.canais.setdefault(termopar, SaudeCanal())
+            if canal.ultimo_visto is not None:
+                intervalo = max(agora - canal.ultimo_visto, 0.0)
+                if canal.intervalo_medio is None:
+                    canal.intervalo_medio = intervalo
+                else:
+                    canal.intervalo_medio += self.SUAVIZACAO * (intervalo - canal.intervalo_medio)
+            canal.ultimo_visto = agora
+            canal.leituras += 1
+            canal.obsoleto_desde = None
+
+    def registrar_erro(self, termopar):
+        """Registra um erro de interpretação atribuído ao termopar."""
+        with self._lock:
+            self.canais.setdefault(termopar, SaudeCanal()).erros += 1
+
+    def esta_obsoleto(self, termopar, agora=None):
+        """Indica se o termopar não envia leituras há mais que o limite configurado."""
+        agora = self.relogio() if agora is None else agora
+        with self._lock:
+            return self._esta_obsoleto(termopar, agora)
+
+    def _esta_obsoleto(self, termopar, agora):
+        """Como esta_obsoleto(), mas deve ser chamado com self._lock adquirido."""
+        canal = self.canais.get(termopar)
+        if canal is None:
+            return True
+        referencia = canal.ultimo_visto if canal.ultimo_visto is not None else self.inicio
+        obsoleto = agora - referencia > self.tempo_limite_obsoleto
+        if obsoleto and canal.obsoleto_desde is None:
+            canal.obsoleto_desde = referencia
+        return obsoleto
+
+    def resumo(self, agora=None):
+        """Retorna um dicionário serializável com o estado de cada termopar."""
+        agora = self.relogio() if agora is None else agora
+        with self._lock:
+            resultado = {}
+            for tp, canal in self.canais.items():
+                resultado[tp] = {
+                    "ultimo_visto": canal.ultimo_visto,
+                    "segundos_sem_dados": round(agora - canal.ultimo_visto, 1) if canal.ultimo_visto is not None else None,
+                    "leituras": canal.leituras,
+                    "erros": canal.erros,
+                    "taxa_quadros_hz": round(canal.taxa_quadros(), 2),
+                    "taxa_erros": round(canal.taxa_erros(), 3),
+                    "obsoleto": self._esta_obsoleto(tp, agora),
+                    "obsoleto_desde": canal.obsoleto_desde,
+                }
+            return resultado
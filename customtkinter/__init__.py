@@ -8,10 +8,10 @@ import tkinter.filedialog as filedialog
 
 # import manager classes
 from .windows.widgets.appearance_mode import AppearanceModeTracker
-from .windows.widgets.font import FontManager
+from .windows.widgets.font import FontManager, ScaledFontCache
 from .windows.widgets.scaling import ScalingTracker
 from .windows.widgets.theme import ThemeManager
-from .windows.widgets.core_rendering import DrawEngine
+from .windows.widgets.core_rendering import DrawEngine, DrawMethodSelector
 
 # import base widgets
 from .windows.widgets.core_rendering import CTkCanvas
@@ -27,6 +27,7 @@ from .windows.widgets import CTkLabel
 from .windows.widgets import CTkOptionMenu
 from .windows.widgets import CTkProgressBar
 from .windows.widgets import CTkRadioButton
+from .windows.widgets import CTkRadioGroup
 from .windows.widgets import CTkScrollbar
 from .windows.widgets import CTkSegmentedButton
 from .windows.widgets import CTkSlider
@@ -84,5 +85,10 @@ def deactivate_automatic_dpi_awareness():
     ScalingTracker.deactivate_automatic_dpi_awareness = True
 
 
+def set_drawing_method(drawing_method: str):
+    """ overwrite the automatic selection of the drawing method: polygon_shapes, font_shapes, circle_shapes or None for automatic """
+    DrawMethodSelector.set_overwrite_method(drawing_method)
+
+
 def set_ctk_parent_class(ctk_parent_class):
     ctk_tk.CTK_PARENT_CLASS = ctk_parent_class
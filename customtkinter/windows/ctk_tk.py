@@ -9,8 +9,11 @@ from packaging import version
 from .widgets.theme import ThemeManager
 from .widgets.scaling import CTkScalingBaseClass
 from .widgets.appearance_mode import CTkAppearanceModeBaseClass
+from .widgets.font import ScaledFontCache
+from .widgets.core_rendering import DrawMethodSelector
 
 from customtkinter.windows.widgets.utility.utility_functions import pop_from_dict_by_set, check_kwargs_empty
+from customtkinter.windows.widgets.utility.master_color_cache import MasterColorCache
 
 CTK_PARENT_CLASS = tkinter.Tk
 
@@ -42,6 +45,8 @@ class CTk(CTK_PARENT_CLASS, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
         CTkScalingBaseClass.__init__(self, scaling_type="window")
         check_kwargs_empty(kwargs, raise_error=True)
 
+        DrawMethodSelector.select(self)  # only measured once, before the first widget gets drawn
+
         self._current_width = 600  # initial window size, independent of scaling
         self._current_height = 500
         self._min_width: int = 0
@@ -77,8 +82,8 @@ class CTk(CTK_PARENT_CLASS, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
         if sys.platform.startswith("win"):
             self._windows_set_titlebar_color(self._get_appearance_mode())
 
-        self.bind('<Configure>', self._update_dimensions_event)
-        self.bind('<FocusIn>', self._focus_in_event)
+        self.bind('<Configure>', self._update_dimensions_event, add="+")
+        self.bind('<FocusIn>', self._focus_in_event, add="+")
 
     def destroy(self):
         self._disable_macos_dark_title_bar()
@@ -87,6 +92,7 @@ class CTk(CTK_PARENT_CLASS, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
         tkinter.Tk.destroy(self)
         CTkAppearanceModeBaseClass.destroy(self)
         CTkScalingBaseClass.destroy(self)
+        ScaledFontCache.remove_root(self)
 
     def _focus_in_event(self, event):
         # sometimes window looses jumps back on macOS if window is selected from Mission Control, so has to be lifted again
@@ -207,6 +213,7 @@ class CTk(CTK_PARENT_CLASS, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
         if "fg_color" in kwargs:
             self._fg_color = self._check_color_type(kwargs.pop("fg_color"))
             super().configure(bg=self._apply_appearance_mode(self._fg_color))
+            MasterColorCache.invalidate()  # detected colors of transparent children depend on this fg_color
 
             for child in self.winfo_children():
                 try:
@@ -7,6 +7,7 @@ from .ctk_label import CTkLabel
 from .ctk_optionmenu import CTkOptionMenu
 from .ctk_progressbar import CTkProgressBar
 from .ctk_radiobutton import CTkRadioButton
+from .ctk_radiogroup import CTkRadioGroup
 from .ctk_scrollbar import CTkScrollbar
 from .ctk_segmented_button import CTkSegmentedButton
 from .ctk_slider import CTkSlider
@@ -1,14 +1,27 @@
 import tkinter
+import time
+import weakref
 from typing import Callable
 import darkdetect
 
+from ..core_rendering import RedrawScheduler
+from ..utility import CheckCounter, WeakCallbackRegistry
+
 
 class AppearanceModeTracker:
 
-    callback_list = []
-    app_list = []
+    # widget callbacks and apps are only weakly referenced, destroyed widgets drop out automatically
+    callback_list = WeakCallbackRegistry()
+    app_list = weakref.WeakSet()
     update_loop_running = False
-    update_loop_interval = 30  # milliseconds
+    update_loop_interval = 30  # milliseconds, used right after the app got focus or a theme change event
+    max_update_loop_interval = 2000  # milliseconds, interval doubles up to this value while the mode stays the same
+    current_update_loop_interval = 30  # milliseconds
+    update_loop_after_id = None
+    update_loop_app = None
+
+    check_counter = CheckCounter()
+    last_switch_duration = None  # seconds needed by the last appearance mode switch, for diagnostics
 
     appearance_mode_set_by = "system"
     appearance_mode = 0  # Light (standard)
@@ -24,23 +37,24 @@ class AppearanceModeTracker:
 
     @classmethod
     def add(cls, callback: Callable, widget=None):
-        cls.callback_list.append(callback)
+        cls.callback_list.add(callback)
 
         if widget is not None:
             app = cls.get_tk_root_of_widget(widget)
             if app not in cls.app_list:
-                cls.app_list.append(app)
+                cls.app_list.add(app)
+
+                # system appearance usually changes while the app is in the background, so check again when
+                # it gets focus, and when Tk reports a system theme change (Windows)
+                app.bind("<FocusIn>", lambda event: cls.system_change_event(event, app), add="+")
+                app.bind("<<ThemeChanged>>", lambda event: cls.system_change_event(event, app), add="+")
 
                 if not cls.update_loop_running:
-                    app.after(cls.update_loop_interval, cls.update)
-                    cls.update_loop_running = True
+                    cls.schedule_update(app, cls.update_loop_interval)
 
     @classmethod
     def remove(cls, callback: Callable):
-        try:
-            cls.callback_list.remove(callback)
-        except ValueError:
-            return
+        cls.callback_list.discard(callback)
 
     @staticmethod
     def detect_appearance_mode() -> int:
@@ -63,33 +77,86 @@ class AppearanceModeTracker:
 
     @classmethod
     def update_callbacks(cls):
-        if cls.appearance_mode == 0:
-            for callback in cls.callback_list:
-                try:
-                    callback("Light")
-                except Exception:
-                    continue
-
-        elif cls.appearance_mode == 1:
-            for callback in cls.callback_list:
-                try:
-                    callback("Dark")
-                except Exception:
-                    continue
+        """ switch all widgets in one batch: callbacks only store the new mode and mark widgets as dirty,
+            then every dirty widget gets drawn once and each app flushes its idle tasks once at the end """
+        start_time = time.perf_counter()
+        mode_string = "Light" if cls.appearance_mode == 0 else "Dark"
+
+        for callback in cls.callback_list:
+            try:
+                callback(mode_string)
+            except Exception:
+                continue
+
+        RedrawScheduler.flush()
+
+        for app in list(cls.app_list):
+            try:
+                app.update_idletasks()
+            except Exception:
+                continue
+
+        cls.last_switch_duration = time.perf_counter() - start_time
+
+    @classmethod
+    def system_change_event(cls, event, app):
+        """ check the system appearance mode soon and restart the back-off of the update loop """
+        if event.widget is not app:
+            return  # bindings of the root window also receive the events of all child widgets
+        if cls.update_loop_running and cls.current_update_loop_interval == cls.update_loop_interval:
+            return  # check with the shortest interval is already pending
+
+        cls.current_update_loop_interval = cls.update_loop_interval
+        cls.schedule_update(app, cls.update_loop_interval)
+
+    @classmethod
+    def schedule_update(cls, app, delay: int):
+        if cls.update_loop_after_id is not None:
+            try:
+                cls.update_loop_app.after_cancel(cls.update_loop_after_id)
+            except Exception:
+                pass
+
+        cls.update_loop_after_id = app.after(delay, cls.update)
+        cls.update_loop_app = app
+        cls.update_loop_running = True
+
+    @classmethod
+    def get_checks_per_minute(cls) -> float:
+        """ number of system appearance checks during the last minute, for diagnostics """
+        return cls.check_counter.get_checks_per_minute()
+
+    @classmethod
+    def get_live_registrations(cls) -> dict:
+        """ number of registered appearance mode callbacks and tracked apps, for diagnostics """
+        return {"callbacks": len(cls.callback_list),
+                "apps": len(cls.app_list),
+                "dead_references_removed": cls.callback_list.dead_references_removed}
 
     @classmethod
     def update(cls):
+        cls.update_loop_after_id = None
+        mode_changed = False
+
         if cls.appearance_mode_set_by == "system":
+            cls.check_counter.count()
             new_appearance_mode = cls.detect_appearance_mode()
 
             if new_appearance_mode != cls.appearance_mode:
                 cls.appearance_mode = new_appearance_mode
                 cls.update_callbacks()
+                mode_changed = True
+
+        # adaptive back-off: poll fast after changes, slower and slower while nothing changes
+        if mode_changed:
+            cls.current_update_loop_interval = cls.update_loop_interval
+        else:
+            cls.current_update_loop_interval = min(cls.current_update_loop_interval * 2, cls.max_update_loop_interval)
 
         # find an existing tkinter.Tk object for the next call of .after()
-        for app in cls.app_list:
+        for app in list(cls.app_list):
             try:
-                app.after(cls.update_loop_interval, cls.update)
+                cls.schedule_update(app, cls.current_update_loop_interval)
                 return
             except Exception:
                 continue
@@ -2,10 +2,12 @@ import sys
 
 from .ctk_canvas import CTkCanvas
 from .draw_engine import DrawEngine
+from .redraw_scheduler import RedrawScheduler
+from .draw_method_selector import DrawMethodSelector
 
 CTkCanvas.init_font_character_mapping()
 
-# determine draw method based on current platform
+# static draw method based on current platform, replaced by DrawMethodSelector.select() when the first CTk window gets created
 if sys.platform == "darwin":
     DrawEngine.preferred_drawing_method = "polygon_shapes"
 else:
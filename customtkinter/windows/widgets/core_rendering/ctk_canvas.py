@@ -1,6 +1,7 @@
 import tkinter
 import sys
-from typing import Union, Tuple
+import re
+from typing import Union, Tuple, Set, Dict, Optional
 
 
 class CTkCanvas(tkinter.Canvas):
@@ -15,6 +16,13 @@ class CTkCanvas(tkinter.Canvas):
     - .coords() is modified to support the aa-circle shapes correctly like you would expect.
     - .itemconfig() is also modified to support aa-cricle shapes.
 
+    The canvas keeps a Python side index of tag -> item ids and of the aa-circle items, which
+    is updated when items get created, tagged or deleted through this class. .coords(),
+    .itemconfig(), .find_withtag() and .delete() resolve plain tags with this index, so the
+    draw engine's many lookups per redraw don't need a round-trip to Tcl. Tag expressions
+    and special tags like 'current' are still resolved by Tcl. Items found through the
+    index are returned in creation order instead of display list order.
+
     The aa-circles are created by choosing a character from the custom created and loaded
     font 'CustomTkinter_shapes_font'. It contains circle shapes with different sizes filling
     either the whole character space or just pert of it (characters A to R). Circles with a smaller
@@ -27,9 +35,13 @@ class CTkCanvas(tkinter.Canvas):
 
     radius_to_char_fine: dict = None  # dict to map radius to font circle character
 
+    _plain_tag_pattern = re.compile(r"^[^\s&|!^()]+$")  # tags that are not tag expressions
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._aa_circle_canvas_ids = set()
+        self._tag_to_ids: Dict[str, Set[int]] = {}
+        self._id_to_tags: Dict[int, Set[str]] = {}
 
     @classmethod
     def init_font_character_mapping(cls):
@@ -70,6 +82,64 @@ class CTkCanvas(tkinter.Canvas):
         else:
             return self.radius_to_char_fine[radius]
 
+    @staticmethod
+    def _split_tags(tags) -> Tuple[str, ...]:
+        if tags is None:
+            return ()
+        if isinstance(tags, str):
+            return tuple(tags.split())
+        return tuple(str(tag) for tag in tags)
+
+    def _is_plain_tag(self, tag: str) -> bool:
+        return tag not in ("all", "current") and not tag.isdigit() and self._plain_tag_pattern.match(tag) is not None
+
+    def _index_add(self, item_id: int, tags):
+        item_tags = self._id_to_tags.setdefault(item_id, set())
+        for tag in tags:
+            item_tags.add(tag)
+            self._tag_to_ids.setdefault(tag, set()).add(item_id)
+
+    def _index_remove(self, item_id: int, tags=None):
+        """ remove given tags from item, or the whole item if tags is None """
+        item_tags = self._id_to_tags.get(item_id)
+        if item_tags is None:
+            return
+        for tag in (tuple(item_tags) if tags is None else tags):
+            item_tags.discard(tag)
+            tag_ids = self._tag_to_ids.get(tag)
+            if tag_ids is not None:
+                tag_ids.discard(item_id)
+                if not tag_ids:
+                    del self._tag_to_ids[tag]
+        if tags is None:
+            del self._id_to_tags[item_id]
+            self._aa_circle_canvas_ids.discard(item_id)
+
+    def _resync_tag(self, tag: str):
+        """ read the items of a tag from Tcl, after it got changed by a method that is not tracked in the index """
+        for item_id in tuple(self._tag_to_ids.get(tag, ())):
+            self._index_remove(item_id, (tag,))
+        for item_id in super().find_withtag(tag):
+            self._index_add(item_id, (tag,))
+
+    def _find_in_index(self, tag_or_id) -> Optional[Set[int]]:
+        """ item ids for tag_or_id from the index, None if it has to be resolved by Tcl """
+        if type(tag_or_id) == int:
+            return {tag_or_id} if tag_or_id in self._id_to_tags else None
+        elif type(tag_or_id) == str:
+            if tag_or_id == "all":
+                return set(self._id_to_tags)
+            elif self._is_plain_tag(tag_or_id):
+                return self._tag_to_ids.get(tag_or_id, set())  # every item is created through _create(), so unknown tags have no items
+        return None
+
+    def _create(self, item_type, args, kw):
+        item_id = super()._create(item_type, args, kw)
+
+        cnf = args[-1] if args and isinstance(args[-1], dict) else {}
+        self._index_add(item_id, self._split_tags(kw.get("tags", cnf.get("tags"))))
+        return item_id
+
     def create_aa_circle(self, x_pos: int, y_pos: int, radius: int, angle: int = 0, fill: str = "white",
                          tags: Union[str, Tuple[str, ...]] = "", anchor: str = tkinter.CENTER) -> int:
         # create a circle with a font element
@@ -80,38 +150,87 @@ class CTkCanvas(tkinter.Canvas):
 
         return circle_1
 
-    def coords(self, tag_or_id, *args):
+    def addtag(self, *args):
+        super().addtag(*args)
 
-        if type(tag_or_id) == str and "ctk_aa_circle_font_element" in self.gettags(tag_or_id):
-            coords_id = self.find_withtag(tag_or_id)[0]  # take the lowest id for the given tag
-            super().coords(coords_id, *args[:2])
+        new_tag = str(args[0])
+        item_ids = self._find_in_index(args[2]) if len(args) == 3 and args[1] == "withtag" else None
+        if item_ids is None:
+            self._resync_tag(new_tag)
+        else:
+            for item_id in tuple(item_ids):
+                self._index_add(item_id, (new_tag,))
+
+    def dtag(self, *args):
+        super().dtag(*args)
+
+        if len(args) == 0:
+            return
+        tag_to_delete = str(args[1] if len(args) > 1 else args[0])
+        item_ids = self._find_in_index(args[0])
+        if item_ids is None:
+            self._resync_tag(tag_to_delete)
+        else:
+            for item_id in tuple(item_ids):
+                self._index_remove(item_id, (tag_to_delete,))
 
-            if len(args) == 3:
-                super().itemconfigure(coords_id, font=("CustomTkinter_shapes_font", -int(args[2]) * 2), text=self._get_char_from_radius(args[2]))
+    def delete(self, *args):
+        deleted_ids = set()
+        for tag_or_id in args:
+            item_ids = self._find_in_index(tag_or_id)
+            deleted_ids.update(super().find_withtag(tag_or_id) if item_ids is None else item_ids)
+
+        super().delete(*args)
+
+        for item_id in deleted_ids:
+            self._index_remove(item_id)
 
-        elif type(tag_or_id) == int and tag_or_id in self._aa_circle_canvas_ids:
-            super().coords(tag_or_id, *args[:2])
+    def find_withtag(self, tag_or_id):
+        item_ids = self._find_in_index(tag_or_id)
+        if item_ids is None:
+            return super().find_withtag(tag_or_id)
+        return tuple(sorted(item_ids))
+
+    def coords(self, tag_or_id, *args):
+        item_ids = self._find_in_index(tag_or_id)
+        if item_ids is None:
+            item_ids = super().find_withtag(tag_or_id)
+        if not item_ids:
+            return []
+
+        if not self._aa_circle_canvas_ids.isdisjoint(item_ids):
+            coords_id = min(item_ids)  # take the lowest id for the given tag
+            super().coords(coords_id, *args[:2])
 
             if len(args) == 3:
-                super().itemconfigure(tag_or_id, font=("CustomTkinter_shapes_font", -args[2] * 2), text=self._get_char_from_radius(args[2]))
+                super().itemconfigure(coords_id, font=("CustomTkinter_shapes_font", -int(args[2]) * 2), text=self._get_char_from_radius(args[2]))
 
         else:
-            super().coords(tag_or_id, *args)
+            return super().coords(tag_or_id, *args)
 
     def itemconfig(self, tag_or_id, *args, **kwargs):
         kwargs_except_outline = kwargs.copy()
         if "outline" in kwargs_except_outline:
             del kwargs_except_outline["outline"]
 
-        if type(tag_or_id) == int:
-            if tag_or_id in self._aa_circle_canvas_ids:
-                super().itemconfigure(tag_or_id, *args, **kwargs_except_outline)
-            else:
-                super().itemconfigure(tag_or_id, *args, **kwargs)
+        item_ids = self._find_in_index(tag_or_id)
+        if item_ids is None:
+            item_ids = super().find_withtag(tag_or_id)
+        if not item_ids:
+            return
+
+        if self._aa_circle_canvas_ids.isdisjoint(item_ids):
+            super().itemconfigure(tag_or_id, *args, **kwargs)  # no aa-circles, configure all items with one call
+        elif type(tag_or_id) == int or self._aa_circle_canvas_ids.issuperset(item_ids):
+            super().itemconfigure(tag_or_id, *args, **kwargs_except_outline)
         else:
-            configure_ids = self.find_withtag(tag_or_id)
-            for configure_id in configure_ids:
+            for configure_id in tuple(item_ids):
                 if configure_id in self._aa_circle_canvas_ids:
                     super().itemconfigure(configure_id, *args, **kwargs_except_outline)
                 else:
                     super().itemconfigure(configure_id, *args, **kwargs)
+
+        if "tags" in kwargs:
+            for item_id in tuple(item_ids):
+                self._index_remove(item_id, tuple(self._id_to_tags.get(item_id, ())))
+                self._index_add(item_id, self._split_tags(super().gettags(item_id)))
@@ -15,6 +15,10 @@ class DrawEngine:
     class, and I don't think there's much I can do to make the rendering look better than this with the
     limited capabilities the tkinter.Canvas offers.
 
+    The rounded shape functions remember the (normalized) geometry of their last call, so redraws with an
+    unchanged size, corner_radius, border_width and drawing method (for example on appearance mode changes or
+    repeated <Configure> events) skip all canvas calls and return False (no recoloring necessary).
+
     Functions:
      - draw_rounded_rect_with_border()
      - draw_rounded_rect_with_border_vertical_split()
@@ -32,11 +36,25 @@ class DrawEngine:
         self._canvas = canvas
         self._round_width_to_even_numbers: bool = True
         self._round_height_to_even_numbers: bool = True
+        self._last_geometry: dict = {}  # draw function name -> geometry of last call
 
     def set_round_to_even_numbers(self, round_width_to_even_numbers: bool = True, round_height_to_even_numbers: bool = True):
         self._round_width_to_even_numbers: bool = round_width_to_even_numbers
         self._round_height_to_even_numbers: bool = round_height_to_even_numbers
 
+    def reset_geometry_cache(self):
+        """ forces the next draw call to update all canvas items, necessary if shape parts were deleted from the canvas """
+        self._last_geometry.clear()
+
+    def _geometry_unchanged(self, draw_function_name: str, *geometry) -> bool:
+        """ returns True if the draw function was already called with the same geometry and drawing method,
+            so the canvas items are still up to date, otherwise stores the new geometry and returns False """
+        key = (self.preferred_drawing_method, *geometry)
+        if self._last_geometry.get(draw_function_name) == key:
+            return True
+        self._last_geometry[draw_function_name] = key
+        return False
+
     def __calc_optimal_corner_radius(self, user_corner_radius: Union[float, int]) -> Union[float, int]:
         # optimize for drawing with polygon shapes
         if self.preferred_drawing_method == "polygon_shapes":
@@ -122,6 +140,9 @@ class DrawEngine:
         else:
             preferred_drawing_method = self.preferred_drawing_method
 
+        if self._geometry_unchanged("rounded_rect_with_border", width, height, corner_radius, border_width, preferred_drawing_method):
+            return False
+
         if preferred_drawing_method == "polygon_shapes":
             return self.__draw_rounded_rect_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius)
         elif preferred_drawing_method == "font_shapes":
@@ -428,6 +449,9 @@ class DrawEngine:
         elif left_section_width < corner_radius * 2:
             left_section_width = corner_radius * 2
 
+        if self._geometry_unchanged("rounded_rect_with_border_vertical_split", width, height, corner_radius, border_width, left_section_width):
+            return False
+
         if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
             return self.__draw_rounded_rect_with_border_vertical_split_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius, left_section_width)
         elif self.preferred_drawing_method == "font_shapes":
@@ -714,17 +738,27 @@ class DrawEngine:
         else:
             inner_corner_radius = 0
 
+        # if only the progress values changed, the border and inner parts stay as they are and only the progress parts get moved
+        redraw_shape = not self._geometry_unchanged("rounded_progress_bar_with_border_shape", width, height, corner_radius, border_width, orientation)
+
+        if self._geometry_unchanged("rounded_progress_bar_with_border", width, height, corner_radius, border_width,
+                                    progress_value_1, progress_value_2, orientation):
+            return False
+
         if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
             return self.__draw_rounded_progress_bar_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius,
-                                                                               progress_value_1, progress_value_2, orientation)
+                                                                               progress_value_1, progress_value_2, orientation, redraw_shape)
         elif self.preferred_drawing_method == "font_shapes":
             return self.__draw_rounded_progress_bar_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
-                                                                            progress_value_1, progress_value_2, orientation)
+                                                                            progress_value_1, progress_value_2, orientation, redraw_shape)
 
     def __draw_rounded_progress_bar_with_border_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
-                                                               progress_value_1: float, progress_value_2: float, orientation: str) -> bool:
+                                                               progress_value_1: float, progress_value_2: float, orientation: str,
+                                                               redraw_shape: bool = True) -> bool:
 
-        requires_recoloring = self.__draw_rounded_rect_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius)
+        requires_recoloring = False
+        if redraw_shape:
+            requires_recoloring = self.__draw_rounded_rect_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius)
 
         if corner_radius <= border_width:
             bottom_right_shift = 0  # weird canvas rendering inaccuracy that has to be corrected in some cases
@@ -732,7 +766,7 @@ class DrawEngine:
             bottom_right_shift = 0
 
         # create progress parts
-        if not self._canvas.find_withtag("progress_parts"):
+        if redraw_shape and not self._canvas.find_withtag("progress_parts"):
             self._canvas.create_polygon((0, 0, 0, 0), tags=("progress_line_1", "progress_parts"), joinstyle=tkinter.ROUND)
             self._canvas.tag_raise("progress_parts", "inner_parts")
             requires_recoloring = True
@@ -759,16 +793,18 @@ class DrawEngine:
                                 border_width + inner_corner_radius,
                                 border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1))
 
-        self._canvas.itemconfig("progress_line_1", width=inner_corner_radius * 2)
+        if redraw_shape:
+            self._canvas.itemconfig("progress_line_1", width=inner_corner_radius * 2)
 
         return requires_recoloring
 
     def __draw_rounded_progress_bar_with_border_font_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
-                                                            progress_value_1: float, progress_value_2: float, orientation: str) -> bool:
+                                                            progress_value_1: float, progress_value_2: float, orientation: str,
+                                                            redraw_shape: bool = True) -> bool:
 
         requires_recoloring, requires_recoloring_2 = False, False
 
-        if inner_corner_radius > 0:
+        if redraw_shape and inner_corner_radius > 0:
             # create canvas border corner parts if not already created
             if not self._canvas.find_withtag("progress_oval_1_a"):
                 self._canvas.create_aa_circle(0, 0, 0, tags=("progress_oval_1_a", "progress_corner_part", "progress_parts"), anchor=tkinter.CENTER)
@@ -786,20 +822,22 @@ class DrawEngine:
             elif self._canvas.find_withtag("progress_oval_3_a") and not round(inner_corner_radius) * 2 < height - 2 * border_width:
                 self._canvas.delete("progress_oval_3_a", "progress_oval_3_b", "progress_oval_4_a", "progress_oval_4_b")
 
-        if not self._canvas.find_withtag("progress_rectangle_1"):
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("progress_rectangle_1", "progress_rectangle_part", "progress_parts"), width=0)
-            requires_recoloring = True
+        if redraw_shape:
+            if not self._canvas.find_withtag("progress_rectangle_1"):
+                self._canvas.create_rectangle(0, 0, 0, 0, tags=("progress_rectangle_1", "progress_rectangle_part", "progress_parts"), width=0)
+                requires_recoloring = True
 
-        if not self._canvas.find_withtag("progress_rectangle_2") and inner_corner_radius * 2 < height - (border_width * 2):
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("progress_rectangle_2", "progress_rectangle_part", "progress_parts"), width=0)
-            requires_recoloring = True
-        elif self._canvas.find_withtag("progress_rectangle_2") and not inner_corner_radius * 2 < height - (border_width * 2):
-            self._canvas.delete("progress_rectangle_2")
+            if not self._canvas.find_withtag("progress_rectangle_2") and inner_corner_radius * 2 < height - (border_width * 2):
+                self._canvas.create_rectangle(0, 0, 0, 0, tags=("progress_rectangle_2", "progress_rectangle_part", "progress_parts"), width=0)
+                requires_recoloring = True
+            elif self._canvas.find_withtag("progress_rectangle_2") and not inner_corner_radius * 2 < height - (border_width * 2):
+                self._canvas.delete("progress_rectangle_2")
 
         # horizontal orientation from the bottom
         if orientation == "w":
-            requires_recoloring_2 = self.__draw_rounded_rect_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
-                                                                                     ())
+            if redraw_shape:
+                requires_recoloring_2 = self.__draw_rounded_rect_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+                                                                                         ())
 
             # set positions of progress corner parts
             self._canvas.coords("progress_oval_1_a", border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
@@ -833,8 +871,9 @@ class DrawEngine:
 
         # vertical orientation from the bottom
         if orientation == "s":
-            requires_recoloring_2 = self.__draw_rounded_rect_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
-                                                                                     ())
+            if redraw_shape:
+                requires_recoloring_2 = self.__draw_rounded_rect_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+                                                                                         ())
 
             # set positions of progress corner parts
             self._canvas.coords("progress_oval_1_a", border_width + inner_corner_radius,
@@ -893,6 +932,10 @@ class DrawEngine:
         else:
             inner_corner_radius = 0
 
+        if self._geometry_unchanged("rounded_slider_with_border_and_button", width, height, corner_radius, border_width,
+                                    button_length, button_corner_radius, slider_value, orientation):
+            return False
+
         if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
             return self.__draw_rounded_slider_with_border_and_button_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius,
                                                                                     button_length, button_corner_radius, slider_value, orientation)
@@ -1047,6 +1090,9 @@ class DrawEngine:
         else:
             inner_corner_radius = 0
 
+        if self._geometry_unchanged("rounded_scrollbar", width, height, corner_radius, border_spacing, start_value, end_value, orientation):
+            return False
+
         if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
             return self.__draw_rounded_scrollbar_polygon_shapes(width, height, corner_radius, inner_corner_radius,
                                                                 start_value, end_value, orientation)
@@ -0,0 +1,175 @@
+import sys
+import os
+import time
+import marshal
+import platform
+import tkinter
+import tkinter.font
+from typing import Union
+
+from .ctk_canvas import CTkCanvas
+from .draw_engine import DrawEngine
+from ..utility import get_cache_directory, write_cache_file
+
+
+class DrawMethodSelector:
+    """
+    Chooses DrawEngine.preferred_drawing_method for the current platform and Tk build.
+
+    The rendering quality of each method on this platform is rated first:
+
+    - polygon_shapes: antialiased only on macOS (aqua), jagged corners on Windows and X11
+    - font_shapes: antialiased, needs the CustomTkinter_shapes_font to be installed
+    - circle_shapes: always poor
+
+    Only methods with the best quality are candidates, so the benchmark can never lower the
+    rendering quality. If there is more than one, each draws and resizes rounded rectangles on a
+    canvas in a mapped off-screen toplevel, and the time includes the rendering done by Tk. The
+    fastest one gets used. The costs are cached on disk per platform, Tk version and quality
+    ratings, so the benchmark runs only once. set_overwrite_method() skips the selection,
+    get_report() returns the measured costs.
+    """
+
+    drawing_methods = ("polygon_shapes", "font_shapes", "circle_shapes")
+    quality_levels = {"poor": 0, "jagged": 1, "antialiased": 2}
+
+    overwrite_method: Union[str, None] = None
+    automatic_selection: bool = True
+
+    _cache_format_version = 2
+    _benchmark_sizes = ((140, 28, 6, 0), (200, 40, 10, 2), (250, 300, 6, 0), (28, 28, 14, 3))
+    _benchmark_resizes = 15
+
+    _selection_done: bool = False
+    _report: dict = {}
+    _automatic_method: Union[str, None] = None  # method and report replaced by the overwrite, restored by set_overwrite_method(None)
+    _automatic_report: dict = {}
+
+    @classmethod
+    def set_overwrite_method(cls, drawing_method: Union[str, None]):
+        """ use drawing_method instead of the automatic selection, None restores the automatically selected
+            (or static, if no CTk window was created yet) method, only affects widgets drawn afterwards """
+        if drawing_method is not None and drawing_method not in cls.drawing_methods:
+            raise ValueError(f"drawing method '{drawing_method}' is not one of {cls.drawing_methods}")
+
+        if drawing_method is not None:
+            if cls.overwrite_method is None:
+                cls._automatic_method, cls._automatic_report = DrawEngine.preferred_drawing_method, cls._report
+            DrawEngine.preferred_drawing_method = drawing_method
+            cls._report = {"method": drawing_method, "source": "overwrite"}
+        elif cls.overwrite_method is not None:
+            DrawEngine.preferred_drawing_method = cls._automatic_method
+            cls._report = cls._automatic_report
+        cls.overwrite_method = drawing_method
+
+    @classmethod
+    def get_report(cls) -> dict:
+        """ chosen method, source ('overwrite', 'cache', 'benchmark', 'quality' or 'static') and measured costs in ms per draw """
+        return dict(cls._report) if cls._report else {"method": DrawEngine.preferred_drawing_method, "source": "static"}
+
+    @classmethod
+    def select(cls, root: tkinter.Misc):
+        """ gets called by the first CTk window, before any widget gets drawn """
+        if cls._selection_done:
+            return
+        cls._selection_done = True
+
+        if cls.overwrite_method is not None or not cls.automatic_selection:
+            return
+
+        try:
+            quality = cls._rate_quality(root)
+            candidates = cls._best_quality_methods(quality)
+            costs, source = {}, "quality"
+            if len(candidates) > 1:
+                cache_path, cache_key = cls._get_cache_path_and_key(root, quality)
+                costs, source = cls._read_cache(cache_path, cache_key), "cache"
+                if costs is None:
+                    costs, source = cls._measure_costs(root, candidates), "benchmark"
+                    if costs is None:
+                        costs, source = {}, "quality"  # canvas could not be mapped, rendering can't be measured
+                    else:
+                        cls._write_cache(cache_path, cache_key, costs)
+        except Exception as err:
+            sys.stderr.write(f"customtkinter.DrawMethodSelector warning: drawing method selection failed ({err}), " +
+                             f"using '{DrawEngine.preferred_drawing_method}'\n")
+            return
+
+        if costs:
+            DrawEngine.preferred_drawing_method = min(candidates, key=lambda method: costs[method])
+        elif DrawEngine.preferred_drawing_method not in candidates:
+            DrawEngine.preferred_drawing_method = candidates[0]  # the only method with the best quality
+        cls._report = {"method": DrawEngine.preferred_drawing_method, "source": source,
+                       "costs_ms": costs, "quality": quality}
+
+    @classmethod
+    def _rate_quality(cls, root: tkinter.Misc) -> dict:
+        windowing_system = root.tk.call("tk", "windowingsystem")
+        shapes_font_family = tkinter.font.Font(root=root, family="CustomTkinter_shapes_font").actual("family")
+
+        return {"polygon_shapes": "antialiased" if windowing_system == "aqua" else "jagged",
+                "font_shapes": "antialiased" if shapes_font_family == "CustomTkinter_shapes_font" else "poor",
+                "circle_shapes": "poor"}
+
+    @classmethod
+    def _best_quality_methods(cls, quality: dict) -> list:
+        best_level = max(cls.quality_levels[quality[method]] for method in cls.drawing_methods)
+        return [method for method in cls.drawing_methods if cls.quality_levels[quality[method]] == best_level]
+
+    @classmethod
+    def _measure_costs(cls, root: tkinter.Misc, drawing_methods: list) -> Union[dict, None]:
+        """ average time in ms per draw call including rendering, None if the canvas could not be mapped """
+        root_was_shown = root.state() == "normal"
+        root.withdraw()  # the root window is not set up yet and must not show up during the benchmark
+
+        toplevel = tkinter.Toplevel(root)
+        toplevel.overrideredirect(True)
+        toplevel.geometry(f"300x300+{-10000}+{-10000}")  # mapped, but off-screen
+        canvas = CTkCanvas(master=toplevel, width=300, height=300, highlightthickness=0, bg="#ffffff")
+        canvas.pack()
+        costs = {}
+        try:
+            toplevel.update_idletasks()
+            if not canvas.winfo_ismapped():
+                return None
+
+            for method in drawing_methods:
+                draw_engine = DrawEngine(canvas)
+                draw_engine.preferred_drawing_method = method  # only for this engine, the class attribute stays
+                draw_calls = 0
+
+                start_time = time.perf_counter()
+                for width, height, corner_radius, border_width in cls._benchmark_sizes:
+                    canvas.delete("all")
+                    draw_engine.reset_geometry_cache()
+                    for resize in range(cls._benchmark_resizes):
+                        if draw_engine.draw_rounded_rect_with_border(width + 2 * resize, height + 2 * resize, corner_radius, border_width):
+                            canvas.itemconfig("inner_parts", fill="#3a7ebf", outline="#3a7ebf")
+                            canvas.itemconfig("border_parts", fill="#1f538d", outline="#1f538d")
+                        canvas.update_idletasks()  # renders the changed canvas, it is mapped
+                        draw_calls += 1
+                costs[method] = round((time.perf_counter() - start_time) * 1000 / draw_calls, 4)
+        finally:
+            toplevel.destroy()
+            if root_was_shown:
+                root.deiconify()
+        return costs
+
+    @classmethod
+    def _get_cache_path_and_key(cls, root: tkinter.Misc, quality: dict):
+        cache_key = (cls._cache_format_version, sys.platform, platform.release(), platform.version(),
+                     str(root.tk.call("info", "patchlevel")), tuple(sorted(quality.items())))
+        return os.path.join(get_cache_directory("rendering"), f"drawing_method-{sys.platform}.marshal"), cache_key
+
+    @staticmethod
+    def _read_cache(cache_path: str, cache_key: tuple) -> Union[dict, None]:
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, costs = marshal.loads(f.read())
+        except Exception:
+            return None  # no benchmark yet or unreadable cache
+        return costs if cached_key == cache_key else None
+
+    @staticmethod
+    def _write_cache(cache_path: str, cache_key: tuple, costs: dict):
+        write_cache_file(cache_path, lambda f: f.write(marshal.dumps((cache_key, costs))))
@@ -0,0 +1,61 @@
+import tkinter
+
+
+class RedrawScheduler:
+    """
+    Collects redraw requests of widgets and executes them once per idle cycle.
+
+    Resizing a window or moving it to a monitor with a different DPI scaling triggers
+    a <Configure> event and a _set_scaling() call for every widget, each of which used
+    to redraw its canvas immediately. Widgets now only get marked as dirty with
+    schedule(), and every dirty widget of a window is drawn exactly once in flush(),
+    which runs as an after_idle callback or explicitly at the end of a scaling update.
+    """
+
+    # window root -> {widget: no_color_updates}, insertion order is drawing order (masters before children)
+    dirty_widgets_dict = {}
+    flush_scheduled_set = set()
+
+    redraws_requested = 0  # statistics, can be read for diagnostics
+    redraws_executed = 0
+
+    @classmethod
+    def schedule(cls, widget, no_color_updates: bool = True):
+        """ mark widget as dirty, a full redraw (no_color_updates=False) wins over a geometry-only redraw """
+        window_root = widget.winfo_toplevel()
+        dirty_widgets = cls.dirty_widgets_dict.setdefault(window_root, {})
+        dirty_widgets[widget] = dirty_widgets.get(widget, True) and no_color_updates
+        cls.redraws_requested += 1
+
+        if window_root not in cls.flush_scheduled_set:
+            cls.flush_scheduled_set.add(window_root)
+            try:
+                window_root.after_idle(cls.flush, window_root)
+            except tkinter.TclError:
+                cls.flush_scheduled_set.discard(window_root)
+
+    @classmethod
+    def flush(cls, window_root=None):
+        """ draw all dirty widgets of the given window (or of all windows if window_root is None) """
+        window_roots = list(cls.dirty_widgets_dict.keys()) if window_root is None else [window_root]
+
+        for root in window_roots:
+            cls.flush_scheduled_set.discard(root)
+            dirty_widgets = cls.dirty_widgets_dict.pop(root, None)
+            if not dirty_widgets:
+                continue
+
+            for widget, no_color_updates in dirty_widgets.items():
+                try:
+                    if not widget.winfo_exists():
+                        continue
+                    widget._draw(no_color_updates=no_color_updates)
+                    cls.redraws_executed += 1
+                except tkinter.TclError:
+                    pass  # widget got destroyed while its redraw was pending
+
+    @classmethod
+    def discard(cls, widget):
+        """ remove pending redraw of widget, gets called when widget is destroyed """
+        for dirty_widgets in cls.dirty_widgets_dict.values():
+            dirty_widgets.pop(widget, None)
@@ -16,8 +16,9 @@ from ..font import CTkFont
 from ..image import CTkImage
 from ..appearance_mode import CTkAppearanceModeBaseClass
 from ..scaling import CTkScalingBaseClass
+from ..core_rendering import RedrawScheduler
 
-from ..utility import pop_from_dict_by_set, check_kwargs_empty
+from ..utility import pop_from_dict_by_set, check_kwargs_empty, MasterColorCache
 
 
 class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
@@ -94,6 +95,8 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
     def destroy(self):
         """ Destroy this and all descendants widgets. """
 
+        RedrawScheduler.discard(self)
+
         # call destroy methods of super classes
         tkinter.Frame.destroy(self)
         CTkAppearanceModeBaseClass.destroy(self)
@@ -107,6 +110,10 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
             # super().configure(bg=self._apply_appearance_mode(self._bg_color))
             pass
 
+    def _schedule_redraw(self, no_color_updates: bool = True):
+        """ mark widget for redraw, all dirty widgets of the window get drawn once in the next idle cycle """
+        RedrawScheduler.schedule(self, no_color_updates=no_color_updates)
+
     def config(self, *args, **kwargs):
         raise AttributeError("'config' is not implemented for CTk widgets. For consistency, always use 'configure' instead.")
 
@@ -185,14 +192,32 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
             self._current_width = self._reverse_widget_scaling(event.width)  # adjust current size according to new size given by event
             self._current_height = self._reverse_widget_scaling(event.height)  # _current_width and _current_height are independent of the scale
 
-            self._draw(no_color_updates=True)  # faster drawing without color changes
+            self._schedule_redraw(no_color_updates=True)  # faster drawing without color changes, batched per idle cycle
 
     def _detect_color_of_master(self, master_widget=None) -> Union[str, Tuple[str, str]]:
-        """ detect foreground color of master widget for bg_color and transparent color """
+        """ detect foreground color of master widget for bg_color and transparent color,
+            results for CTk container masters are cached in MasterColorCache """
 
         if master_widget is None:
             master_widget = self.master
 
+        # only containers that call MasterColorCache.invalidate() on fg_color changes are cached, colors of other
+        # CTk widgets, ttk masters (ttk.Style changes) and plain tkinter masters can change without notice
+        cacheable = isinstance(master_widget, (windows.CTk, windows.CTkToplevel, windows.widgets.CTkFrame, windows.widgets.CTkTabview,
+                                               windows.widgets.ctk_scrollable_frame.CTkScrollableFrame))
+        if cacheable:
+            color = MasterColorCache.get(master_widget)
+            if color is not None:
+                return color
+
+        color = self._lookup_color_of_master(master_widget)
+        if cacheable:
+            MasterColorCache.set(master_widget, color)
+        return color
+
+    def _lookup_color_of_master(self, master_widget) -> Union[str, Tuple[str, str]]:
+        """ uncached lookup for _detect_color_of_master(), levels further up are looked up through the cache again """
+
         if isinstance(master_widget, (windows.widgets.core_widget_classes.CTkBaseClass, windows.CTk, windows.CTkToplevel, windows.widgets.ctk_scrollable_frame.CTkScrollableFrame)):
             if master_widget.cget("fg_color") is not None and master_widget.cget("fg_color") != "transparent":
                 return master_widget.cget("fg_color")
@@ -219,8 +244,7 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
 
     def _set_appearance_mode(self, mode_string):
         super()._set_appearance_mode(mode_string)
-        self._draw()
-        super().update_idletasks()
+        self._schedule_redraw(no_color_updates=False)  # drawn by AppearanceModeTracker in one batch for all widgets
 
     def _set_scaling(self, new_widget_scaling, new_window_scaling):
         super()._set_scaling(new_widget_scaling, new_window_scaling)
@@ -144,7 +144,7 @@ class CTkButton(CTkBaseClass):
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw(no_color_updates=True)
+        self._schedule_redraw(no_color_updates=True)
 
     def _set_appearance_mode(self, mode_string):
         super()._set_appearance_mode(mode_string)
@@ -170,8 +170,9 @@ class CTkButton(CTkBaseClass):
     def _update_image(self):
         if self._image_label is not None:
             if isinstance(self._image, CTkImage):
-                self._image_label.configure(image=self._image.create_scaled_photo_image(self._get_widget_scaling(),
-                                                                                        self._get_appearance_mode()))
+                # keep a reference, the CTkImage only caches a limited number of PhotoImages
+                self._photo_image = self._image.create_scaled_photo_image(self._get_widget_scaling(), self._get_appearance_mode())
+                self._image_label.configure(image=self._photo_image)
             elif self._image is not None:
                 self._image_label.configure(image=self._image)
 
@@ -126,7 +126,7 @@ class CTkEntry(CTkBaseClass):
         self._entry.configure(font=self._apply_font_scaling(self._font))
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width), height=self._apply_widget_scaling(self._desired_height))
         self._create_grid()
-        self._draw(no_color_updates=True)
+        self._schedule_redraw(no_color_updates=True)
 
     def _set_dimensions(self, width=None, height=None):
         super()._set_dimensions(width, height)
@@ -1,9 +1,11 @@
+import tkinter
 from typing import Union, Tuple, List, Optional, Any
 
 from .core_rendering import CTkCanvas
 from .theme import ThemeManager
 from .core_rendering import DrawEngine
 from .core_widget_classes import CTkBaseClass
+from .utility import MasterColorCache
 
 
 class CTkFrame(CTkBaseClass):
@@ -11,6 +13,10 @@ class CTkFrame(CTkBaseClass):
     Frame with rounded corners and border.
     Default foreground colors are set according to theme.
     To make the frame transparent set fg_color=None.
+
+    Frames without visible shape (border_width=0 and corner_radius=0 or a transparent fg_color)
+    are flat: they have no canvas, the tkinter.Frame itself shows the color and nothing gets
+    redrawn on resize. flat=True or flat=False overwrites the automatic choice.
     For detailed information check out the documentation.
     """
 
@@ -27,6 +33,7 @@ class CTkFrame(CTkBaseClass):
 
                  background_corner_colors: Union[Tuple[Union[str, Tuple[str, str]]], None] = None,
                  overwrite_preferred_drawing_method: Union[str, None] = None,
+                 flat: Optional[bool] = None,
                  **kwargs):
 
         # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
@@ -53,17 +60,46 @@ class CTkFrame(CTkBaseClass):
         self._corner_radius = ThemeManager.theme["CTkFrame"]["corner_radius"] if corner_radius is None else corner_radius
         self._border_width = ThemeManager.theme["CTkFrame"]["border_width"] if border_width is None else border_width
 
-        self._canvas = CTkCanvas(master=self,
-                                 highlightthickness=0,
-                                 width=self._apply_widget_scaling(self._current_width),
-                                 height=self._apply_widget_scaling(self._current_height))
-        self._canvas.place(x=0, y=0, relwidth=1, relheight=1)
-        self._canvas.configure(bg=self._apply_appearance_mode(self._bg_color))
-        self._draw_engine = DrawEngine(self._canvas)
+        self._flat = flat
+        self._canvas: Optional[CTkCanvas] = None
+        self._draw_engine: Optional[DrawEngine] = None
         self._overwrite_preferred_drawing_method = overwrite_preferred_drawing_method
+        self._update_flat_mode()
 
         self._draw(no_color_updates=True)
 
+    def _is_flat(self) -> bool:
+        """ frame is flat if nothing but the fg_color (or bg_color if transparent) would be visible """
+        if self._flat is not None:
+            return self._flat
+        return (self._border_width == 0 and self._background_corner_colors is None and
+                (self._corner_radius == 0 or self._fg_color == "transparent"))
+
+    def _update_flat_mode(self):
+        """ create or destroy the canvas if the frame switches between flat and drawn mode """
+        if self._is_flat():
+            if self._canvas is not None:
+                self._canvas.destroy()
+                self._canvas = None
+                self._draw_engine = None
+            self._draw_flat()
+
+        elif self._canvas is None:
+            self._canvas = CTkCanvas(master=self,
+                                     highlightthickness=0,
+                                     width=self._apply_widget_scaling(self._current_width),
+                                     height=self._apply_widget_scaling(self._current_height))
+            self._canvas.place(x=0, y=0, relwidth=1, relheight=1)
+            tkinter.Misc.lower(self._canvas)  # below the children, if it gets created after them
+            self._canvas.configure(bg=self._apply_appearance_mode(self._bg_color))
+            self._draw_engine = DrawEngine(self._canvas)
+
+    def _draw_flat(self):
+        if self._fg_color == "transparent":
+            tkinter.Frame.configure(self, bg=self._apply_appearance_mode(self._bg_color))
+        else:
+            tkinter.Frame.configure(self, bg=self._apply_appearance_mode(self._fg_color))
+
     def winfo_children(self) -> List[any]:
         """
         winfo_children of CTkFrame without self.canvas widget,
@@ -71,6 +107,8 @@ class CTkFrame(CTkBaseClass):
         """
 
         child_widgets = super().winfo_children()
+        if self._canvas is None:
+            return child_widgets
         try:
             child_widgets.remove(self._canvas)
             return child_widgets
@@ -80,20 +118,35 @@ class CTkFrame(CTkBaseClass):
     def _set_scaling(self, *args, **kwargs):
         super()._set_scaling(*args, **kwargs)
 
-        self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
-                               height=self._apply_widget_scaling(self._desired_height))
-        self._draw()
+        if self._canvas is not None:
+            self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
+                                   height=self._apply_widget_scaling(self._desired_height))
+            self._schedule_redraw(no_color_updates=False)
 
     def _set_dimensions(self, width=None, height=None):
         super()._set_dimensions(width, height)
 
-        self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
-                               height=self._apply_widget_scaling(self._desired_height))
-        self._draw()
+        if self._canvas is not None:
+            self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
+                                   height=self._apply_widget_scaling(self._desired_height))
+            self._draw()
+
+    def _update_dimensions_event(self, event):
+        if self._canvas is None:
+            # flat frame, nothing to redraw, only keep track of the size in case it switches to drawn mode
+            self._current_width = self._reverse_widget_scaling(event.width)
+            self._current_height = self._reverse_widget_scaling(event.height)
+            return
+        super()._update_dimensions_event(event)
 
     def _draw(self, no_color_updates=False):
         super()._draw(no_color_updates)
 
+        if self._canvas is None:
+            if no_color_updates is False:
+                self._draw_flat()
+            return
+
         if not self._canvas.winfo_exists():
             return
 
@@ -135,6 +188,7 @@ class CTkFrame(CTkBaseClass):
         if "fg_color" in kwargs:
             self._fg_color = self._check_color_type(kwargs.pop("fg_color"), transparency=True)
             require_redraw = True
+            MasterColorCache.invalidate()  # detected colors of transparent children depend on this fg_color
 
             # check if CTk widgets are children of the frame and change their bg_color to new frame fg_color
             for child in self.winfo_children():
@@ -164,6 +218,13 @@ class CTkFrame(CTkBaseClass):
             self._border_width = kwargs.pop("border_width")
             require_redraw = True
 
+        if "flat" in kwargs:
+            self._flat = kwargs.pop("flat")
+            require_redraw = True
+
+        if require_redraw:
+            self._update_flat_mode()
+
         super().configure(require_redraw=require_redraw, **kwargs)
 
     def cget(self, attribute_name: str) -> any:
@@ -178,19 +239,29 @@ class CTkFrame(CTkBaseClass):
             return self._border_color
         elif attribute_name == "background_corner_colors":
             return self._background_corner_colors
+        elif attribute_name == "flat":
+            return self._flat
 
         else:
             return super().cget(attribute_name)
 
     def bind(self, sequence=None, command=None, add=True):
-        """ called on the tkinter.Canvas """
+        """ called on the tkinter.Canvas, or on the tkinter.Frame if the frame is flat """
         if not (add == "+" or add is True):
             raise ValueError("'add' argument can only be '+' or True to preserve internal callbacks")
-        self._canvas.bind(sequence, command, add=True)
+        if self._canvas is not None:
+            self._canvas.bind(sequence, command, add=True)
+        else:
+            tkinter.Frame.bind(self, sequence, command, add=True)
 
     def unbind(self, sequence=None, funcid=None):
-        """ called on the tkinter.Canvas """
+        """ called on the tkinter.Canvas, or on the tkinter.Frame if the frame is flat """
         if funcid is not None:
             raise ValueError("'funcid' argument can only be None, because there is a bug in" +
                              " tkinter and its not clear whether the internal callbacks will be unbinded or not")
-        self._canvas.unbind(sequence, None)
+        if self._canvas is not None:
+            self._canvas.unbind(sequence, None)
+        else:
+            tkinter.Frame.unbind(self, sequence, None)
+            if sequence == "<Configure>":
+                tkinter.Frame.bind(self, "<Configure>", self._update_dimensions_event)  # restore internal callback
@@ -113,7 +113,7 @@ class CTkLabel(CTkBaseClass):
 
         self._create_grid()
         self._update_image()
-        self._draw(no_color_updates=True)
+        self._schedule_redraw(no_color_updates=True)
 
     def _set_appearance_mode(self, mode_string):
         super()._set_appearance_mode(mode_string)
@@ -138,8 +138,9 @@ class CTkLabel(CTkBaseClass):
 
     def _update_image(self):
         if isinstance(self._image, CTkImage):
-            self._label.configure(image=self._image.create_scaled_photo_image(self._get_widget_scaling(),
-                                                                              self._get_appearance_mode()))
+            # keep a reference, the CTkImage only caches a limited number of PhotoImages
+            self._photo_image = self._image.create_scaled_photo_image(self._get_widget_scaling(), self._get_appearance_mode())
+            self._label.configure(image=self._photo_image)
         elif self._image is not None:
             self._label.configure(image=self._image)
 
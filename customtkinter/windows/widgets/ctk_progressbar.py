@@ -19,6 +19,9 @@ class CTkProgressBar(CTkBaseClass):
     For detailed information check out the documentation.
     """
 
+    _loop_interval = 20  # ms, interval of the automatic mode animation
+    _paused_loop_interval = 250  # ms, interval to check if the progressbar got visible again while the animation is paused
+
     def __init__(self,
                  master: Any,
                  width: Optional[int] = None,
@@ -99,7 +102,7 @@ class CTkProgressBar(CTkBaseClass):
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw(no_color_updates=True)
+        self._schedule_redraw(no_color_updates=True)
 
     def _set_dimensions(self, width=None, height=None):
         super()._set_dimensions(width, height)
@@ -263,20 +266,26 @@ class CTkProgressBar(CTkBaseClass):
         """ stop automatic mode """
         if self._loop_after_id is not None:
             self.after_cancel(self._loop_after_id)
+            self._loop_after_id = None
         self._loop_running = False
 
     def _internal_loop(self):
         if self._loop_running:
+            if not self._canvas.winfo_viewable():
+                # animation is paused while the progressbar or one of its masters is not mapped, no drawing at all
+                self._loop_after_id = self.after(self._paused_loop_interval, self._internal_loop)
+                return
+
             if self._mode == "determinate":
                 self._determinate_value += self._determinate_speed / 50
                 if self._determinate_value > 1:
                     self._determinate_value -= 1
-                self._draw()
-                self._loop_after_id = self.after(20, self._internal_loop)
+                self._draw(no_color_updates=True)
+                self._loop_after_id = self.after(self._loop_interval, self._internal_loop)
             else:
                 self._indeterminate_value += self._indeterminate_speed
-                self._draw()
-                self._loop_after_id = self.after(20, self._internal_loop)
+                self._draw(no_color_updates=True)
+                self._loop_after_id = self.after(self._loop_interval, self._internal_loop)
 
     def step(self):
         """ increase progress """
@@ -0,0 +1,474 @@
+import tkinter
+import sys
+from typing import Union, Tuple, Callable, Optional, Any, List
+
+from .core_rendering import CTkCanvas
+from .theme import ThemeManager
+from .core_rendering import DrawEngine
+from .core_widget_classes import CTkBaseClass
+from .font import CTkFont
+
+
+class CTkRadioGroup(CTkBaseClass):
+    """
+    Group of radiobuttons with a shared variable, all options are drawn on a single canvas.
+    Compared to one CTkRadioButton per option, this needs one widget, one canvas and one
+    scaling/appearance registration for the whole group. The options share their geometry,
+    selecting an option only recolors the two affected rows.
+    Options are passed as values, either strings or (text, value) tuples.
+    Colors and border widths default to the CTkRadioButton theme.
+    """
+
+    def __init__(self,
+                 master: Any,
+                 width: int = 0,
+                 height: int = 0,
+                 radiobutton_width: int = 22,
+                 radiobutton_height: int = 22,
+                 border_width_unchecked: Optional[int] = None,
+                 border_width_checked: Optional[int] = None,
+                 item_spacing: int = 4,
+                 text_spacing: int = 6,
+
+                 bg_color: Union[str, Tuple[str, str]] = "transparent",
+                 fg_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 hover_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 border_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 text_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 text_color_disabled: Optional[Union[str, Tuple[str, str]]] = None,
+
+                 values: Optional[List[Union[str, Tuple[str, Any]]]] = None,
+                 font: Optional[Union[tuple, CTkFont]] = None,
+                 variable: Union[tkinter.Variable, None] = None,
+                 state: str = tkinter.NORMAL,
+                 hover: bool = True,
+                 command: Union[Callable, Any] = None,
+                 **kwargs):
+
+        # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
+        super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
+
+        # dimensions
+        self._radiobutton_width = radiobutton_width
+        self._radiobutton_height = radiobutton_height
+        self._item_spacing = item_spacing
+        self._text_spacing = text_spacing
+
+        # color
+        self._fg_color = ThemeManager.theme["CTkRadioButton"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
+        self._hover_color = ThemeManager.theme["CTkRadioButton"]["hover_color"] if hover_color is None else self._check_color_type(hover_color)
+        self._border_color = ThemeManager.theme["CTkRadioButton"]["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._text_color = ThemeManager.theme["CTkRadioButton"]["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._text_color_disabled = ThemeManager.theme["CTkRadioButton"]["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
+
+        # shape
+        self._border_width_unchecked = ThemeManager.theme["CTkRadioButton"]["border_width_unchecked"] if border_width_unchecked is None else border_width_unchecked
+        self._border_width_checked = ThemeManager.theme["CTkRadioButton"]["border_width_checked"] if border_width_checked is None else border_width_checked
+
+        # font
+        self._font = CTkFont() if font is None else self._check_font_type(font)
+        if isinstance(self._font, CTkFont):
+            self._font.add_size_configure_callback(self._update_font)
+
+        # options, callback and control variables
+        self._texts: List[str] = []
+        self._values: List[Any] = []
+        self._set_values_lists(values)
+        self._command = command
+        self._state = state
+        self._hover = hover
+        self._checked_index: Optional[int] = None
+        self._hover_index: Optional[int] = None
+        self._variable: tkinter.Variable = variable
+        self._variable_callback_blocked: bool = False
+        self._variable_callback_name: Union[str, None] = None
+
+        # layout in scaled pixels, gets calculated in _layout_options()
+        self._layout_required = True
+        self._row_height = 0
+        self._row_pitch = 1
+        self._circle_radius = 0
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self._canvas = CTkCanvas(master=self,
+                                 highlightthickness=0,
+                                 width=self._apply_widget_scaling(self._desired_width),
+                                 height=self._apply_widget_scaling(self._desired_height))
+        self._canvas.grid(row=0, column=0, sticky="nswe")
+
+        if self._variable is not None:
+            self._variable_callback_name = self._variable.trace_add("write", self._variable_callback)
+            self._checked_index = self._index_of_value(self._variable.get())
+
+        self._create_bindings()
+        self._set_cursor()
+        self._draw()
+
+    def _set_values_lists(self, values: Optional[List[Union[str, Tuple[str, Any]]]]):
+        self._texts, self._values = [], []
+        for option in values if values is not None else []:
+            if isinstance(option, (tuple, list)):
+                self._texts.append(str(option[0]))
+                self._values.append(option[1])
+            else:
+                self._texts.append(str(option))
+                self._values.append(option)
+
+    def _index_of_value(self, value) -> Optional[int]:
+        try:
+            return self._values.index(value)
+        except ValueError:
+            return None
+
+    def _create_bindings(self, sequence: Optional[str] = None):
+        """ set necessary bindings for functionality of widget, will overwrite other bindings """
+        if sequence is None or sequence == "<Motion>":
+            self._canvas.bind("<Motion>", self._on_motion)
+        if sequence is None or sequence == "<Leave>":
+            self._canvas.bind("<Leave>", self._on_leave)
+        if sequence is None or sequence == "<Button-1>":
+            self._canvas.bind("<Button-1>", self._on_click)
+
+    def _set_scaling(self, *args, **kwargs):
+        super()._set_scaling(*args, **kwargs)
+
+        self._layout_required = True
+        self._schedule_redraw(no_color_updates=True)
+
+    def _set_dimensions(self, width: int = None, height: int = None):
+        super()._set_dimensions(width, height)
+
+        self._layout_required = True
+        self._draw(no_color_updates=True)
+
+    def _update_font(self):
+        """ font size changed, all rows have to be laid out again """
+        self._layout_required = True
+        self._draw(no_color_updates=True)
+
+    def destroy(self):
+        if self._variable is not None:
+            self._variable.trace_remove("write", self._variable_callback_name)
+
+        if isinstance(self._font, CTkFont):
+            self._font.remove_size_configure_callback(self._update_font)
+
+        super().destroy()
+
+    def _set_circle(self, tag: str, x: float, y: float, radius: int):
+        if DrawEngine.preferred_drawing_method == "font_shapes":
+            self._canvas.coords(tag, x, y, radius)
+        else:
+            self._canvas.coords(tag, x - radius, y - radius, x + radius, y + radius)
+
+    def _create_circle(self, tags: Tuple[str, ...]):
+        if DrawEngine.preferred_drawing_method == "font_shapes":
+            self._canvas.create_aa_circle(0, 0, 0, tags=tags, anchor=tkinter.CENTER)
+        else:
+            self._canvas.create_oval(0, 0, 0, 0, tags=tags, width=0)
+
+    def _layout_options(self):
+        """ (re)creates all canvas items, the geometry of one row is calculated once and shared by all rows """
+        self._canvas.delete("all")
+
+        radiobutton_size = min(self._apply_widget_scaling(self._radiobutton_width), self._apply_widget_scaling(self._radiobutton_height))
+        self._circle_radius = max(1, round(radiobutton_size / 2))
+        text_x = 2 * self._circle_radius + self._apply_widget_scaling(self._text_spacing)
+        font = self._apply_font_scaling(self._font)
+
+        for i, text in enumerate(self._texts):
+            self._create_circle(("border_parts", f"border_{i}"))
+            self._create_circle(("inner_parts", f"inner_{i}"))
+            self._canvas.create_text(text_x, 0, text=text, anchor=tkinter.W, font=font, tags=("text_parts", f"text_{i}"))
+
+        text_bbox = self._canvas.bbox("text_parts")
+        text_height = text_bbox[3] - text_bbox[1] if text_bbox is not None else 0
+        self._row_height = max(2 * self._circle_radius, text_height)
+        self._row_pitch = self._row_height + self._apply_widget_scaling(self._item_spacing)
+
+        for i in range(len(self._texts)):
+            self._place_row(i)
+
+        self._update_canvas_size()
+        self._layout_required = False
+
+    def _place_row(self, index: int):
+        center_y = index * self._row_pitch + self._row_height / 2
+        border_width = self._border_width_checked if index == self._checked_index else self._border_width_unchecked
+        inner_radius = max(0, self._circle_radius - round(self._apply_widget_scaling(border_width)))
+
+        self._set_circle(f"border_{index}", self._circle_radius, center_y, self._circle_radius)
+        self._set_circle(f"inner_{index}", self._circle_radius, center_y, inner_radius)
+        self._canvas.coords(f"text_{index}", 2 * self._circle_radius + self._apply_widget_scaling(self._text_spacing), center_y)
+
+    def _update_canvas_size(self):
+        text_bbox = self._canvas.bbox("text_parts")
+        natural_width = text_bbox[2] + 2 if text_bbox is not None else 2 * self._circle_radius
+        natural_height = max(0, len(self._texts) * self._row_pitch - self._apply_widget_scaling(self._item_spacing))
+
+        self._canvas.configure(width=max(self._apply_widget_scaling(self._desired_width), natural_width),
+                               height=max(self._apply_widget_scaling(self._desired_height), natural_height))
+
+    def _border_color_of_row(self, index: int) -> Union[str, Tuple[str, str]]:
+        if index == self._hover_index and self._hover is True and self._state == tkinter.NORMAL:
+            return self._hover_color
+        elif index == self._checked_index:
+            return self._fg_color
+        else:
+            return self._border_color
+
+    def _color_row(self, index: int):
+        border_color = self._apply_appearance_mode(self._border_color_of_row(index))
+        self._canvas.itemconfig(f"border_{index}", fill=border_color, outline=border_color)
+
+    def _draw(self, no_color_updates=False):
+        super()._draw(no_color_updates)
+
+        requires_recoloring = False
+        if self._layout_required:
+            self._layout_options()
+            requires_recoloring = True
+
+        if no_color_updates is False or requires_recoloring:
+            self._canvas.configure(bg=self._apply_appearance_mode(self._bg_color))
+            self._canvas.itemconfig("inner_parts",
+                                    fill=self._apply_appearance_mode(self._bg_color),
+                                    outline=self._apply_appearance_mode(self._bg_color))
+            for i in range(len(self._texts)):
+                self._color_row(i)
+
+            if self._state == tkinter.DISABLED:
+                self._canvas.itemconfig("text_parts", fill=self._apply_appearance_mode(self._text_color_disabled))
+            else:
+                self._canvas.itemconfig("text_parts", fill=self._apply_appearance_mode(self._text_color))
+
+    def _update_rows(self, *indices: Optional[int]):
+        """ update circles and colors of single rows, used for selection and hover changes """
+        if self._layout_required:
+            return  # complete redraw is pending anyway
+        for index in set(indices):
+            if index is not None and 0 <= index < len(self._texts):
+                self._place_row(index)
+                self._color_row(index)
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "border_width_unchecked" in kwargs:
+            self._border_width_unchecked = kwargs.pop("border_width_unchecked")
+            self._layout_required = True
+            require_redraw = True
+
+        if "border_width_checked" in kwargs:
+            self._border_width_checked = kwargs.pop("border_width_checked")
+            self._layout_required = True
+            require_redraw = True
+
+        for attribute_name in ("radiobutton_width", "radiobutton_height", "item_spacing", "text_spacing"):
+            if attribute_name in kwargs:
+                setattr(self, "_" + attribute_name, kwargs.pop(attribute_name))
+                self._layout_required = True
+                require_redraw = True
+
+        if "values" in kwargs:
+            old_values = self._values
+            self._set_values_lists(kwargs.pop("values"))
+
+            if self._values == old_values and not self._layout_required:
+                # only the texts changed (e.g. language change), the rows keep their geometry
+                for i, text in enumerate(self._texts):
+                    self._canvas.itemconfig(f"text_{i}", text=text)
+                self._update_canvas_size()
+            else:
+                self._checked_index = self._index_of_value(self._variable.get()) if self._variable is not None else None
+                self._hover_index = None
+                self._layout_required = True
+                require_redraw = True
+
+        if "font" in kwargs:
+            if isinstance(self._font, CTkFont):
+                self._font.remove_size_configure_callback(self._update_font)
+            self._font = self._check_font_type(kwargs.pop("font"))
+            if isinstance(self._font, CTkFont):
+                self._font.add_size_configure_callback(self._update_font)
+
+            self._layout_required = True
+            require_redraw = True
+
+        if "state" in kwargs:
+            self._state = kwargs.pop("state")
+            self._set_cursor()
+            require_redraw = True
+
+        if "fg_color" in kwargs:
+            self._fg_color = self._check_color_type(kwargs.pop("fg_color"))
+            require_redraw = True
+
+        if "hover_color" in kwargs:
+            self._hover_color = self._check_color_type(kwargs.pop("hover_color"))
+            require_redraw = True
+
+        if "border_color" in kwargs:
+            self._border_color = self._check_color_type(kwargs.pop("border_color"))
+            require_redraw = True
+
+        if "text_color" in kwargs:
+            self._text_color = self._check_color_type(kwargs.pop("text_color"))
+            require_redraw = True
+
+        if "text_color_disabled" in kwargs:
+            self._text_color_disabled = self._check_color_type(kwargs.pop("text_color_disabled"))
+            require_redraw = True
+
+        if "hover" in kwargs:
+            self._hover = kwargs.pop("hover")
+
+        if "command" in kwargs:
+            self._command = kwargs.pop("command")
+
+        if "variable" in kwargs:
+            if self._variable is not None:
+                self._variable.trace_remove("write", self._variable_callback_name)
+
+            self._variable = kwargs.pop("variable")
+
+            if self._variable is not None and self._variable != "":
+                self._variable_callback_name = self._variable.trace_add("write", self._variable_callback)
+                self._checked_index = self._index_of_value(self._variable.get())
+            else:
+                self._variable = None
+                self._checked_index = None
+            self._layout_required = True
+            require_redraw = True
+
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    def cget(self, attribute_name: str) -> any:
+        if attribute_name == "border_width_unchecked":
+            return self._border_width_unchecked
+        elif attribute_name == "border_width_checked":
+            return self._border_width_checked
+        elif attribute_name == "radiobutton_width":
+            return self._radiobutton_width
+        elif attribute_name == "radiobutton_height":
+            return self._radiobutton_height
+        elif attribute_name == "item_spacing":
+            return self._item_spacing
+        elif attribute_name == "text_spacing":
+            return self._text_spacing
+
+        elif attribute_name == "fg_color":
+            return self._fg_color
+        elif attribute_name == "hover_color":
+            return self._hover_color
+        elif attribute_name == "border_color":
+            return self._border_color
+        elif attribute_name == "text_color":
+            return self._text_color
+        elif attribute_name == "text_color_disabled":
+            return self._text_color_disabled
+
+        elif attribute_name == "values":
+            return list(zip(self._texts, self._values))
+        elif attribute_name == "font":
+            return self._font
+        elif attribute_name == "variable":
+            return self._variable
+        elif attribute_name == "state":
+            return self._state
+        elif attribute_name == "hover":
+            return self._hover
+        elif attribute_name == "command":
+            return self._command
+
+        else:
+            return super().cget(attribute_name)
+
+    def _set_cursor(self):
+        if self._cursor_manipulation_enabled:
+            if self._state == tkinter.DISABLED:
+                if sys.platform == "darwin" or sys.platform.startswith("win"):
+                    self._canvas.configure(cursor="arrow")
+
+            elif self._state == tkinter.NORMAL:
+                if sys.platform == "darwin":
+                    self._canvas.configure(cursor="pointinghand")
+                elif sys.platform.startswith("win"):
+                    self._canvas.configure(cursor="hand2")
+
+    def _index_at(self, y: int) -> Optional[int]:
+        """ row under the given canvas y coordinate, None if y is between two rows or below the last one """
+        index = int(y // self._row_pitch)
+        if 0 <= index < len(self._texts) and y - index * self._row_pitch <= self._row_height:
+            return index
+        return None
+
+    def _on_motion(self, event):
+        new_hover_index = self._index_at(event.y)
+        if new_hover_index != self._hover_index:
+            old_hover_index, self._hover_index = self._hover_index, new_hover_index
+            self._update_rows(old_hover_index, new_hover_index)
+
+    def _on_leave(self, event=0):
+        if self._hover_index is not None:
+            old_hover_index, self._hover_index = self._hover_index, None
+            self._update_rows(old_hover_index)
+
+    def _on_click(self, event):
+        index = self._index_at(event.y)
+        if index is not None:
+            self.invoke(index)
+
+    def _variable_callback(self, var_name, index, mode):
+        if not self._variable_callback_blocked:
+            self._select_index(self._index_of_value(self._variable.get()), from_variable_callback=True)
+
+    def _select_index(self, index: Optional[int], from_variable_callback=False):
+        old_checked_index, self._checked_index = self._checked_index, index
+        if old_checked_index != index:
+            self._update_rows(old_checked_index, index)
+
+        if self._variable is not None and not from_variable_callback:
+            self._variable_callback_blocked = True
+            self._variable.set(self._values[index] if index is not None else "")
+            self._variable_callback_blocked = False
+
+    def invoke(self, index: int):
+        """ select option at index and call command, like clicking on it """
+        if self._state == tkinter.NORMAL:
+            if self._checked_index != index:
+                self._select_index(index)
+
+            if self._command is not None:
+                self._command()
+
+    def set(self, value):
+        """ select option by value """
+        self._select_index(self._index_of_value(value))
+
+    def get(self) -> Any:
+        """ value of the selected option, None if no option is selected """
+        return self._values[self._checked_index] if self._checked_index is not None else None
+
+    def bind(self, sequence: str = None, command: Callable = None, add: Union[str, bool] = True):
+        """ called on the tkinter.Canvas """
+        if not (add == "+" or add is True):
+            raise ValueError("'add' argument can only be '+' or True to preserve internal callbacks")
+        self._canvas.bind(sequence, command, add=True)
+
+    def unbind(self, sequence: str = None, funcid: str = None):
+        """ called on the tkinter.Canvas """
+        if funcid is not None:
+            raise ValueError("'funcid' argument can only be None, because there is a bug in" +
+                             " tkinter and its not clear whether the internal callbacks will be unbinded or not")
+        self._canvas.unbind(sequence, None)
+        self._create_bindings(sequence=sequence)  # restore internal callbacks for sequence
+
+    def focus(self):
+        return self._canvas.focus()
+
+    def focus_set(self):
+        return self._canvas.focus_set()
+
+    def focus_force(self):
+        return self._canvas.focus_force()
@@ -14,6 +14,7 @@ from .core_widget_classes import CTkBaseClass
 from .ctk_label import CTkLabel
 from .font import CTkFont
 from .theme import ThemeManager
+from .utility import MouseWheelDispatcher
 
 
 class CTkScrollableFrame(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
@@ -74,11 +75,7 @@ class CTkScrollableFrame(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBa
 
         self.bind("<Configure>", lambda e: self._parent_canvas.configure(scrollregion=self._parent_canvas.bbox("all")))
         self._parent_canvas.bind("<Configure>", self._fit_frame_dimensions_to_canvas)
-        self.bind_all("<MouseWheel>", self._mouse_wheel_all, add="+")
-        self.bind_all("<KeyPress-Shift_L>", self._keyboard_shift_press_all, add="+")
-        self.bind_all("<KeyPress-Shift_R>", self._keyboard_shift_press_all, add="+")
-        self.bind_all("<KeyRelease-Shift_L>", self._keyboard_shift_release_all, add="+")
-        self.bind_all("<KeyRelease-Shift_R>", self._keyboard_shift_release_all, add="+")
+        MouseWheelDispatcher.register(self._parent_canvas, self)  # one <MouseWheel> binding for all scrollable frames
         self._create_window_id = self._parent_canvas.create_window(0, 0, window=self, anchor="nw")
 
         if self._parent_frame.cget("fg_color") == "transparent":
@@ -88,9 +85,8 @@ class CTkScrollableFrame(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBa
             tkinter.Frame.configure(self, bg=self._apply_appearance_mode(self._parent_frame.cget("fg_color")))
             self._parent_canvas.configure(bg=self._apply_appearance_mode(self._parent_frame.cget("fg_color")))
 
-        self._shift_pressed = False
-
     def destroy(self):
+        MouseWheelDispatcher.unregister(self._parent_canvas)
         tkinter.Frame.destroy(self)
         CTkAppearanceModeBaseClass.destroy(self)
         CTkScalingBaseClass.destroy(self)
@@ -244,35 +240,22 @@ class CTkScrollableFrame(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBa
         elif sys.platform == "darwin":
             self._parent_canvas.configure(xscrollincrement=4, yscrollincrement=8)
 
-    def _mouse_wheel_all(self, event):
-        if self.check_if_master_is_canvas(event.widget):
-            if sys.platform.startswith("win"):
-                if self._shift_pressed:
-                    if self._parent_canvas.xview() != (0.0, 1.0):
-                        self._parent_canvas.xview("scroll", -int(event.delta / 6), "units")
-                else:
-                    if self._parent_canvas.yview() != (0.0, 1.0):
-                        self._parent_canvas.yview("scroll", -int(event.delta / 6), "units")
-            elif sys.platform == "darwin":
-                if self._shift_pressed:
-                    if self._parent_canvas.xview() != (0.0, 1.0):
-                        self._parent_canvas.xview("scroll", -event.delta, "units")
-                else:
-                    if self._parent_canvas.yview() != (0.0, 1.0):
-                        self._parent_canvas.yview("scroll", -event.delta, "units")
-            else:
-                if self._shift_pressed:
-                    if self._parent_canvas.xview() != (0.0, 1.0):
-                        self._parent_canvas.xview("scroll", -event.delta, "units")
-                else:
-                    if self._parent_canvas.yview() != (0.0, 1.0):
-                        self._parent_canvas.yview("scroll", -event.delta, "units")
-
-    def _keyboard_shift_press_all(self, event):
-        self._shift_pressed = True
-
-    def _keyboard_shift_release_all(self, event):
-        self._shift_pressed = False
+    def _mouse_wheel_event(self, event, shift_pressed: bool) -> bool:
+        """ gets called by MouseWheelDispatcher if the pointer is over this frame, returns False if the canvas can't scroll """
+        if sys.platform.startswith("win"):
+            scroll_units = -int(event.delta / 6)
+        else:
+            scroll_units = -event.delta
+
+        if shift_pressed:
+            if self._parent_canvas.xview() != (0.0, 1.0):
+                self._parent_canvas.xview("scroll", scroll_units, "units")
+                return True
+        else:
+            if self._parent_canvas.yview() != (0.0, 1.0):
+                self._parent_canvas.yview("scroll", scroll_units, "units")
+                return True
+        return False
 
     def check_if_master_is_canvas(self, widget):
         if widget == self._parent_canvas:
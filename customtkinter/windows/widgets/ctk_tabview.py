@@ -6,6 +6,7 @@ from .ctk_frame import CTkFrame
 from .core_rendering import CTkCanvas
 from .core_rendering import DrawEngine
 from .core_widget_classes import CTkBaseClass
+from .utility import MasterColorCache
 from .ctk_segmented_button import CTkSegmentedButton
 
 
@@ -128,7 +129,7 @@ class CTkTabview(CTkBaseClass):
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height - self._outer_spacing - self._outer_button_overhang))
         self._configure_grid()
-        self._draw(no_color_updates=True)
+        self._schedule_redraw(no_color_updates=True)
 
     def _set_dimensions(self, width=None, height=None):
         super()._set_dimensions(width, height)
@@ -258,6 +259,7 @@ class CTkTabview(CTkBaseClass):
             require_redraw = True
         if "fg_color" in kwargs:
             self._fg_color = self._check_color_type(kwargs.pop("fg_color"), transparency=True)
+            MasterColorCache.invalidate()  # detected colors of transparent children depend on this fg_color
             self._configure_segmented_button_background_corners()
             require_redraw = True
         if "border_color" in kwargs:
@@ -22,8 +22,6 @@ class CTkTextbox(CTkBaseClass):
     (most of them are implemented here too)
     """
 
-    _scrollbar_update_time = 200  # interval in ms, to check if scrollbars are needed
-
     # attributes that are passed to and managed by the tkinter textbox only:
     _valid_tk_text_attributes = {"autoseparators", "cursor", "exportselection",
                                  "insertborderwidth", "insertofftime", "insertontime", "insertwidth",
@@ -104,7 +102,7 @@ class CTkTextbox(CTkBaseClass):
                                          button_hover_color=self._scrollbar_button_hover_color,
                                          orientation="vertical",
                                          command=self._textbox.yview)
-        self._textbox.configure(yscrollcommand=self._y_scrollbar.set)
+        self._textbox.configure(yscrollcommand=self._y_scroll_command)
 
         self._x_scrollbar = CTkScrollbar(self,
                                          height=8,
@@ -115,11 +113,10 @@ class CTkTextbox(CTkBaseClass):
                                          button_hover_color=self._scrollbar_button_hover_color,
                                          orientation="horizontal",
                                          command=self._textbox.xview)
-        self._textbox.configure(xscrollcommand=self._x_scrollbar.set)
+        self._textbox.configure(xscrollcommand=self._x_scroll_command)
 
         self._create_grid_for_text_and_scrollbars(re_grid_textbox=True, re_grid_x_scrollbar=True, re_grid_y_scrollbar=True)
 
-        self.after(50, self._check_if_scrollbars_needed, None, True)
         self._draw()
 
     def _create_grid_for_text_and_scrollbars(self, re_grid_textbox=False, re_grid_x_scrollbar=False, re_grid_y_scrollbar=False):
@@ -151,30 +148,31 @@ class CTkTextbox(CTkBaseClass):
             else:
                 self._y_scrollbar.grid_forget()
 
-    def _check_if_scrollbars_needed(self, event=None, continue_loop: bool = False):
-        """ Method hides or places the scrollbars if they are needed on key release event of tkinter.text widget """
-
-        if self._scrollbars_activated:
-            if self._textbox.xview() != (0.0, 1.0) and not self._x_scrollbar.winfo_ismapped():  # x scrollbar needed
-                self._hide_x_scrollbar = False
-                self._create_grid_for_text_and_scrollbars(re_grid_x_scrollbar=True)
-            elif self._textbox.xview() == (0.0, 1.0) and self._x_scrollbar.winfo_ismapped():  # x scrollbar not needed
-                self._hide_x_scrollbar = True
-                self._create_grid_for_text_and_scrollbars(re_grid_x_scrollbar=True)
-
-            if self._textbox.yview() != (0.0, 1.0) and not self._y_scrollbar.winfo_ismapped():  # y scrollbar needed
-                self._hide_y_scrollbar = False
-                self._create_grid_for_text_and_scrollbars(re_grid_y_scrollbar=True)
-            elif self._textbox.yview() == (0.0, 1.0) and self._y_scrollbar.winfo_ismapped():  # y scrollbar not needed
-                self._hide_y_scrollbar = True
-                self._create_grid_for_text_and_scrollbars(re_grid_y_scrollbar=True)
-        else:
-            self._hide_x_scrollbar = False
-            self._hide_x_scrollbar = False
+    def _x_scroll_command(self, first, last):
+        """ gets called by the tkinter.Text widget whenever its horizontal view changes (text changes, resizing, scrolling) """
+        self._x_scrollbar.set(first, last)
+        self._update_scrollbar_visibility(x_scrollbar_needed=(float(first), float(last)) != (0.0, 1.0))
+
+    def _y_scroll_command(self, first, last):
+        """ gets called by the tkinter.Text widget whenever its vertical view changes (text changes, resizing, scrolling) """
+        self._y_scrollbar.set(first, last)
+        self._update_scrollbar_visibility(y_scrollbar_needed=(float(first), float(last)) != (0.0, 1.0))
+
+    def _update_scrollbar_visibility(self, x_scrollbar_needed: Optional[bool] = None, y_scrollbar_needed: Optional[bool] = None):
+        """ places or hides the scrollbars, the grid only gets changed if the visibility of a scrollbar changes """
+        if x_scrollbar_needed is not None and x_scrollbar_needed == self._hide_x_scrollbar:
+            self._hide_x_scrollbar = not x_scrollbar_needed
+            self._create_grid_for_text_and_scrollbars(re_grid_x_scrollbar=True)
+
+        if y_scrollbar_needed is not None and y_scrollbar_needed == self._hide_y_scrollbar:
+            self._hide_y_scrollbar = not y_scrollbar_needed
             self._create_grid_for_text_and_scrollbars(re_grid_y_scrollbar=True)
 
-        if self._textbox.winfo_exists() and continue_loop is True:
-            self.after(self._scrollbar_update_time, lambda: self._check_if_scrollbars_needed(continue_loop=True))
+    def _check_if_scrollbars_needed(self, event=None):
+        """ Method hides or places the scrollbars if they are needed, usually the scroll commands of the
+            tkinter.Text widget trigger this without polling, so this is only needed to force a check """
+        self._update_scrollbar_visibility(x_scrollbar_needed=self._textbox.xview() != (0.0, 1.0),
+                                          y_scrollbar_needed=self._textbox.yview() != (0.0, 1.0))
 
     def _set_scaling(self, *args, **kwargs):
         super()._set_scaling(*args, **kwargs)
@@ -183,7 +181,7 @@ class CTkTextbox(CTkBaseClass):
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
         self._create_grid_for_text_and_scrollbars(re_grid_textbox=True, re_grid_x_scrollbar=True, re_grid_y_scrollbar=True)
-        self._draw(no_color_updates=True)
+        self._schedule_redraw(no_color_updates=True)
 
     def _set_dimensions(self, width=None, height=None):
         super()._set_dimensions(width, height)
@@ -3,6 +3,7 @@ import sys
 
 from .ctk_font import CTkFont
 from .font_manager import FontManager
+from .scaled_font_cache import ScaledFontCache
 
 # import DrawEngine to set preferred_drawing_method if loading shapes font fails
 from ..core_rendering import DrawEngine
@@ -0,0 +1,63 @@
+import tkinter
+from tkinter.font import Font
+from typing import Tuple, Union, Dict
+
+
+class ScaledFontCache:
+    """
+    Shared named Tk fonts for scaled font tuples.
+
+    Widgets used to pass the scaled tuple (family, -size, style) to every tkinter widget they
+    contain, so Tk had to parse the tuple and resolve a font for each widget again on every
+    scaling change and font configure. Now every distinct (family, scaled size, style) gets one
+    named font per application, which all widgets with the same font share. The scaling is part
+    of the key through the scaled size, so DPI changes just switch to another cached font.
+
+    Fonts of a root window get deleted by remove_root(), which is called by CTk.destroy().
+    """
+
+    _fonts: Dict[tkinter.Misc, Dict[tuple, Font]] = {}  # root window -> {(family, size, weight, slant, underline, overstrike): named font}
+
+    @staticmethod
+    def _parse_style(style: Union[str, tuple]) -> dict:
+        """ converts style words like 'bold italic underline' to font options """
+        if isinstance(style, (tuple, list)):
+            style = " ".join(str(part) for part in style)
+
+        options = {"weight": "normal", "slant": "roman", "underline": 0, "overstrike": 0}
+        for word in style.split():
+            if word in ("bold", "normal"):
+                options["weight"] = word
+            elif word in ("italic", "roman"):
+                options["slant"] = word
+            elif word == "underline":
+                options["underline"] = 1
+            elif word == "overstrike":
+                options["overstrike"] = 1
+        return options
+
+    @classmethod
+    def get(cls, root: tkinter.Misc, family: str, size: int, style: Union[str, tuple] = "") -> Font:
+        """ returns the shared named font for the scaled font description, size is negative for pixels """
+        options = cls._parse_style(style)
+        key = (family, size, options["weight"], options["slant"], options["underline"], options["overstrike"])
+        root_fonts = cls._fonts.setdefault(root, {})
+
+        font = root_fonts.get(key)
+        if font is None:
+            font = Font(root=root, family=family, size=size, **options)
+            root_fonts[key] = font
+        return font
+
+    @classmethod
+    def get_from_tuple(cls, root: tkinter.Misc, scaled_tuple: Tuple) -> Font:
+        """ scaled_tuple in the form (family, size) or (family, size, style...) """
+        return cls.get(root, scaled_tuple[0], scaled_tuple[1], scaled_tuple[2:] if len(scaled_tuple) > 2 else "")
+
+    @classmethod
+    def remove_root(cls, root: tkinter.Misc):
+        cls._fonts.pop(root, None)
+
+    @classmethod
+    def get_font_count(cls) -> int:
+        return sum(len(root_fonts) for root_fonts in cls._fonts.values())
@@ -1,9 +1,14 @@
-from typing import Tuple, Dict, Callable, List
+import os
+import hashlib
+from collections import OrderedDict
+from typing import Tuple, Dict, Callable, List, Union
 try:
     from PIL import Image, ImageTk
 except ImportError:
     pass
 
+from ..utility import get_cache_directory, write_cache_file
+
 
 class CTkImage:
     """
@@ -14,26 +19,43 @@ class CTkImage:
     size: tuple (<width>, <height>) with display size for both images
 
     One of the two images can be None and will be replaced by the other image.
+
+    Instead of PIL images, file paths can be passed with light_image_path and dark_image_path.
+    The files are then only decoded when a scaled size is not in the disk cache, which stores
+    every scaled size as small png file (keyed by path, modification time and size), so large
+    images don't get decoded and resized again on every program start. Files of older versions
+    of an image get deleted, and at most max_disk_cached_sizes sizes per image are kept.
+
+    Scaled images are resized with the LANCZOS filter. At most max_cached_photo_images
+    PhotoImages per appearance mode are kept in memory, least recently used ones are dropped.
     """
 
     _checked_PIL_import = False
 
+    max_cached_photo_images: int = 4  # per appearance mode
+    disk_cache_enabled: bool = True
+    max_disk_cached_sizes: int = 8  # per image file
+
     def __init__(self,
                  light_image: "Image.Image" = None,
                  dark_image: "Image.Image" = None,
-                 size: Tuple[int, int] = (20, 20)):
+                 size: Tuple[int, int] = (20, 20),
+                 light_image_path: Union[str, None] = None,
+                 dark_image_path: Union[str, None] = None):
 
         if not self._checked_PIL_import:
             self._check_pil_import()
 
         self._light_image = light_image
         self._dark_image = dark_image
+        self._light_image_path = light_image_path
+        self._dark_image_path = dark_image_path
         self._check_images()
         self._size = size
 
         self._configure_callback_list: List[Callable] = []
-        self._scaled_light_photo_images: Dict[Tuple[int, int], ImageTk.PhotoImage] = {}
-        self._scaled_dark_photo_images: Dict[Tuple[int, int], ImageTk.PhotoImage] = {}
+        self._scaled_light_photo_images: Dict[Tuple[int, int], ImageTk.PhotoImage] = OrderedDict()
+        self._scaled_dark_photo_images: Dict[Tuple[int, int], ImageTk.PhotoImage] = OrderedDict()
 
     @classmethod
     def _check_pil_import(cls):
@@ -53,11 +75,21 @@ class CTkImage:
     def configure(self, **kwargs):
         if "light_image" in kwargs:
             self._light_image = kwargs.pop("light_image")
-            self._scaled_light_photo_images = {}
+            self._light_image_path = None
+            self._scaled_light_photo_images = OrderedDict()
             self._check_images()
         if "dark_image" in kwargs:
             self._dark_image = kwargs.pop("dark_image")
-            self._scaled_dark_photo_images = {}
+            self._dark_image_path = None
+            self._scaled_dark_photo_images = OrderedDict()
+            self._check_images()
+        if "light_image_path" in kwargs:
+            self._light_image, self._light_image_path = None, kwargs.pop("light_image_path")
+            self._scaled_light_photo_images = OrderedDict()
+            self._check_images()
+        if "dark_image_path" in kwargs:
+            self._dark_image, self._dark_image_path = None, kwargs.pop("dark_image_path")
+            self._scaled_dark_photo_images = OrderedDict()
             self._check_images()
         if "size" in kwargs:
             self._size = kwargs.pop("size")
@@ -68,9 +100,13 @@ class CTkImage:
 
     def cget(self, attribute_name: str) -> any:
         if attribute_name == "light_image":
-            return self._light_image
+            return self._load_image("light")
         if attribute_name == "dark_image":
-            return self._dark_image
+            return self._load_image("dark")
+        if attribute_name == "light_image_path":
+            return self._light_image_path
+        if attribute_name == "dark_image_path":
+            return self._dark_image_path
         if attribute_name == "size":
             return self._size
 
@@ -82,41 +118,124 @@ class CTkImage:
             raise ValueError(f"CTkImage: dark_image must be instance if PIL.Image.Image, not {type(self._dark_image)}")
 
         # check values
-        if self._light_image is None and self._dark_image is None:
+        if self._light_image is None and self._dark_image is None and self._light_image_path is None and self._dark_image_path is None:
             raise ValueError("CTkImage: No image given, light_image is None and dark_image is None.")
+        for image_path in (self._light_image_path, self._dark_image_path):
+            if image_path is not None and not os.path.isfile(image_path):
+                raise FileNotFoundError(f"CTkImage: image file '{image_path}' not found.")
 
-        # check sizes
+        # check sizes (images given by path are checked when they get loaded)
         if self._light_image is not None and self._dark_image is not None and self._light_image.size != self._dark_image.size:
             raise ValueError(f"CTkImage: light_image size {self._light_image.size} must be the same as dark_image size {self._dark_image.size}.")
 
+    def _load_image(self, mode: str) -> Union["Image.Image", None]:
+        """ returns PIL image of mode ('light' or 'dark'), decodes it from file on first use """
+        if mode == "light":
+            if self._light_image is None and self._light_image_path is not None:
+                self._light_image = Image.open(self._light_image_path)
+                self._light_image.load()
+                self._check_images()
+            return self._light_image
+        else:
+            if self._dark_image is None and self._dark_image_path is not None:
+                self._dark_image = Image.open(self._dark_image_path)
+                self._dark_image.load()
+                self._check_images()
+            return self._dark_image
+
+    @staticmethod
+    def _get_resampling_filter():
+        return Image.Resampling.LANCZOS if hasattr(Image, "Resampling") else Image.LANCZOS
+
+    @staticmethod
+    def _get_disk_cache_path(image_path: str, scaled_size: Tuple[int, int]) -> str:
+        """ file name: <hash of path>_<hash of modification time and size>_<width>x<height>.png """
+        image_path = os.path.abspath(image_path)
+        stat_result = os.stat(image_path)
+        path_hash = hashlib.md5(image_path.encode("utf-8")).hexdigest()[:16]
+        version_hash = hashlib.md5(f"{stat_result.st_mtime_ns}|{stat_result.st_size}".encode("utf-8")).hexdigest()[:8]
+        return os.path.join(get_cache_directory("images"), f"{path_hash}_{version_hash}_{scaled_size[0]}x{scaled_size[1]}.png")
+
+    @classmethod
+    def _remove_outdated_disk_cache_files(cls, cache_path: str):
+        """ deletes cached files of older versions of the same image and the oldest sizes beyond max_disk_cached_sizes """
+        cache_directory, file_name = os.path.split(cache_path)
+        path_hash, version_hash, _ = file_name.split("_", 2)
+        try:
+            same_image_files = [name for name in os.listdir(cache_directory)
+                                if name.startswith(path_hash + "_") and name.endswith(".png") and name != file_name]
+            current_version_files = []
+            for name in same_image_files:
+                if name.split("_", 2)[1] != version_hash:
+                    os.remove(os.path.join(cache_directory, name))
+                else:
+                    current_version_files.append(os.path.join(cache_directory, name))
+
+            current_version_files.sort(key=os.path.getmtime)  # oldest first
+            for path in current_version_files[:max(0, len(current_version_files) + 1 - cls.max_disk_cached_sizes)]:
+                os.remove(path)
+        except OSError:
+            pass  # cache is optional, files can be removed by another process at the same time
+
+    def _create_resized_image(self, mode: str, scaled_size: Tuple[int, int]) -> "Image.Image":
+        image_path = self._light_image_path if mode == "light" else self._dark_image_path
+
+        # image given by path: load pre-resized image from disk cache if possible
+        cache_path = None
+        if image_path is not None and self.disk_cache_enabled:
+            try:
+                cache_path = self._get_disk_cache_path(image_path, scaled_size)
+                if os.path.isfile(cache_path):
+                    resized_image = Image.open(cache_path)
+                    resized_image.load()
+                    return resized_image
+            except Exception:
+                cache_path = None  # unreadable cache file, resize again
+
+        resized_image = self._load_image(mode).resize(scaled_size, self._get_resampling_filter())
+
+        if cache_path is not None and write_cache_file(cache_path, lambda f: resized_image.save(f, format="PNG")):
+            self._remove_outdated_disk_cache_files(cache_path)
+
+        return resized_image
+
+    def _get_scaled_photo_image(self, mode: str, scaled_size: Tuple[int, int]) -> "ImageTk.PhotoImage":
+        photo_images = self._scaled_light_photo_images if mode == "light" else self._scaled_dark_photo_images
+
+        if scaled_size in photo_images:
+            photo_images.move_to_end(scaled_size)
+            return photo_images[scaled_size]
+
+        photo_images[scaled_size] = ImageTk.PhotoImage(self._create_resized_image(mode, scaled_size))
+        # widgets keep a reference to the PhotoImage they show, so dropping it here doesn't clear a widget
+        while len(photo_images) > self.max_cached_photo_images:
+            photo_images.popitem(last=False)
+        return photo_images[scaled_size]
+
+    def _has_image(self, mode: str) -> bool:
+        if mode == "light":
+            return self._light_image is not None or self._light_image_path is not None
+        else:
+            return self._dark_image is not None or self._dark_image_path is not None
+
     def _get_scaled_size(self, widget_scaling: float) -> Tuple[int, int]:
         return round(self._size[0] * widget_scaling), round(self._size[1] * widget_scaling)
 
     def _get_scaled_light_photo_image(self, scaled_size: Tuple[int, int]) -> "ImageTk.PhotoImage":
-        if scaled_size in self._scaled_light_photo_images:
-            return self._scaled_light_photo_images[scaled_size]
-        else:
-            self._scaled_light_photo_images[scaled_size] = ImageTk.PhotoImage(self._light_image.resize(scaled_size))
-            return self._scaled_light_photo_images[scaled_size]
+        return self._get_scaled_photo_image("light", scaled_size)
 
     def _get_scaled_dark_photo_image(self, scaled_size: Tuple[int, int]) -> "ImageTk.PhotoImage":
-        if scaled_size in self._scaled_dark_photo_images:
-            return self._scaled_dark_photo_images[scaled_size]
-        else:
-            self._scaled_dark_photo_images[scaled_size] = ImageTk.PhotoImage(self._dark_image.resize(scaled_size))
-            return self._scaled_dark_photo_images[scaled_size]
+        return self._get_scaled_photo_image("dark", scaled_size)
 
     def create_scaled_photo_image(self, widget_scaling: float, appearance_mode: str) -> "ImageTk.PhotoImage":
         scaled_size = self._get_scaled_size(widget_scaling)
 
-        if appearance_mode == "light" and self._light_image is not None:
+        if appearance_mode == "light" and self._has_image("light"):
             return self._get_scaled_light_photo_image(scaled_size)
-        elif appearance_mode == "light" and self._light_image is None:
+        elif appearance_mode == "light" and not self._has_image("light"):
             return self._get_scaled_dark_photo_image(scaled_size)
 
-        elif appearance_mode == "dark" and self._dark_image is not None:
+        elif appearance_mode == "dark" and self._has_image("dark"):
             return self._get_scaled_dark_photo_image(scaled_size)
-        elif appearance_mode == "dark" and self._dark_image is None:
+        elif appearance_mode == "dark" and not self._has_image("dark"):
             return self._get_scaled_light_photo_image(scaled_size)
-
-
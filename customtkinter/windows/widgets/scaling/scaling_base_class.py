@@ -1,3 +1,4 @@
+from tkinter.font import Font
 from typing import Union, Tuple
 import copy
 import re
@@ -7,7 +8,7 @@ except ImportError:
     from typing_extensions import Literal
 
 from .scaling_tracker import ScalingTracker
-from ..font import CTkFont
+from ..font import CTkFont, ScaledFontCache
 
 
 class CTkScalingBaseClass:
@@ -73,22 +74,23 @@ class CTkScalingBaseClass:
         assert self.__scaling_type == "window"
         return int(scaled_value / self.__window_scaling)
 
-    def _apply_font_scaling(self, font: Union[Tuple, CTkFont]) -> tuple:
-        """ Takes CTkFont object and returns tuple font with scaled size, has to be called again for every change of font object """
+    def _apply_font_scaling(self, font: Union[Tuple, CTkFont]) -> Union[tuple, Font]:
+        """ Takes CTkFont object or tuple and returns the shared named font with scaled size from the ScaledFontCache,
+        has to be called again for every change of font object """
         assert self.__scaling_type == "widget"
 
         if type(font) == tuple:
             if len(font) == 1:
                 return font
             elif len(font) == 2:
-                return font[0], -abs(round(font[1] * self.__widget_scaling))
+                return ScaledFontCache.get(self._root(), font[0], -abs(round(font[1] * self.__widget_scaling)))
             elif 3 <= len(font) <= 6:
-                return font[0], -abs(round(font[1] * self.__widget_scaling)), font[2:]
+                return ScaledFontCache.get(self._root(), font[0], -abs(round(font[1] * self.__widget_scaling)), font[2:])
             else:
                 raise ValueError(f"Can not scale font {font}. font needs to be tuple of len 1, 2 or 3")
 
         elif isinstance(font, CTkFont):
-            return font.create_scaled_tuple(self.__widget_scaling)
+            return ScaledFontCache.get_from_tuple(self._root(), font.create_scaled_tuple(self.__widget_scaling))
         else:
             raise ValueError(f"Can not scale font '{font}' of type {type(font)}. font needs to be tuple or instance of CTkFont")
 
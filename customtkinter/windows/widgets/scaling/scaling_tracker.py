@@ -1,20 +1,34 @@
 import tkinter
 import sys
+import time
+import weakref
 from typing import Callable
 
+from ..core_rendering import RedrawScheduler
+from ..utility import CheckCounter, WeakCallbackRegistry
+
 
 class ScalingTracker:
     deactivate_automatic_dpi_awareness = False
 
-    window_widgets_dict = {}  # contains window objects as keys with list of widget callbacks as elements
-    window_dpi_scaling_dict = {}  # contains window objects as keys and corresponding scaling factors
+    # windows are only weakly referenced, widget callbacks are kept in a WeakCallbackRegistry per window,
+    # so destroyed widgets and windows drop out automatically even if they never got removed explicitly
+    window_widgets_dict = weakref.WeakKeyDictionary()  # contains window objects as keys with registry of widget callbacks as elements
+    window_dpi_scaling_dict = weakref.WeakKeyDictionary()  # contains window objects as keys and corresponding scaling factors
 
     widget_scaling = 1  # user values which multiply to detected window scaling factor
     window_scaling = 1
 
     update_loop_running = False
-    update_loop_interval = 100  # ms
+    update_loop_interval = 100  # ms, used right after a window got moved or resized
+    max_update_loop_interval = 5000  # ms, interval doubles up to this value while no scaling change is detected
+    current_update_loop_interval = 100  # ms
     loop_pause_after_new_scaling = 1500  # ms
+    update_loop_after_id = None
+    update_loop_window = None
+    update_loop_paused_until = 0  # time.monotonic() value, configure events are ignored until then
+
+    check_counter = CheckCounter()
 
     @classmethod
     def get_widget_scaling(cls, widget) -> float:
@@ -48,8 +62,8 @@ class ScalingTracker:
 
     @classmethod
     def update_scaling_callbacks_all(cls):
-        for window, callback_list in cls.window_widgets_dict.items():
-            for set_scaling_callback in callback_list:
+        for window, callback_registry in list(cls.window_widgets_dict.items()):
+            for set_scaling_callback in callback_registry:
                 if not cls.deactivate_automatic_dpi_awareness:
                     set_scaling_callback(cls.window_dpi_scaling_dict[window] * cls.widget_scaling,
                                          cls.window_dpi_scaling_dict[window] * cls.window_scaling)
@@ -57,6 +71,9 @@ class ScalingTracker:
                     set_scaling_callback(cls.widget_scaling,
                                          cls.window_scaling)
 
+        # widgets only marked themselves as dirty in _set_scaling, draw every widget once
+        RedrawScheduler.flush()
+
     @classmethod
     def update_scaling_callbacks_for_window(cls, window):
         for set_scaling_callback in cls.window_widgets_dict[window]:
@@ -67,47 +84,87 @@ class ScalingTracker:
                 set_scaling_callback(cls.widget_scaling,
                                      cls.window_scaling)
 
+        RedrawScheduler.flush(window)
+
     @classmethod
     def add_widget(cls, widget_callback: Callable, widget):
         window_root = cls.get_window_root_of_widget(widget)
 
         if window_root not in cls.window_widgets_dict:
-            cls.window_widgets_dict[window_root] = [widget_callback]
-        else:
-            cls.window_widgets_dict[window_root].append(widget_callback)
+            cls.window_widgets_dict[window_root] = WeakCallbackRegistry()
+        cls.window_widgets_dict[window_root].add(widget_callback)
 
         if window_root not in cls.window_dpi_scaling_dict:
             cls.window_dpi_scaling_dict[window_root] = cls.get_window_dpi_scaling(window_root)
 
-        if not cls.update_loop_running:
-            window_root.after(100, cls.check_dpi_scaling)
-            cls.update_loop_running = True
+        if not cls.update_loop_running and cls.dpi_scaling_can_change():
+            cls.current_update_loop_interval = cls.update_loop_interval
+            cls.schedule_dpi_check(window_root, cls.update_loop_interval)
 
     @classmethod
     def remove_widget(cls, widget_callback, widget):
         window_root = cls.get_window_root_of_widget(widget)
-        try:
-            cls.window_widgets_dict[window_root].remove(widget_callback)
-        except:
-            pass
+        callback_registry = cls.window_widgets_dict.get(window_root)
+        if callback_registry is not None:
+            callback_registry.discard(widget_callback)
 
     @classmethod
     def remove_window(cls, window_callback, window):
-        try:
-            del cls.window_widgets_dict[window]
-        except:
-            pass
+        cls.window_widgets_dict.pop(window, None)
 
     @classmethod
     def add_window(cls, window_callback, window):
         if window not in cls.window_widgets_dict:
-            cls.window_widgets_dict[window] = [window_callback]
-        else:
-            cls.window_widgets_dict[window].append(window_callback)
+            cls.window_widgets_dict[window] = WeakCallbackRegistry()
+        cls.window_widgets_dict[window].add(window_callback)
 
         if window not in cls.window_dpi_scaling_dict:
             cls.window_dpi_scaling_dict[window] = cls.get_window_dpi_scaling(window)
 
+            # the DPI scaling can only change when the window got moved (to another monitor) or resized
+            if cls.dpi_scaling_can_change():
+                window.bind("<Configure>", lambda event: cls.window_configure_event(event, window), add="+")
+
+    @classmethod
+    def dpi_scaling_can_change(cls) -> bool:
+        """ scaling only gets detected on Windows, on macOS and Linux get_window_dpi_scaling() is constant """
+        return sys.platform.startswith("win") and not cls.deactivate_automatic_dpi_awareness
+
+    @classmethod
+    def window_configure_event(cls, event, window):
+        """ window got moved or resized, check the scaling soon and restart the back-off of the update loop """
+        if event.widget is not window:
+            return  # bindings of the root window also receive the events of all child widgets
+        if time.monotonic() < cls.update_loop_paused_until:
+            return  # window is still adjusting to the last scaling change
+        if cls.update_loop_running and cls.current_update_loop_interval == cls.update_loop_interval:
+            return  # check with the shortest interval is already pending
+
+        cls.current_update_loop_interval = cls.update_loop_interval
+        cls.schedule_dpi_check(window, cls.update_loop_interval)
+
+    @classmethod
+    def schedule_dpi_check(cls, window, delay: int):
+        if cls.update_loop_after_id is not None:
+            try:
+                cls.update_loop_window.after_cancel(cls.update_loop_after_id)
+            except Exception:
+                pass
+
+        cls.update_loop_after_id = window.after(delay, cls.check_dpi_scaling)
+        cls.update_loop_window = window
+        cls.update_loop_running = True
+
+    @classmethod
+    def get_checks_per_minute(cls) -> float:
+        """ number of DPI checks during the last minute, for diagnostics """
+        return cls.check_counter.get_checks_per_minute()
+
+    @classmethod
+    def get_live_registrations(cls) -> dict:
+        """ number of registered scaling callbacks per window (window path name -> count), for diagnostics """
+        return {str(window): len(callback_registry) for window, callback_registry in list(cls.window_widgets_dict.items())}
+
     @classmethod
     def activate_high_dpi_awareness(cls):
         """ make process DPI aware, customtkinter elements will get scaled automatically,
@@ -171,10 +228,12 @@ class ScalingTracker:
 
     @classmethod
     def check_dpi_scaling(cls):
+        cls.update_loop_after_id = None
+        cls.check_counter.count()
         new_scaling_detected = False
 
         # check for every window if scaling value changed
-        for window in cls.window_widgets_dict:
+        for window in list(cls.window_widgets_dict.keys()):
             if window.winfo_exists() and not window.state() == "iconic":
                 current_dpi_scaling_value = cls.get_window_dpi_scaling(window)
                 if current_dpi_scaling_value != cls.window_dpi_scaling_dict[window]:
@@ -192,13 +251,19 @@ class ScalingTracker:
 
                     new_scaling_detected = True
 
+        # adaptive back-off: poll fast after changes, slower and slower while nothing changes
+        if new_scaling_detected:
+            next_interval = cls.loop_pause_after_new_scaling
+            cls.update_loop_paused_until = time.monotonic() + cls.loop_pause_after_new_scaling / 1000
+            cls.current_update_loop_interval = cls.update_loop_interval
+        else:
+            cls.current_update_loop_interval = min(cls.current_update_loop_interval * 2, cls.max_update_loop_interval)
+            next_interval = cls.current_update_loop_interval
+
         # find an existing tkinter object for the next call of .after()
         for app in cls.window_widgets_dict.keys():
             try:
-                if new_scaling_detected:
-                    app.after(cls.loop_pause_after_new_scaling, cls.check_dpi_scaling)
-                else:
-                    app.after(cls.update_loop_interval, cls.check_dpi_scaling)
+                cls.schedule_dpi_check(app, next_interval)
                 return
             except Exception:
                 continue
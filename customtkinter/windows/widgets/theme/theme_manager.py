@@ -2,8 +2,12 @@ import sys
 import os
 import pathlib
 import json
+import marshal
+import hashlib
 from typing import List, Union
 
+from ..utility import get_cache_directory, write_cache_file
+
 
 class ThemeManager:
 
@@ -11,37 +15,89 @@ class ThemeManager:
     _built_in_themes: List[str] = ["blue", "green", "dark-blue", "sweetkind"]
     _currently_loaded_theme: Union[str, None] = None
 
+    # theme files get resolved for the current platform once and are cached in marshal format,
+    # the cache is invalidated when the modification time or size of the .json file changes
+    cache_enabled: bool = True
+    _cache_format_version: int = 2
+
     @classmethod
     def load_theme(cls, theme_name_or_path: str):
         script_directory = os.path.dirname(os.path.abspath(__file__))
 
         if theme_name_or_path in cls._built_in_themes:
             customtkinter_path = pathlib.Path(script_directory).parent.parent.parent
-            with open(os.path.join(customtkinter_path, "assets", "themes", f"{theme_name_or_path}.json"), "r") as f:
-                cls.theme = json.load(f)
+            theme_path = os.path.join(customtkinter_path, "assets", "themes", f"{theme_name_or_path}.json")
+        else:
+            theme_path = theme_name_or_path
+
+        cached_theme = cls._read_theme_cache(theme_path) if cls.cache_enabled else None
+        if cached_theme is not None:
+            cls.theme = cached_theme
         else:
-            with open(theme_name_or_path, "r") as f:
-                cls.theme = json.load(f)
+            with open(theme_path, "r") as f:
+                cls.theme = cls._resolve_theme(json.load(f))
+
+            if cls.cache_enabled:
+                cls._write_theme_cache(theme_path, cls.theme)
 
         # store theme path for saving
         cls._currently_loaded_theme = theme_name_or_path
 
+    @staticmethod
+    def _resolve_theme(theme: dict) -> dict:
+        """ filter platform specific values and convert color lists to tuples """
+
         # filter theme values for platform
-        for key in cls.theme.keys():
+        for key in theme.keys():
             # check if values for key differ on platforms
-            if "macOS" in cls.theme[key].keys():
+            if "macOS" in theme[key].keys():
                 if sys.platform == "darwin":
-                    cls.theme[key] = cls.theme[key]["macOS"]
+                    theme[key] = theme[key]["macOS"]
                 elif sys.platform.startswith("win"):
-                    cls.theme[key] = cls.theme[key]["Windows"]
+                    theme[key] = theme[key]["Windows"]
                 else:
-                    cls.theme[key] = cls.theme[key]["Linux"]
+                    theme[key] = theme[key]["Linux"]
 
         # fix name inconsistencies
-        if "CTkCheckbox" in cls.theme.keys():
-            cls.theme["CTkCheckBox"] = cls.theme.pop("CTkCheckbox")
-        if "CTkRadiobutton" in cls.theme.keys():
-            cls.theme["CTkRadioButton"] = cls.theme.pop("CTkRadiobutton")
+        if "CTkCheckbox" in theme.keys():
+            theme["CTkCheckBox"] = theme.pop("CTkCheckbox")
+        if "CTkRadiobutton" in theme.keys():
+            theme["CTkRadioButton"] = theme.pop("CTkRadiobutton")
+
+        # (light, dark) color pairs as tuples, like colors passed by the user
+        for widget_theme in theme.values():
+            for attribute, value in widget_theme.items():
+                if isinstance(value, list):
+                    widget_theme[attribute] = tuple(value)
+
+        return theme
+
+    @classmethod
+    def _get_cache_path_and_key(cls, theme_path: str):
+        theme_path = os.path.abspath(theme_path)
+        stat_result = os.stat(theme_path)
+        cache_key = (cls._cache_format_version, marshal.version, sys.platform, theme_path, stat_result.st_mtime_ns, stat_result.st_size)
+        file_name = f"{hashlib.md5(theme_path.encode('utf-8')).hexdigest()[:16]}-{sys.platform}.marshal"
+        return os.path.join(get_cache_directory("themes"), file_name), cache_key
+
+    @classmethod
+    def _read_theme_cache(cls, theme_path: str) -> Union[dict, None]:
+        try:
+            cache_path, cache_key = cls._get_cache_path_and_key(theme_path)
+            with open(cache_path, "rb") as f:
+                cached_key, cached_theme = marshal.loads(f.read())  # loads() of the whole file is much faster than load(f)
+        except Exception:
+            return None  # no cache yet, theme file missing (raised again by open() in load_theme) or unreadable cache
+
+        return cached_theme if cached_key == cache_key else None
+
+    @classmethod
+    def _write_theme_cache(cls, theme_path: str, theme: dict):
+        try:
+            cache_path, cache_key = cls._get_cache_path_and_key(theme_path)
+        except OSError:
+            return  # theme file vanished, nothing to cache
+        write_cache_file(cache_path, lambda f: f.write(marshal.dumps((cache_key, theme))))
 
     @classmethod
     def save_theme(cls):
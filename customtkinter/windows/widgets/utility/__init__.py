@@ -1 +1,5 @@
-from .utility_functions import pop_from_dict_by_set, check_kwargs_empty
+from .utility_functions import pop_from_dict_by_set, check_kwargs_empty, get_cache_directory, write_cache_file
+from .check_counter import CheckCounter
+from .weak_callback_registry import WeakCallbackRegistry
+from .master_color_cache import MasterColorCache
+from .mouse_wheel_dispatcher import MouseWheelDispatcher
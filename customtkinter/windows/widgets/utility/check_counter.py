@@ -0,0 +1,25 @@
+import time
+from collections import deque
+
+
+class CheckCounter:
+    """ counts how many times a periodic check ran during the last minute, used for diagnostics of the trackers """
+
+    def __init__(self, period: float = 60):
+        self._period = period  # seconds
+        self._timestamps = deque()
+        self.total_checks = 0
+
+    def count(self):
+        now = time.monotonic()
+        self._timestamps.append(now)
+        self.total_checks += 1
+        self._discard_old(now)
+
+    def get_checks_per_minute(self) -> float:
+        self._discard_old(time.monotonic())
+        return len(self._timestamps) * 60 / self._period
+
+    def _discard_old(self, now: float):
+        while self._timestamps and now - self._timestamps[0] > self._period:
+            self._timestamps.popleft()
@@ -0,0 +1,37 @@
+import weakref
+
+
+class MasterColorCache:
+    """
+    Caches the color detected by CTkBaseClass._detect_color_of_master() per container widget.
+
+    Every transparent widget asks its master for the effective background color, which walks up
+    the master chain with cget("fg_color") and creates a ttk.Style() for ttk masters. The result
+    only depends on the fg_color of the containers, so it gets cached per container and the whole
+    cache gets cleared when a container changes its fg_color. Containers are weakly referenced.
+    """
+
+    _colors = weakref.WeakKeyDictionary()  # master widget -> detected color
+
+    hits = 0  # statistics, can be read for diagnostics
+    misses = 0
+
+    @classmethod
+    def get(cls, master_widget):
+        """ returns cached color or None """
+        color = cls._colors.get(master_widget)
+        if color is None:
+            cls.misses += 1
+        else:
+            cls.hits += 1
+        return color
+
+    @classmethod
+    def set(cls, master_widget, color):
+        if color is not None:
+            cls._colors[master_widget] = color
+
+    @classmethod
+    def invalidate(cls):
+        """ gets called when the fg_color of a container changes, colors of all children can depend on it """
+        cls._colors.clear()
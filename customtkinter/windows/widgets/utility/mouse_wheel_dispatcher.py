@@ -0,0 +1,60 @@
+import tkinter
+import weakref
+
+
+class MouseWheelDispatcher:
+    """
+    Routes <MouseWheel> events to the CTkScrollableFrame under the mouse pointer.
+
+    Every CTkScrollableFrame used to add its own bind_all("<MouseWheel>") callback, so each wheel
+    event anywhere in the app ran the callback of every scrollable frame, and each one walked up the
+    widget tree to check if the event belongs to it. Now there is one binding per application: the
+    pointer gets hit-tested once, and the path name of the widget under it is walked up to find the
+    innermost registered frame that can scroll, without any further Tcl calls.
+    """
+
+    scrollable_frames = weakref.WeakValueDictionary()  # path name of scroll canvas -> scrollable frame
+    bound_apps = weakref.WeakSet()
+
+    events_dispatched = 0  # statistics, can be read for diagnostics
+
+    @classmethod
+    def register(cls, canvas: tkinter.Canvas, scrollable_frame):
+        """ scrollable_frame needs a _mouse_wheel_event(event, shift_pressed) -> bool method """
+        cls.scrollable_frames[str(canvas)] = scrollable_frame
+
+        app = canvas._root()
+        if app not in cls.bound_apps:
+            cls.bound_apps.add(app)
+            app.bind_all("<MouseWheel>", cls.mouse_wheel_event, add="+")
+
+    @classmethod
+    def unregister(cls, canvas: tkinter.Canvas):
+        cls.scrollable_frames.pop(str(canvas), None)
+
+    @classmethod
+    def find_scrollable_frames(cls, widget_path: str):
+        """ yields the registered frames containing the widget, innermost first """
+        while widget_path:
+            scrollable_frame = cls.scrollable_frames.get(widget_path)
+            if scrollable_frame is not None:
+                yield scrollable_frame
+            widget_path = widget_path.rpartition(".")[0]
+
+    @classmethod
+    def mouse_wheel_event(cls, event):
+        if not cls.scrollable_frames:
+            return
+
+        # the widget under the pointer, wheel events can be delivered to the focus widget instead (Windows)
+        try:
+            widget = event.widget.winfo_containing(event.x_root, event.y_root)
+        except (AttributeError, tkinter.TclError):
+            widget = None
+        widget_path = str(widget if widget is not None else event.widget)
+
+        shift_pressed = bool(event.state & 0x0001)
+        for scrollable_frame in cls.find_scrollable_frames(widget_path):
+            cls.events_dispatched += 1
+            if scrollable_frame._mouse_wheel_event(event, shift_pressed):
+                return  # outer frames only scroll if the inner ones can't
@@ -1,3 +1,6 @@
+import os
+import sys
+from typing import Any, Callable, BinaryIO
 
 def pop_from_dict_by_set(dictionary: dict, valid_keys: set) -> dict:
     """ remove and create new dict with key value pairs of dictionary, where key is in valid_keys """
@@ -20,3 +23,32 @@ def check_kwargs_empty(kwargs_dict, raise_error=False) -> bool:
             return True
     else:
         return False
+
+
+def get_cache_directory(subdirectory: str) -> str:
+    """ returns the per-user cache directory of customtkinter for the given subdirectory (not created) """
+    if sys.platform.startswith("win"):
+        base_directory = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    elif sys.platform == "darwin":
+        base_directory = os.path.join(os.path.expanduser("~"), "Library", "Caches")
+    else:
+        base_directory = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base_directory, "customtkinter", subdirectory)
+
+
+def write_cache_file(cache_path: str, write_function: Callable[[BinaryIO], Any]) -> bool:
+    """ writes a cache file atomically with write_function(file), the temporary file gets removed if writing fails,
+        errors are ignored because caches are optional (e.g. read-only home directory), returns True on success """
+    temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temporary_path, "wb") as f:
+            write_function(f)
+        os.replace(temporary_path, cache_path)
+        return True
+    except Exception:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+        return False
@@ -0,0 +1,48 @@
+import weakref
+from typing import Callable, Iterator
+
+
+class WeakCallbackRegistry:
+    """
+    Ordered set of callbacks with O(1) add and discard, used by the scaling and appearance mode trackers.
+
+    Bound methods are only weakly referenced (weakref.WeakMethod) and get removed automatically
+    when their widget gets garbage collected, so widgets that never called destroy() don't keep
+    receiving broadcasts or stay alive forever. Plain functions are referenced strongly.
+    """
+
+    def __init__(self):
+        self._callbacks = {}  # weak reference or function -> None, dict keeps insertion order
+        self.dead_references_removed = 0  # statistics, can be read for diagnostics
+
+    def _make_key(self, callback: Callable, remove_when_dead: bool = False):
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            if remove_when_dead:
+                return weakref.WeakMethod(callback, self._remove_dead_reference)
+            return weakref.WeakMethod(callback)
+        return callback
+
+    def _remove_dead_reference(self, reference):
+        if self._callbacks.pop(reference, False) is None:
+            self.dead_references_removed += 1
+
+    def add(self, callback: Callable):
+        key = self._make_key(callback, remove_when_dead=True)
+        if key not in self._callbacks:
+            self._callbacks[key] = None
+
+    def discard(self, callback: Callable):
+        self._callbacks.pop(self._make_key(callback), None)
+
+    def __contains__(self, callback: Callable) -> bool:
+        return self._make_key(callback) in self._callbacks
+
+    def __len__(self) -> int:
+        return len(self._callbacks)
+
+    def __iter__(self) -> Iterator[Callable]:
+        """ iterates over a snapshot, so callbacks can add or remove callbacks while being called """
+        for key in list(self._callbacks):
+            callback = key() if isinstance(key, weakref.WeakMethod) else key
+            if callback is not None:
+                yield callback
@@ -1,24 +1,30 @@
 # data_exporter.py
 
 import os
-import pandas as pd
-import xlsxwriter
+import math
+import time
 from utils import formatar_tempo
 import getpass  # Para obter o nome do usuário
-import numpy as np
+from lazy_imports import importar_tardio
 
 class ExportadorDados:
-    def __init__(self, dados, codigos_amostras_vars, intervalo_registro, planta_selecionada, tipo_analise="comum"):
+    def __init__(self, dados, codigos_amostras_vars, intervalo_registro, planta_selecionada, tipo_analise="comum", saude_canais=None):
         self.dados = dados  # Lista de tuplas (elapsed_time, temperatures dict)
         self.codigos_amostras_vars = codigos_amostras_vars  # Dicionário de IDs das amostras
         self.intervalo_registro = intervalo_registro  # Intervalo de registro em segundos
         self.planta_selecionada = planta_selecionada  # Nome da planta selecionada
         self.tipo_analise = tipo_analise
+        self.saude_canais = saude_canais or {}  # Resumo de saúde dos canais ao final da medição
 
     def exportar_para_excel(self, save_path=None, filename=None):
         """
         Exporta os dados para um arquivo Excel.
         """
+        # pandas/numpy (e o xlsxwriter, usado pelo ExcelWriter) só são carregados na primeira exportação
+        pd = importar_tardio("pandas")
+        np = importar_tardio("numpy")
+        importar_tardio("xlsxwriter")
+
         # Verificar termopares ativos com IDs de amostras
         active_termopares = [tp for tp, id_amostra in self.codigos_amostras_vars.items() if id_amostra.strip()]
         if not active_termopares:
@@ -112,6 +118,20 @@ class ExportadorDados:
             info_text = f"Análise realizada pelo usuário: '{nome_usuario}' - planta '{self.planta_selecionada}'"
             worksheet.write(info_row, 0, info_text, info_format)
 
+            # Escrever a saúde dos canais registrada durante a medição
+            saude_row = info_row + 2
+            for tp in active_termopares:
+                estado = self.saude_canais.get(tp)
+                if not estado:
+                    continue
+                situacao = "sem sinal" if estado['obsoleto'] else "ok"
+                if estado['obsoleto'] and estado.get('obsoleto_desde') is not None:
+                    situacao += f" desde {time.strftime('%H:%M:%S', time.localtime(estado['obsoleto_desde']))}"
+                saude_text = (f"Canal {tp}: {situacao} - {estado['leituras']} leituras, "
+                              f"{estado['taxa_quadros_hz']} Hz, taxa de erros {estado['taxa_erros']:.1%}")
+                worksheet.write(saude_row, 0, saude_text, info_format)
+                saude_row += 1
+
             # Ajustar largura das colunas para acomodar o texto
             worksheet.set_column(0, 0, 50)
 
@@ -147,7 +167,7 @@ class ExportadorDados:
         """
         Calcula o Delta T com base na lista de temperaturas.
         """
-        temperaturas_validas = [temp for temp in temperatures if not np.isnan(temp)]
+        temperaturas_validas = [temp for temp in temperatures if not math.isnan(temp)]
         if temperaturas_validas:
             initial_temp = temperaturas_validas[0]
             final_temp = temperaturas_validas[-1]
@@ -0,0 +1,44 @@
+# lazy_imports.py
+
+import importlib
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger("lazy_imports")
+
+# Tempo gasto em cada importação (nome -> segundos); apenas a primeira importação é medida
+TEMPOS_IMPORTACAO = {}
+_lock = threading.Lock()
+
+
+def registrar_tempo_importacao(nome, segundos):
+    """Registra o tempo de uma importação medida fora deste módulo (ex.: importações no topo de app.py)."""
+    with _lock:
+        TEMPOS_IMPORTACAO[nome] = segundos
+    logger.info(f"Import of '{nome}' took {segundos * 1000:.1f} ms")
+
+
+def importar_tardio(nome):
+    """
+    Importa um módulo pesado somente quando ele é usado pela primeira vez.
+
+    O custo da primeira importação é registrado em TEMPOS_IMPORTACAO; as chamadas seguintes
+    apenas retornam o módulo já carregado.
+    """
+    modulo = sys.modules.get(nome)
+    if modulo is not None:
+        return modulo
+
+    inicio = time.perf_counter()
+    modulo = importlib.import_module(nome)
+    registrar_tempo_importacao(nome, time.perf_counter() - inicio)
+    return modulo
+
+
+def relatorio_importacoes():
+    """Retorna os tempos de importação registrados em milissegundos, do mais lento para o mais rápido."""
+    with _lock:
+        itens = sorted(TEMPOS_IMPORTACAO.items(), key=lambda item: item[1], reverse=True)
+    return {nome: round(segundos * 1000, 1) for nome, segundos in itens}
@@ -1,10 +1,43 @@
 import json
 import os
+import string
+import tkinter as tk
+
+
+class TranslatedText(tk.StringVar):
+    """
+    StringVar holding a template like "{status}: {waiting}", where every field is a translation key.
+    Widgets bind to it with textvariable and get updated when the language changes.
+    """
+
+    def __init__(self, localizer, template, master=None):
+        super().__init__(master=master)
+        self.localizer = localizer
+        self.parts = []
+        self.keys = set()
+        self.set_template(template)
+
+    def set_template(self, template):
+        """Replaces the template, e.g. to show another status, and updates the text."""
+        self.parts = [(literal, key) for literal, key, _, _ in string.Formatter().parse(template)]
+        new_keys = {key for _, key in self.parts if key} - self.keys
+        self.keys |= new_keys
+        self.localizer.subscribe_variable(self, new_keys)
+        self.refresh()
+
+    def refresh(self):
+        """Sets the translated text, the bound widgets only get updated if it changed."""
+        text = "".join(literal + (self.localizer.translate(key) if key else "") for literal, key in self.parts)
+        if text != self.get():
+            self.set(text)
+
 
 class Localizer:
     def __init__(self, default_language="pt"):
         self.default_language = default_language
         self.translations = {}
+        self.variable_subscribers = {}  # key -> list of TranslatedText
+        self.callback_subscribers = {}  # key -> list of callbacks
         self.load_translations()
 
     def load_translations(self):
@@ -20,9 +53,42 @@ class Localizer:
         """Translates a key based on the current language."""
         return self.translations.get(self.default_language, {}).get(key, key)
 
+    def text_variable(self, template, master=None):
+        """Returns a TranslatedText for a template with translation keys as fields, e.g. "{id} T1:"."""
+        return TranslatedText(self, template, master=master)
+
+    def subscribe_variable(self, variable, keys):
+        for key in keys:
+            self.variable_subscribers.setdefault(key, []).append(variable)
+
+    def bind(self, callback, *keys):
+        """Calls callback() after a language change if the translation of one of the keys changed,
+        for texts that can't use a text variable (menus, table headings, graphs)."""
+        for key in keys:
+            self.callback_subscribers.setdefault(key, []).append(callback)
+
     def set_language(self, language):
-        """Sets the current language."""
-        if language in self.translations:
-            self.default_language = language
-        else:
+        """Sets the current language and updates the bound texts whose translation changed, returns the changed keys."""
+        if language not in self.translations:
             raise ValueError(f"Language '{language}' not supported.")
+
+        old_translations = self.translations.get(self.default_language, {})
+        new_translations = self.translations[language]
+        self.default_language = language
+        changed_keys = {key for key in old_translations.keys() | new_translations.keys()
+                        if old_translations.get(key, key) != new_translations.get(key, key)}
+
+        # every variable and callback runs once, even if several of its keys changed
+        variables = {}
+        callbacks = {}
+        for key in changed_keys:
+            for variable in self.variable_subscribers.get(key, ()):
+                variables[id(variable)] = variable
+            for callback in self.callback_subscribers.get(key, ()):
+                callbacks[callback] = None
+
+        for variable in variables.values():
+            variable.refresh()
+        for callback in callbacks:
+            callback()
+        return changed_keys
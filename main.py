@@ -5,9 +5,9 @@ from logging.handlers import TimedRotatingFileHandler
 import time
 from serial_handler import ManipuladorPortaSerial
 from temperature_logger import TemperatureLogger
-from measurement import Medicao
+from measurement import Medicao, DURACOES_ANALISE, INTERVALOS_REGISTRO, calcular_tempos_registro
 from data_exporter import ExportadorDados
-from utils import console, exibir_cabecalho, limpar_tela, extrair_temperaturas
+from utils import console, exibir_cabecalho, limpar_tela, formatar_tempo, criar_tabela_temperaturas
 import ctypes
 import time
 import threading
@@ -26,6 +26,13 @@ def impedir_bloqueio(intervalo=60):
     thread.daemon = True  # Thread rodando em segundo plano
     thread.start()
 
+def exibir_tick(tempo, tempo_total, temperaturas, codigos_amostras):
+    """Exibe o progresso da medição e as temperaturas atuais no console."""
+    limpar_tela()
+    console.print(exibir_cabecalho(), style="bold blue")
+    console.print(f"[bold yellow]Tempo: {formatar_tempo(tempo)} / {formatar_tempo(tempo_total)}[/bold yellow]")
+    console.print(criar_tabela_temperaturas(temperaturas, codigos_amostras))
+
 def confirmar_acao(acao):
     """Solicita confirmação do usuário para prosseguir com uma ação."""
     confirmacao = input(f"Tem certeza que deseja {acao}? (s/n): ")
@@ -142,35 +149,20 @@ def main():
             limpar_tela()
             console.print(exibir_cabecalho(), style="bold blue")
 
-            # Mapeamento das opções para funções de medição
-            if opcao_duracao == '1':
-                funcao_medicao = 'medir_30s'
-                descricao_duracao = "[bold red]30 segundos[/bold red]"
-                tipo_analise = "comum"
-            elif opcao_duracao == '2':
-                funcao_medicao = 'medir_2min'
-                descricao_duracao = "[bold red]2 minutos[/bold red]"
-                tipo_analise = "comum"
-            elif opcao_duracao == '3':
-                funcao_medicao = 'medir_3min'
-                descricao_duracao = "[bold red]3 minutos[/bold red]"
-                tipo_analise = "comum"
-            elif opcao_duracao == '4':
-                funcao_medicao = 'medir_5min'
-                descricao_duracao = "[bold red]5 minutos[/bold red]"
-                tipo_analise = "comum"
-            elif opcao_duracao == '5':
-                funcao_medicao = 'medir_10min'
-                descricao_duracao = "[bold red]10 minutos[/bold red]"
-                tipo_analise = "comum"
-            elif opcao_duracao == '6':
-                funcao_medicao = 'medir_30min'
-                descricao_duracao = "[bold red]30 minutos[/bold red]"
-                tipo_analise = "comum"
-            elif opcao_duracao == '7':
-                funcao_medicao = 'medir_cvmp'
-                descricao_duracao = "[bold red]35 minutos[/bold red]"
-                tipo_analise = "cvmp"
+            # Mapeamento das opções para a duração da medição
+            opcoes_duracao = {
+                '1': ("30 segundos", "comum"),
+                '2': ("2 minutos", "comum"),
+                '3': ("3 minutos", "comum"),
+                '4': ("5 minutos", "comum"),
+                '5': ("10 minutos", "comum"),
+                '6': ("30 minutos", "comum"),
+                '7': ("35 minutos", "cvmp"),
+            }
+            duracao, tipo_analise = opcoes_duracao[opcao_duracao]
+            tempo_total = DURACOES_ANALISE[duracao]
+            intervalo_segundos = INTERVALOS_REGISTRO["30 segundos"]
+            descricao_duracao = f"[bold red]{duracao}[/bold red]"
 
             # Exibir mensagem da escolha da duração em amarelo com o tempo em vermelho
             console.print(f"[bold yellow]Você escolheu a duração de {descricao_duracao}.[/bold yellow]")
@@ -221,11 +213,17 @@ def main():
                 temp_logger.start()
 
                 # Inicializa a medição com o logger de temperatura e códigos das amostras
-                medicao = Medicao(temp_logger, codigos_amostras)
-
-                # Chamar a função de medição específica
-                funcao = getattr(medicao, funcao_medicao)
-                dados = funcao()
+                medicao = Medicao(
+                    temp_logger,
+                    codigos_amostras,
+                    calcular_tempos_registro(tempo_total, intervalo_segundos),
+                    tempo_total,
+                    tipo_analise
+                )
+                medicao.adicionar_callback_tick(
+                    lambda tempo, temperaturas: exibir_tick(tempo, tempo_total, temperaturas, codigos_amostras)
+                )
+                dados = medicao.run()
 
                 # Parar a thread de leitura e fechar a porta serial
                 if temp_logger:
@@ -247,7 +245,7 @@ def main():
                 # Perguntar se deseja exportar os dados
                 exportar = input("Deseja exportar os dados? (s/n): ")
                 if exportar.lower() == 's':
-                    exportador = ExportadorDados(dados, codigos_amostras, tipo_analise)
+                    exportador = ExportadorDados(dados, codigos_amostras, intervalo_segundos, "N/A", tipo_analise)
                     caminho_exportacao = exportador.exportar_para_excel()
 
                     # Limpar a tela após a exportação e exibir apenas o caminho do arquivo
@@ -3,42 +3,297 @@
 import threading
 import time
 import logging
+import math
+from array import array
+from collections import deque
+
+# Durações de análise disponíveis (texto exibido -> segundos)
+DURACOES_ANALISE = {
+    "30 segundos": 30,
+    "2 minutos": 120,
+    "3 minutos": 180,
+    "5 minutos": 300,
+    "10 minutos": 600,
+    "20 minutos": 1200,
+    "30 minutos": 1800,
+    "35 minutos": 2100,
+}
+
+# Intervalos de registro disponíveis (texto exibido -> segundos)
+INTERVALOS_REGISTRO = {
+    "30 segundos": 30,
+    "1 minuto": 60,
+}
+
+
+def calcular_tempos_registro(tempo_total, intervalo_segundos):
+    """Calcula a grade de tempos de registro, incluindo 0 e o tempo total."""
+    tempos = list(range(0, int(tempo_total) + 1, int(intervalo_segundos)))
+    if tempos[-1] != tempo_total:
+        tempos.append(int(tempo_total))
+    return tempos
+
+
+def para_float(valor):
+    """Converte uma leitura de temperatura em float, retornando NaN para 'OFF' ou valores inválidos."""
+    try:
+        return float(valor)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class DetectorPlato:
+    """
+    Condição de parada que detecta o platô (pico) da curva de reatividade.
+
+    Mantém, para cada termopar, uma janela deslizante das últimas amostras e calcula
+    a inclinação por mínimos quadrados com somas acumuladas (custo O(1) por amostra).
+    Considera o platô atingido quando, após `tempo_minimo` segundos e uma elevação de
+    pelo menos `elevacao_minima` °C, a inclinação de todos os termopares com leitura
+    fica abaixo de `inclinacao_maxima` (°C/min). Com `encerrar=False` apenas sinaliza
+    a conclusão em `plato_detectado`, sem interromper a medição.
+    """
+
+    motivo = "plato"
+
+    def __init__(self, janela=30, inclinacao_maxima=0.5, tempo_minimo=60, elevacao_minima=1.0, encerrar=True):
+        self.janela = janela
+        self.inclinacao_maxima = inclinacao_maxima
+        self.tempo_minimo = tempo_minimo
+        self.elevacao_minima = elevacao_minima
+        self.encerrar = encerrar
+        self.logger = logging.getLogger("measurement")
+        self.resetar()
+
+    def resetar(self):
+        """Descarta o estado acumulado para reutilizar o detector em outra medição."""
+        self._janelas = {}
+        self._somas = {}
+        self._inicial = {}
+        self._maximo = {}
+        self._amostras_vistas = 0
+        self.inclinacoes = {}
+        self.plato_detectado = False
+        self.tempo_plato = None
+
+    def _adicionar(self, tp, tempo, valor):
+        """Adiciona uma amostra à janela do termopar, atualizando as somas em O(1)."""
+        janela = self._janelas.setdefault(tp, deque())
+        somas = self._somas.setdefault(tp, [0.0, 0.0, 0.0, 0.0])  # Sx, Sy, Sxx, Sxy
+        janela.append((tempo, valor))
+        somas[0] += tempo
+        somas[1] += valor
+        somas[2] += tempo * tempo
+        somas[3] += tempo * valor
+        while janela and tempo - janela[0][0] >= self.janela:
+            t_antigo, v_antigo = janela.popleft()
+            somas[0] -= t_antigo
+            somas[1] -= v_antigo
+            somas[2] -= t_antigo * t_antigo
+            somas[3] -= t_antigo * v_antigo
+        self._inicial.setdefault(tp, valor)
+        self._maximo[tp] = max(self._maximo.get(tp, valor), valor)
+
+    def inclinacao(self, tp):
+        """Retorna a inclinação atual (°C/min) do termopar, ou None se a janela não tiver pontos suficientes."""
+        janela = self._janelas.get(tp)
+        if not janela or len(janela) < 3:
+            return None
+        n = len(janela)
+        sx, sy, sxx, sxy = self._somas[tp]
+        denominador = n * sxx - sx * sx
+        if denominador <= 0:
+            return None
+        return (n * sxy - sx * sy) / denominador * 60.0
+
+    def __call__(self, medicao):
+        # Consome apenas as amostras novas desde a última chamada
+        novas = range(self._amostras_vistas, len(medicao.tempos))
+        for i in novas:
+            tempo = medicao.tempos[i]
+            for tp, serie in medicao.series.items():
+                valor = serie[i]
+                if not math.isnan(valor):
+                    self._adicionar(tp, tempo, valor)
+        self._amostras_vistas = len(medicao.tempos)
+
+        if self.plato_detectado or not self._janelas or not len(medicao.tempos):
+            return self.plato_detectado and self.encerrar
+        tempo_atual = medicao.tempos[-1]
+        if tempo_atual < self.tempo_minimo:
+            return False
+
+        # Canais obsoletos (última amostra NaN) não são julgados pela inclinação congelada da última janela
+        ativos = [tp for tp in self._janelas if not math.isnan(medicao.series[tp][-1])]
+        for tp in self._janelas.keys() - set(ativos):
+            self.inclinacoes[tp] = None
+        if not ativos:
+            return False
+
+        for tp in ativos:
+            inclinacao = self.inclinacao(tp)
+            self.inclinacoes[tp] = inclinacao
+            janela = self._janelas[tp]
+            if inclinacao is None or janela[-1][0] - janela[0][0] < self.janela - 1:
+                return False
+            if self._maximo[tp] - self._inicial[tp] < self.elevacao_minima:
+                return False
+            if abs(inclinacao) > self.inclinacao_maxima:
+                return False
+
+        self.plato_detectado = True
+        self.tempo_plato = tempo_atual
+        self.logger.info(f"Plateau detected at {tempo_atual}s (slopes: {self.inclinacoes})")
+        return self.encerrar
+
 
 class Medicao:
-    def __init__(self, temperature_logger, codigos_amostras, tempos_registro, tempo_total, nome_modo):
+    """
+    Motor de medição compartilhado pela interface gráfica e pela linha de comando.
+
+    A cada segundo (tick) lê as temperaturas do logger, guarda a série completa em
+    `dados` (lista de tuplas (tempo, dicionário)) e em arrays numéricos por termopar,
+    notifica os consumidores registrados e avalia as condições de parada.
+    """
+
+    def __init__(self, temperature_logger, codigos_amostras, tempos_registro=None, tempo_total=30,
+                 nome_modo="Real", condicoes_parada=None, intervalo_tick=1, relogio=time.monotonic,
+                 dormir=time.sleep):
         self.temp_logger = temperature_logger
         self.codigos_amostras = codigos_amostras
-        self.tempos_registro = tempos_registro
         self.tempo_total = tempo_total
+        self.tempos_registro = set(tempos_registro) if tempos_registro is not None else \
+            set(calcular_tempos_registro(tempo_total, INTERVALOS_REGISTRO["30 segundos"]))
         self.nome_modo = nome_modo
+        self.condicoes_parada = list(condicoes_parada or [])
+        self.intervalo_tick = intervalo_tick
+        self.relogio = relogio
+        self.dormir = dormir
+        self.logger = logging.getLogger("measurement")
+
+        self.interrompido = False
+        self.motivo_parada = None
+        self.inicio = None
+        self.temperaturas = {}
+        self.saude_canais = {}
+        self.callbacks_tick = []
+        self._lock = threading.Lock()
+
+        # Saídas da medição
+        self.dados = []  # Lista de tuplas (tempo, dicionário de temperaturas filtradas)
+        self.dados_brutos = []  # Mesma estrutura, com as leituras antes do filtro
+        self.registros = []  # Apenas os pontos da grade de registro
+        self.tempos = array('d')
+        self.series = {tp: array('d') for tp in codigos_amostras}
+        self.series_brutas = {tp: array('d') for tp in codigos_amostras}
+
+    def adicionar_callback_tick(self, callback):
+        """Registra uma função chamada a cada tick com (tempo, temperaturas)."""
+        self.callbacks_tick.append(callback)
+
+    def adicionar_condicao_parada(self, condicao):
+        """Registra uma condição de parada: função que recebe a medição e retorna True para encerrar."""
+        self.condicoes_parada.append(condicao)
 
     def obter_temperaturas(self):
         # Retrieve temperatures from the temperature logger
         return self.temp_logger.get_temperaturas()
 
+    def obter_saude(self):
+        """Retorna o resumo de saúde dos canais fornecido pelo logger, se disponível."""
+        if hasattr(self.temp_logger, 'get_saude'):
+            return self.temp_logger.get_saude()
+        return {}
+
+    def obter_temperaturas_brutas(self):
+        # Loggers without a filter stage only provide one set of values
+        if hasattr(self.temp_logger, 'get_temperaturas_brutas'):
+            return self.temp_logger.get_temperaturas_brutas()
+        return self.temp_logger.get_temperaturas()
+
+    def obter_series(self, brutas=False):
+        """Retorna cópias dos arrays numéricos de tempo e temperaturas (filtradas ou brutas) por termopar."""
+        series = self.series_brutas if brutas else self.series
+        with self._lock:
+            return array('d', self.tempos), {tp: array('d', serie) for tp, serie in series.items()}
+
+    def _registrar_tick(self, tempo, temperaturas, temperaturas_brutas=None):
+        """Armazena uma amostra e notifica os consumidores."""
+        if temperaturas_brutas is None:
+            temperaturas_brutas = temperaturas
+        with self._lock:
+            self.dados.append((tempo, temperaturas.copy()))
+            self.dados_brutos.append((tempo, temperaturas_brutas.copy()))
+            self.tempos.append(tempo)
+            for tp, serie in self.series.items():
+                serie.append(para_float(temperaturas.get(tp)))
+            for tp, serie in self.series_brutas.items():
+                serie.append(para_float(temperaturas_brutas.get(tp)))
+
+        if tempo in self.tempos_registro:
+            self.logger.debug(f"Logging data at time {tempo}: {temperaturas}")
+            self.registros.append((tempo, temperaturas.copy()))
+
+        for callback in self.callbacks_tick:
+            try:
+                callback(tempo, temperaturas)
+            except Exception as e:
+                self.logger.error(f"Error in tick callback: {e}", exc_info=True)
+
+    def _verificar_condicoes_parada(self):
+        """Retorna o motivo de parada se alguma condição for atendida."""
+        for condicao in self.condicoes_parada:
+            if condicao(self):
+                return getattr(condicao, "motivo", getattr(condicao, "__name__", "condicao_parada"))
+        return None
+
     def run(self):
-        """Executes the measurement process."""
-        self.inicio = time.time()
-        tempos_registrados = set()
+        """Executes the measurement process and returns the collected data."""
+        self.inicio = self.relogio()
+        ultimo_tick = -1
+
+        while not self.interrompido:
+            tempo_atual = int((self.relogio() - self.inicio) // self.intervalo_tick * self.intervalo_tick)
 
-        while not self.interrompido and (time.time() - self.inicio) <= self.tempo_total:
-            tempo_decorrido = time.time() - self.inicio
-            tempo_atual = int(tempo_decorrido)
+            if tempo_atual != ultimo_tick:
+                ultimo_tick = tempo_atual
+                self.temperaturas = self.obter_temperaturas()
+                self._registrar_tick(tempo_atual, self.temperaturas, self.obter_temperaturas_brutas())
 
-            # Get current temperatures
-            self.temperaturas = self.temp_logger.get_temperaturas()
+                if tempo_atual >= self.tempo_total:
+                    self.motivo_parada = "tempo_total"
+                    break
 
-            # Log data at specified times
-            if tempo_atual in self.tempos_registro and tempo_atual not in tempos_registrados:
-                self.logger.debug(f"Logging data at time {tempo_atual}: {self.temperaturas}")
-                self.dados.append((tempo_atual, self.temperaturas.copy()))
-                tempos_registrados.add(tempo_atual)
+                motivo = self._verificar_condicoes_parada()
+                if motivo:
+                    self.motivo_parada = motivo
+                    self.logger.info(f"Measurement stopped early at {tempo_atual}s: {motivo}")
+                    break
 
             # Small pause
-            time.sleep(0.1)
+            self.dormir(0.1)
+
+        if self.interrompido and self.motivo_parada is None:
+            self.motivo_parada = "interrompido"
+        # Keep the channel health with the run
+        self.saude_canais = self.obter_saude()
+        return self.dados
 
     def parar(self):
         """Stops the measurement process."""
-        self.interrompido = True
+        if self.motivo_parada is None:  # Still running (or not started yet)
+            self.interrompido = True
+            self.logger.info("Measurement interrupted by user.")
         self.temp_logger.parar()
-        self.logger.info("Measurement interrupted by user.")
+
+    def calcular_delta_t(self, termopares=None):
+        """Calcula o Delta T médio (último - primeiro valor válido) dos termopares informados."""
+        delta_ts = []
+        with self._lock:
+            for tp in termopares or self.series.keys():
+                validos = [t for t in self.series.get(tp, ()) if not math.isnan(t)]
+                if validos:
+                    delta_ts.append(validos[-1] - validos[0])
+        if delta_ts:
+            return round(sum(delta_ts) / len(delta_ts), 2)
+        return 0.0
@@ -0,0 +1,98 @@
+# protocol_drivers.py
+
+import re
+import logging
+from abc import ABC, abstractmethod
+
+# Registro dos drivers disponíveis (nome -> classe)
+DRIVERS = {}
+
+# Mapeamento padrão dos canais do termômetro para os termopares
+CANAL_PARA_TERMOPAR_PADRAO = {"41": "T1", "42": "T2", "43": "T3", "44": "T4"}
+
+
+def registrar_driver(classe):
+    """Decorador que registra um driver de protocolo pelo seu atributo `nome`."""
+    if getattr(classe, "__abstractmethods__", None):
+        raise TypeError(f"Driver '{classe.__name__}' não implementa: {', '.join(sorted(classe.__abstractmethods__))}")
+    if not classe.nome:
+        raise TypeError(f"Driver '{classe.__name__}' precisa definir o atributo `nome`")
+    DRIVERS[classe.nome] = classe
+    return classe
+
+
+def obter_driver(nome, canal_para_termopar=None):
+    """Cria uma instância do driver registrado com o nome informado."""
+    try:
+        classe = DRIVERS[nome]
+    except KeyError:
+        raise ValueError(f"Protocolo '{nome}' não suportado. Disponíveis: {', '.join(sorted(DRIVERS))}")
+    return classe(canal_para_termopar if canal_para_termopar is not None else CANAL_PARA_TERMOPAR_PADRAO)
+
+
+class DriverProtocolo(ABC):
+    """
+    Interface para os protocolos de instrumentos.
+
+    Um driver recebe os bytes lidos do dispositivo e devolve as temperaturas por termopar.
+    A thread de leitura só conhece esta interface, então novos registradores (outro
+    enquadramento, protocolos binários, maior resolução) são adicionados com um novo
+    driver registrado com `@registrar_driver`, sem alterar o laço de aquisição.
+    """
+
+    nome = None
+
+    def __init__(self, canal_para_termopar):
+        self.canal_para_termopar = canal_para_termopar
+        self.logger = logging.getLogger("protocol_drivers")
+
+    @abstractmethod
+    def decodificar(self, dados_brutos, erros=None):
+        """
+        Decodifica um bloco de dados do dispositivo.
+        Retorna {termopar: temperatura em °C (float)} ou None se nada foi extraído; se `erros` for uma
+        lista, recebe o termopar de cada leitura malformada que pôde ser identificada.
+        """
+
+
+@registrar_driver
+class DriverTermometroASCII(DriverProtocolo):
+    """
+    Termômetro atual: números ASCII de 14 dígitos, canal nos dois primeiros dígitos e
+    temperatura nos `digitos_temperatura` últimos, com `casas_decimais` casas implícitas.
+
+    A decodificação é feita diretamente sobre os bytes recebidos e devolve floats, sem
+    passar por strings formatadas; a formatação fica a cargo da camada de exibição.
+    """
+
+    nome = "termometro_ascii_14"
+
+    PADRAO = re.compile(rb'\d{10,14}')
+    TAMANHO_QUADRO = 14
+
+    def __init__(self, canal_para_termopar, digitos_temperatura=3, casas_decimais=1):
+        super().__init__(canal_para_termopar)
+        self.digitos_temperatura = digitos_temperatura
+        self.escala = 10 ** casas_decimais
+        # Chaves em bytes para evitar decodificar o canal a cada leitura
+        self._termopar_por_canal = {canal.encode('ascii'): tp for canal, tp in canal_para_termopar.items()}
+
+    def decodificar(self, dados_brutos, erros=None):
+        if isinstance(dados_brutos, str):
+            dados_brutos = dados_brutos.encode('ascii', errors='ignore')
+
+        termopares_novos = {}
+        termopar_por_canal = self._termopar_por_canal
+        for match in self.PADRAO.findall(dados_brutos):
+            termopar = termopar_por_canal.get(match[:2])
+            if len(match) != self.TAMANHO_QUADRO:
+                if erros is not None and termopar is not None:
+                    erros.append(termopar)
+                continue
+            if termopar is not None:
+                # int() aceita bytes de dígitos ASCII diretamente
+                termopares_novos[termopar] = int(match[-self.digitos_temperatura:]) / self.escala
+
+        if not termopares_novos:
+            self.logger.debug("Nenhum valor de temperatura extraído dos dados.")
+        return termopares_novos if termopares_novos else None
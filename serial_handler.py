@@ -2,14 +2,16 @@
 
 import serial
 import logging
+from protocol_drivers import DriverTermometroASCII
 
 class ManipuladorPortaSerial:
     """Gerencia a conexão serial com o dispositivo termômetro."""
 
-    def __init__(self, porta_com, taxa_baud=9600):
-        """Inicializa o manipulador com a porta e taxa de baud especificadas."""
+    def __init__(self, porta_com, taxa_baud=9600, protocolo=DriverTermometroASCII.nome):
+        """Inicializa o manipulador com a porta, taxa de baud e protocolo (driver) do dispositivo."""
         self.porta_com = porta_com
         self.taxa_baud = taxa_baud
+        self.protocolo = protocolo
         self.ser = None
         self.logger = logging.getLogger("serial_handler")
 
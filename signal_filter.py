@@ -0,0 +1,124 @@
+# signal_filter.py
+
+import bisect
+import logging
+import math
+import time
+from collections import deque
+
+
+class FiltroCanal:
+    """
+    Filtro em tempo real para um único canal de temperatura.
+
+    Cada amostra passa, em ordem, por: limites absolutos (faixa válida), limite de taxa
+    de variação (°C/s) em relação ao último valor aceito, mediana móvel e suavização
+    exponencial. O custo por amostra depende apenas do tamanho da janela, não do
+    comprimento da série.
+    """
+
+    def __init__(self, janela_mediana=3, alfa=1.0, limite_minimo=None, limite_maximo=None,
+                 taxa_maxima=None, max_rejeicoes_consecutivas=3):
+        if janela_mediana < 1:
+            raise ValueError("janela_mediana deve ser >= 1")
+        if not 0 < alfa <= 1:
+            raise ValueError("alfa deve estar no intervalo (0, 1]")
+        self.janela_mediana = janela_mediana
+        self.alfa = alfa
+        self.limite_minimo = limite_minimo
+        self.limite_maximo = limite_maximo
+        self.taxa_maxima = taxa_maxima
+        self.max_rejeicoes_consecutivas = max_rejeicoes_consecutivas
+        self.resetar()
+
+    def resetar(self):
+        """Descarta o histórico do canal."""
+        self._janela = deque()
+        self._ordenados = []
+        self._ultimo_aceito = None
+        self._tempo_ultimo_aceito = None
+        self._rejeicoes_consecutivas = 0
+        self.valor = None  # Último valor filtrado
+        self.rejeitadas = 0
+
+    def _rejeitar(self, valor, motivo):
+        self.rejeitadas += 1
+        self._rejeicoes_consecutivas += 1
+        logging.getLogger("signal_filter").debug(f"Amostra {valor} rejeitada ({motivo}).")
+        return None
+
+    def filtrar(self, valor, tempo=None):
+        """
+        Processa uma amostra bruta. Retorna o valor filtrado ou None se a amostra foi rejeitada
+        (nesse caso `valor` continua com o último valor filtrado).
+        """
+        if valor is None or math.isnan(valor):
+            return None
+        if tempo is None:
+            tempo = time.monotonic()
+
+        if self.limite_minimo is not None and valor < self.limite_minimo:
+            return self._rejeitar(valor, "abaixo do limite")
+        if self.limite_maximo is not None and valor > self.limite_maximo:
+            return self._rejeitar(valor, "acima do limite")
+
+        # Um degrau real persiste: após várias rejeições seguidas o novo nível é aceito
+        if (self.taxa_maxima is not None and self._ultimo_aceito is not None
+                and self._rejeicoes_consecutivas < self.max_rejeicoes_consecutivas):
+            dt = max(tempo - self._tempo_ultimo_aceito, 1e-3)
+            if abs(valor - self._ultimo_aceito) / dt > self.taxa_maxima:
+                return self._rejeitar(valor, "taxa de variação")
+
+        self._ultimo_aceito = valor
+        self._tempo_ultimo_aceito = tempo
+        self._rejeicoes_consecutivas = 0
+
+        # Mediana móvel (janela ordenada mantida incrementalmente)
+        self._janela.append(valor)
+        bisect.insort(self._ordenados, valor)
+        if len(self._janela) > self.janela_mediana:
+            antigo = self._janela.popleft()
+            del self._ordenados[bisect.bisect_left(self._ordenados, antigo)]
+        n = len(self._ordenados)
+        if n % 2:
+            mediana = self._ordenados[n // 2]
+        else:
+            mediana = (self._ordenados[n // 2 - 1] + self._ordenados[n // 2]) / 2.0
+
+        # Suavização exponencial
+        if self.valor is None or self.alfa >= 1.0:
+            self.valor = mediana
+        else:
+            self.valor += self.alfa * (mediana - self.valor)
+        return self.valor
+
+
+class FiltroTemperaturas:
+    """Aplica um `FiltroCanal` independente a cada termopar, com a mesma configuração."""
+
+    def __init__(self, **configuracao):
+        self.configuracao = configuracao
+        self.canais = {}
+
+    def filtrar(self, termopar, valor, tempo=None):
+        """Filtra uma amostra do termopar; retorna o último valor filtrado (ou None se ainda não houver)."""
+        canal = self.canais.get(termopar)
+        if canal is None:
+            canal = self.canais[termopar] = FiltroCanal(**self.configuracao)
+        canal.filtrar(valor, tempo)
+        return canal.valor
+
+    def resetar(self):
+        """Descarta o histórico de todos os canais."""
+        for canal in self.canais.values():
+            canal.resetar()
+
+    def rejeitadas(self):
+        """Retorna o número de amostras rejeitadas por termopar."""
+        return {tp: canal.rejeitadas for tp, canal in self.canais.items()}
+
+
+def criar_filtro_padrao():
+    """Configuração padrão usada na aquisição: mediana de 3 amostras, faixa física e limite de taxa."""
+    return FiltroTemperaturas(janela_mediana=3, alfa=1.0, limite_minimo=-20.0, limite_maximo=150.0,
+                              taxa_maxima=20.0)
@@ -0,0 +1,216 @@
+# startup_profiler.py
+
+import builtins
+import json
+import logging
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from lazy_imports import relatorio_importacoes
+
+logger = logging.getLogger("startup_profiler")
+
+# Variável de ambiente e opção de linha de comando que ativam o perfil de inicialização
+VARIAVEL_AMBIENTE = "REACTLAB_PROFILE"
+OPCAO_LINHA_COMANDO = "--profile-startup"
+
+
+def memoria_rss():
+    """Retorna a memória residente (RSS) do processo em bytes, ou None se não for possível medir."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    if sys.platform.startswith("win"):
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        contadores = PROCESS_MEMORY_COUNTERS()
+        contadores.cb = ctypes.sizeof(contadores)
+        processo = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(processo, ctypes.byref(contadores), contadores.cb):
+            return contadores.WorkingSetSize
+        return None
+
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _em_mb(valor):
+    return round(valor / (1024 * 1024), 1) if valor is not None else None
+
+
+class PerfilInicializacao:
+    """
+    Mede a inicialização da aplicação: tempo de parede, tempo gasto em importações e memória
+    residente de cada fase, além de eventos pontuais (primeira pintura, primeira medição).
+
+    Quando inativo, `fase()` e `marcar()` não medem nada, de modo que as chamadas podem ficar
+    no código sem custo. O relatório JSON é regravado a cada evento para servir de base de
+    comparação entre versões.
+    """
+
+    def __init__(self, caminho_relatorio=None, relogio=time.perf_counter):
+        self.ativo = caminho_relatorio is not None
+        self.caminho_relatorio = caminho_relatorio
+        self.relogio = relogio
+        self.inicio = relogio()
+        self.fases = []
+        self.eventos = {}
+        self._lock = threading.Lock()
+        self._profundidade_importacao = threading.local()  # importações aninhadas, por thread
+        self._tempo_importacao = 0.0
+        self._importar_original = None
+        self._importar_medido = None
+        if self.ativo:
+            self._instalar_medidor_importacoes()
+
+    def _instalar_medidor_importacoes(self):
+        """Envolve __import__ para acumular o tempo das importações de primeiro nível."""
+        importar_original = self._importar_original = builtins.__import__
+        profundidade = self._profundidade_importacao
+        perfil = self
+
+        def importar_medido(nome, *args, **kwargs):
+            nivel = getattr(profundidade, "nivel", 0)
+            profundidade.nivel = nivel + 1
+            if nivel or nome in sys.modules:
+                try:
+                    return importar_original(nome, *args, **kwargs)
+                finally:
+                    profundidade.nivel = nivel
+
+            inicio = time.perf_counter()
+            try:
+                return importar_original(nome, *args, **kwargs)
+            finally:
+                duracao = time.perf_counter() - inicio
+                with perfil._lock:
+                    perfil._tempo_importacao += duracao
+                profundidade.nivel = nivel
+
+        self._importar_medido = builtins.__import__ = importar_medido
+
+    def desinstalar(self):
+        """Restaura o __import__ original, se nenhum outro código o tiver substituído depois."""
+        if self._importar_original is not None and builtins.__import__ is self._importar_medido:
+            builtins.__import__ = self._importar_original
+            self._importar_original = None
+            self._importar_medido = None
+
+    def registrar_fase(self, nome, duracao, tempo_importacao=0.0, rss_antes=None, rss_depois=None, modulos=0):
+        """Registra uma fase medida externamente (ex.: importações feitas antes da criação do perfil)."""
+        if not self.ativo:
+            return
+        with self._lock:
+            self.fases.append({
+                "fase": nome,
+                "duracao_ms": round(duracao * 1000, 1),
+                "importacoes_ms": round(tempo_importacao * 1000, 1),
+                "modulos_importados": modulos,
+                "rss_antes_mb": _em_mb(rss_antes),
+                "rss_depois_mb": _em_mb(rss_depois),
+            })
+
+    def iniciar_fase(self, nome):
+        """Inicia a medição de uma fase; retorna o marcador a ser passado para `encerrar_fase`."""
+        if not self.ativo:
+            return None
+        return nome, self.relogio(), self._tempo_importacao, len(sys.modules), memoria_rss()
+
+    def encerrar_fase(self, marcador):
+        """Encerra a fase iniciada com `iniciar_fase` e a registra no relatório."""
+        if marcador is None:
+            return
+        nome, inicio, importacao_antes, modulos_antes, rss_antes = marcador
+        self.registrar_fase(nome, self.relogio() - inicio, self._tempo_importacao - importacao_antes,
+                            rss_antes, memoria_rss(), len(sys.modules) - modulos_antes)
+
+    @contextmanager
+    def fase(self, nome):
+        """Mede o bloco como uma fase da inicialização."""
+        marcador = self.iniciar_fase(nome)
+        try:
+            yield
+        finally:
+            self.encerrar_fase(marcador)
+
+    def marcar(self, evento, inicio_evento=None):
+        """
+        Registra um evento (tempo desde o início do processo e RSS) e grava o relatório.
+        Com `inicio_evento` (valor do relógio) também registra a duração desde esse instante.
+        """
+        if not self.ativo or evento in self.eventos:
+            return
+        agora = self.relogio()
+        registro = {"desde_inicio_ms": round((agora - self.inicio) * 1000, 1), "rss_mb": _em_mb(memoria_rss())}
+        if inicio_evento is not None:
+            registro["duracao_ms"] = round((agora - inicio_evento) * 1000, 1)
+        with self._lock:
+            self.eventos[evento] = registro
+        logger.info(f"Startup profile: {evento} {registro}")
+        self.salvar()
+
+    def relatorio(self):
+        """Retorna o relatório como dicionário serializável."""
+        with self._lock:
+            return {
+                "gerado_em": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "fases": list(self.fases),
+                "eventos": dict(self.eventos),
+                "importacoes_ms": round(self._tempo_importacao * 1000, 1),
+                "importacoes_tardias_ms": relatorio_importacoes(),
+                "rss_atual_mb": _em_mb(memoria_rss()),
+            }
+
+    def salvar(self):
+        """Grava o relatório JSON em `caminho_relatorio`."""
+        if not self.ativo:
+            return
+        try:
+            pasta = os.path.dirname(os.path.abspath(self.caminho_relatorio))
+            os.makedirs(pasta, exist_ok=True)
+            with open(self.caminho_relatorio, "w", encoding="utf-8") as f:
+                json.dump(self.relatorio(), f, indent=2, ensure_ascii=False)
+        except OSError as e:
+            logger.error(f"Could not write startup profile to {self.caminho_relatorio}: {e}")
+
+
+def criar_perfil_inicializacao(argv=None, caminho_padrao="startup_profile.json"):
+    """
+    Cria o perfil a partir da linha de comando (`--profile-startup` ou `--profile-startup=caminho`)
+    ou da variável de ambiente REACTLAB_PROFILE (`1` ou um caminho). Sem nenhum dos dois, o perfil
+    fica inativo.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    caminho = None
+    for argumento in argv:
+        if argumento == OPCAO_LINHA_COMANDO:
+            caminho = caminho_padrao
+        elif argumento.startswith(OPCAO_LINHA_COMANDO + "="):
+            caminho = argumento.split("=", 1)[1] or caminho_padrao
+
+    if caminho is None:
+        valor = os.environ.get(VARIAVEL_AMBIENTE, "").strip()
+        if valor and valor.lower() not in ("0", "false", "no"):
+            caminho = caminho_padrao if valor.lower() in ("1", "true", "yes") else valor
+
+    return PerfilInicializacao(caminho)
@@ -4,12 +4,15 @@ import logging
 import threading
 import time
 import random  # For temperature simulation
-from utils import extrair_temperaturas
+from protocol_drivers import obter_driver, DriverTermometroASCII
+from signal_filter import criar_filtro_padrao
+from channel_health import MonitorSaudeCanais
 
 class SimulatedTemperatureLogger:
     def __init__(self, termopares_ativos):
         self.termopares_ativos = termopares_ativos
         self.temperaturas = {tp: 25.0 for tp in termopares_ativos}  # Start at 25°C
+        self.saude = MonitorSaudeCanais(termopares_ativos)
         self.running = False
 
     def start(self):
@@ -29,6 +32,7 @@ class SimulatedTemperatureLogger:
                 else:
                     # Optionally, keep the temperature stable or simulate cooling
                     pass  # Do nothing if max temp is reached
+                self.saude.registrar_leitura(tp)
             time.sleep(1)  # Update every second
 
     def parar(self):
@@ -37,18 +41,36 @@ class SimulatedTemperatureLogger:
     def get_temperaturas(self):
         return self.temperaturas.copy()
 
+    def get_temperaturas_brutas(self):
+        # Simulated values are not filtered
+        return self.temperaturas.copy()
+
+    def get_saude(self):
+        return self.saude.resumo()
+
 class TemperatureLogger(threading.Thread):
     """Thread that continuously reads temperatures and stores them internally."""
 
-    def __init__(self, manipulador_serial, termopares_ativos, canal_para_termopar):
-        """Initializes the thread with the serial handler, active thermocouples, and channel mapping."""
+    def __init__(self, manipulador_serial, termopares_ativos, canal_para_termopar, filtro=None, driver=None):
+        """
+        Initializes the thread with the serial handler, active thermocouples, and channel mapping.
+        `filtro` is a FiltroTemperaturas applied to each reading; the default filter is used when None.
+        `driver` decodes the device protocol; by default it is chosen from the serial handler's `protocolo`.
+        """
         super().__init__()
         self.manipulador_serial = manipulador_serial
         self.running = True
         self.logger = logging.getLogger("temperature_logger")
         self.termopares_ativos = termopares_ativos
         self.canal_para_termopar = canal_para_termopar
-        self.temperaturas = {tp: 'OFF' for tp in termopares_ativos}
+        if driver is None:
+            protocolo = getattr(manipulador_serial, 'protocolo', DriverTermometroASCII.nome)
+            driver = obter_driver(protocolo, canal_para_termopar)
+        self.driver = driver
+        self.filtro = filtro if filtro is not None else criar_filtro_padrao()
+        self.temperaturas = {tp: 'OFF' for tp in termopares_ativos}  # Filtered values
+        self.temperaturas_brutas = {tp: 'OFF' for tp in termopares_ativos}  # Raw values from the device
+        self.saude = MonitorSaudeCanais(termopares_ativos)
 
     def run(self):
         """Executed when starting the thread."""
@@ -56,18 +78,25 @@ class TemperatureLogger(threading.Thread):
             try:
                 dados_brutos = self.manipulador_serial.ler_dados()
                 if dados_brutos:
-                    dados_decodificados = dados_brutos.decode('utf-8', errors='ignore').strip()
-                    self.logger.debug(f"Dados brutos recebidos: {dados_decodificados}")
+                    self.logger.debug(f"Dados brutos recebidos: {dados_brutos!r}")
 
-                    temperaturas = extrair_temperaturas(dados_decodificados, self.canal_para_termopar)
+                    erros = []
+                    temperaturas = self.driver.decodificar(dados_brutos, erros)
+                    self.saude.registrar_quadro(valido=bool(temperaturas))
+                    for termopar in erros:
+                        self.saude.registrar_erro(termopar)
                     if temperaturas:
+                        agora = time.monotonic()
                         # Updates only the active thermocouples
                         for termopar in self.termopares_ativos:
                             if termopar in temperaturas:
-                                temp_value = temperaturas[termopar]
-                                # Extract numerical value from temperature string
-                                temp_num = float(temp_value.split()[0])
-                                self.temperaturas[termopar] = temp_num
+                                # The driver already returns numeric values in °C
+                                temp_num = temperaturas[termopar]
+                                self.saude.registrar_leitura(termopar)
+                                self.temperaturas_brutas[termopar] = temp_num
+                                temp_filtrada = self.filtro.filtrar(termopar, temp_num, agora)
+                                if temp_filtrada is not None:
+                                    self.temperaturas[termopar] = temp_filtrada
                 else:
                     self.logger.debug("Nenhum dado recebido. Tentando novamente...")
                     time.sleep(0.1)  # Small pause to avoid excessive CPU usage
@@ -82,5 +111,18 @@ class TemperatureLogger(threading.Thread):
         self.logger.info("Thread de leitura de temperatura parada.")
 
     def get_temperaturas(self):
-        """Returns a copy of the current temperatures."""
-        return self.temperaturas.copy()
+        """
+        Returns a copy of the current (filtered) temperatures.
+        Channels that stopped reporting are returned as 'OFF' instead of their last value.
+        """
+        agora = time.time()
+        return {tp: ('OFF' if self.saude.esta_obsoleto(tp, agora) else temp)
+                for tp, temp in self.temperaturas.items()}
+
+    def get_temperaturas_brutas(self):
+        """Returns a copy of the last raw temperatures, before filtering."""
+        return self.temperaturas_brutas.copy()
+
+    def get_saude(self):
+        """Returns the health summary (last seen, frame rate, error rate, stale flag) of each channel."""
+        return self.saude.resumo()
@@ -1,15 +1,26 @@
 # utils.py
 
-import re
-import logging
-from rich.console import Console
-from rich.table import Table
+# O rich só é usado pela linha de comando; é importado no primeiro uso para não pesar na
+# inicialização da interface gráfica, que usa apenas as funções de formatação deste módulo.
+_console = None
 
-console = Console()
+def _obter_console():
+    """Cria o console do rich na primeira utilização."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+def __getattr__(nome):
+    # Mantém `from utils import console` funcionando sem importar o rich antecipadamente
+    if nome == "console":
+        return _obter_console()
+    raise AttributeError(f"module 'utils' has no attribute '{nome}'")
 
 def limpar_tela():
     """Limpa o console."""
-    console.clear()
+    _obter_console().clear()
 
 def formatar_tempo(segundos):
     """Formata o tempo em minutos e segundos."""
@@ -17,6 +28,12 @@ def formatar_tempo(segundos):
     segundos_restantes = int(segundos % 60)
     return f"{minutos}:{segundos_restantes:02d}"
 
+def formatar_temperatura(temperatura, casas_decimais=1):
+    """Formata uma temperatura numérica para exibição; valores não numéricos (ex.: 'OFF') são mantidos."""
+    if isinstance(temperatura, (int, float)):
+        return f"{temperatura:.{casas_decimais}f} °C"
+    return str(temperatura)
+
 def exibir_cabecalho():
     """Retorna o cabeçalho estilizado para exibição no console."""
     header = """
@@ -33,6 +50,8 @@ def exibir_cabecalho():
 
 def criar_tabela_temperaturas(temperaturas, codigos_amostras):
     """Cria uma tabela para exibição das temperaturas dos termopares."""
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold blue")
     table.add_column("Termopar", justify="center", style="white")
     table.add_column("Temperatura", justify="center", style="white")
@@ -40,33 +59,10 @@ def criar_tabela_temperaturas(temperaturas, codigos_amostras):
 
     for termopar, temp in temperaturas.items():
         codigo_amostra = codigos_amostras.get(termopar, "N/A")
+        temp_texto = formatar_temperatura(temp)
         if temp != 'OFF':
-            table.add_row(f"[green]{termopar}[/green]", f"[green]{temp}[/green]", f"[green]{codigo_amostra}[/green]")
+            table.add_row(f"[green]{termopar}[/green]", f"[green]{temp_texto}[/green]", f"[green]{codigo_amostra}[/green]")
         else:
-            table.add_row(f"[red]{termopar}[/red]", f"[red]{temp}[/red]", f"[red]{codigo_amostra}[/red]")
+            table.add_row(f"[red]{termopar}[/red]", f"[red]{temp_texto}[/red]", f"[red]{codigo_amostra}[/red]")
 
     return table
-
-def extrair_temperaturas(dados, canal_para_termopar):
-    """Extrai as temperaturas dos dados brutos lidos."""
-    termopares_novos = {}
-    matches = re.findall(r'(\d{10,14})', dados)
-    logger = logging.getLogger("utils")
-    for match in matches:
-        if len(match) == 14:
-            canal = match[:2]
-            temperatura_bruta = match[-3:]
-            try:
-                temperatura = int(temperatura_bruta[:-1]) + (int(temperatura_bruta[-1]) / 10.0)
-                temperatura_formatada = f"{temperatura:.1f} °C"
-            except ValueError:
-                logger.warning(f"Erro ao converter temperatura bruta '{temperatura_bruta}' para canal '{canal}'")
-                continue
-
-            if canal in canal_para_termopar:
-                termopar = canal_para_termopar[canal]
-                termopares_novos[termopar] = temperatura_formatada
-
-    if not termopares_novos:
-        logger.debug("Nenhum valor de temperatura extraído dos dados.")
-    return termopares_novos if termopares_novos else None